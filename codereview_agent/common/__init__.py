@@ -6,7 +6,10 @@ from codereview_agent.common.exception.custom_internal_server_exception import (
 from codereview_agent.common.exception.error_codes import ErrorCode
 from codereview_agent.common.exception.exception_handlers import register_exception_handlers
 from codereview_agent.common.exception.exceptions import ErrorCodeException
-from codereview_agent.common.messages import REMOTE_REVIEW_FAILURE_MESSAGE
+from codereview_agent.common.messages import (
+    DEGRADED_REVIEW_MESSAGE,
+    REMOTE_REVIEW_FAILURE_MESSAGE,
+)
 from codereview_agent.common.response import (
     ApiErrorDetail,
     ApiErrorResponse,
@@ -6,4 +6,8 @@ REMOTE_REVIEW_FAILURE_MESSAGE = (
     "Claude API 호출에 실패했습니다. 잠시 후 다시 시도해주세요. "
 )
 
-__all__ = ["REMOTE_REVIEW_FAILURE_MESSAGE"]
+DEGRADED_REVIEW_MESSAGE = (
+    "Claude 응답이 지연되어 내부 휴리스틱 결과를 먼저 제공합니다. (사유: {reason}) {summary}"
+)
+
+__all__ = ["REMOTE_REVIEW_FAILURE_MESSAGE", "DEGRADED_REVIEW_MESSAGE"]
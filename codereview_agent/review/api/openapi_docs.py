@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.schemas import BatchReviewRequest, ReviewRequest, ReviewUpdateRequest
 
 
 def build_review_request_schema() -> Dict[str, Any]:
@@ -27,9 +27,72 @@ def build_review_request_schema() -> Dict[str, Any]:
                             "language": "python",
                             "style": "bug",
                         },
+                    },
+                    "diff": {
+                        "summary": "변경된 hunk만 리뷰",
+                        "value": {
+                            "diff": "@@ -1,2 +1,2 @@\n print('hello')\n-print('world')\n+print(world)",
+                            "language": "python",
+                            "style": "bug",
+                        },
+                    },
+                },
+            }
+        },
+    }
+
+
+
+def build_batch_review_request_schema() -> Dict[str, Any]:
+    """Return the JSON schema for bulk review requests."""
+
+    schema = BatchReviewRequest.model_json_schema(
+        ref_template="#/components/schemas/{model}"
+    )
+
+    return {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": schema,
+                "examples": {
+                    "changedFiles": {
+                        "summary": "PR 변경 파일 일괄 리뷰",
+                        "value": {
+                            "items": [
+                                {"id": "src/a.js", "code": "if (a == b) {}", "style": "bug"},
+                                {"id": "src/b.js", "code": "console.log(x);", "style": "detail"},
+                            ]
+                        },
                     }
                 },
             }
         },
     }
 
+
+def build_review_update_request_schema() -> Dict[str, Any]:
+    """Return the JSON schema for incremental session updates."""
+
+    schema = ReviewUpdateRequest.model_json_schema(
+        ref_template="#/components/schemas/{model}"
+    )
+
+    return {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": schema,
+                "examples": {
+                    "code": {
+                        "summary": "수정된 전체 코드",
+                        "value": {"code": "print('hello')\nprint('world!')"},
+                    },
+                    "diff": {
+                        "summary": "직전 코드에 대한 unified diff",
+                        "value": {"diff": "@@ -2 +2 @@\n-print('world')\n+print('world!')"},
+                    },
+                },
+            }
+        },
+    }
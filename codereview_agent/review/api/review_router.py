@@ -2,22 +2,45 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional, Type, TypeVar
 
 from fastapi import APIRouter, Request, Response
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 
 from codereview_agent.common.exception.error_codes import ErrorCode
 from codereview_agent.common.exception.exceptions import ErrorCodeException
-from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.config import get_settings
+from codereview_agent.review.schemas import (
+    BatchReviewRequest,
+    ReviewJobRequest,
+    ReviewRequest,
+    ReviewUpdateRequest,
+)
 from codereview_agent.review.service import ReviewService
-from codereview_agent.review.api.openapi_docs import build_review_request_schema
-from codereview_agent.common import ApiSuccessResponse
+from codereview_agent.review.service.job_queue import ReviewJob, build_default_job_queue
+from codereview_agent.review.api.openapi_docs import (
+    build_batch_review_request_schema,
+    build_review_request_schema,
+    build_review_update_request_schema,
+)
+from codereview_agent.common import (
+    ApiErrorDetail,
+    ApiErrorResponse,
+    ApiSuccessResponse,
+    CustomInternalServerException,
+)
 
 router = APIRouter()
 review_service = ReviewService()
+review_jobs = build_default_job_queue(review_service)
+
+DEADLINE_HEADER = "X-Review-Deadline-Ms"
+
+TRequest = TypeVar("TRequest", bound=ReviewRequest)
 
 
 @router.post(
@@ -27,6 +50,143 @@ review_service = ReviewService()
     },
 )
 async def request_code_review(raw_request: Request, response: Response):
+    request = await _read_review_request(raw_request)
+
+    data = await review_service.agenerate_review(
+        request,
+        deadline_ms=_parse_deadline_header(raw_request.headers.get(DEADLINE_HEADER)),
+    )
+    return ApiSuccessResponse(data=data)
+
+
+@router.patch(
+    "/reviews/{session_id}",
+    openapi_extra={
+        "requestBody": build_review_update_request_schema()
+    },
+)
+async def update_code_review(session_id: str, raw_request: Request):
+    update = await _read_update_request(raw_request)
+    data = await review_service.aupdate_review(session_id, code=update.code, diff=update.diff)
+    if data is None:
+        raise ErrorCodeException(
+            ErrorCode.NOT_FOUND,
+            errors=[{"field": "sessionId", "message": f"리뷰 세션을 찾을 수 없습니다: {session_id}"}],
+        )
+    return ApiSuccessResponse(data=data)
+
+
+@router.post(
+    "/reviews/stream",
+    openapi_extra={
+        "requestBody": build_review_request_schema()
+    },
+)
+async def stream_code_review(raw_request: Request):
+    request = await _read_review_request(raw_request)
+
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            async for event, data in review_service.astream_review(request):
+                yield _format_sse(event, data.model_dump(mode="json", by_alias=True))
+        except CustomInternalServerException as exc:
+            error = ApiErrorResponse.from_error_code(
+                exc.code,
+                errors=[ApiErrorDetail(field="general", message=exc.detail or exc.code.message)],
+            )
+            yield _format_sse("error", error.model_dump(mode="json"))
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/reviews/batch",
+    openapi_extra={
+        "requestBody": build_batch_review_request_schema()
+    },
+)
+async def batch_code_review(raw_request: Request):
+    batch = await _read_batch_request(raw_request)
+    items = [(item.id, item) for item in batch.items]
+    deadline_ms = _parse_deadline_header(raw_request.headers.get(DEADLINE_HEADER))
+
+    async def result_lines() -> AsyncIterator[str]:
+        async for item_id, outcome in review_service.abatch_review(items, deadline_ms=deadline_ms):
+            if isinstance(outcome, CustomInternalServerException):
+                body = ApiErrorResponse.from_error_code(
+                    outcome.code,
+                    errors=[ApiErrorDetail(field="general", message=outcome.detail or outcome.code.message)],
+                ).model_dump(mode="json")
+            else:
+                body = ApiSuccessResponse(data=outcome).model_dump(mode="json", by_alias=True)
+            yield json.dumps({"id": item_id, **body}, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(result_lines(), media_type="application/x-ndjson")
+
+
+@router.post(
+    "/review-jobs",
+    status_code=202,
+    openapi_extra={
+        "requestBody": build_review_request_schema()
+    },
+)
+async def submit_review_job(raw_request: Request):
+    request = await _read_review_request(raw_request, ReviewJobRequest)
+    # The job store does blocking SQLite work (and opens the database on first use).
+    job = await asyncio.to_thread(
+        review_jobs.submit,
+        ReviewRequest.model_validate(request.model_dump(exclude={"priority"})),
+        priority=request.priority,
+    )
+    return ApiSuccessResponse(code=202, message="Accepted", data=_job_view(job))
+
+
+@router.get("/review-jobs/{job_id}")
+async def get_review_job(job_id: str, wait: float = 0):
+    max_wait = get_settings().review_jobs_max_wait_seconds
+    if wait > 0:
+        job = await review_jobs.wait(job_id, min(wait, max_wait))
+    else:
+        job = await asyncio.to_thread(review_jobs.get, job_id)
+    return ApiSuccessResponse(data=_job_view(_require_job(job, job_id)))
+
+
+@router.delete("/review-jobs/{job_id}")
+async def cancel_review_job(job_id: str):
+    job = _require_job(await asyncio.to_thread(review_jobs.get, job_id), job_id)
+    if job.done:
+        raise ErrorCodeException(
+            ErrorCode.DUPLICATE_REQUEST,
+            errors=[{"field": "jobId", "message": f"이미 {job.status} 상태인 작업입니다."}],
+        )
+    cancelled = await asyncio.to_thread(review_jobs.cancel, job_id)
+    return ApiSuccessResponse(data=_job_view(cancelled or job))
+
+
+@router.get("/health")
+async def health_check():
+    stats = review_service.stats()
+    upstream = stats.get("upstream") or {}
+    breaker = upstream.get("circuitBreaker") or {}
+    breaker_state = breaker.get("state", "closed")
+    return ApiSuccessResponse(
+        data={
+            "status": "ok" if breaker_state == "closed" else "degraded",
+            "upstream": breaker_state,
+            "metrics": {**stats, "jobs": review_jobs.stats()},
+        }
+    )
+
+
+async def _read_review_request(
+    raw_request: Request,
+    model: Type[TRequest] = ReviewRequest,  # type: ignore[assignment]
+) -> TRequest:
     body_bytes = await raw_request.body()
     if not body_bytes:
         raise ErrorCodeException(
@@ -54,12 +214,98 @@ async def request_code_review(raw_request: Request, response: Response):
         )
 
     try:
-        request = ReviewRequest.model_validate(payload)
+        request = model.model_validate(payload)
     except ValidationError as exc:
         raise RequestValidationError(exc.errors()) from exc
 
-    data = review_service.generate_review(request)
-    return ApiSuccessResponse(data=data)
+    return request
+
+
+async def _read_batch_request(raw_request: Request) -> BatchReviewRequest:
+    body_bytes = await raw_request.body()
+    try:
+        payload = json.loads(body_bytes.decode("utf-8")) if body_bytes else None
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        payload = None
+    if not isinstance(payload, dict):
+        raise ErrorCodeException(
+            ErrorCode.INVALID_ARGUMENT,
+            errors=[{"field": "body", "message": ErrorCode.INVALID_ARGUMENT.message}],
+        )
+
+    try:
+        batch = BatchReviewRequest.model_validate(payload)
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors()) from exc
+
+    max_items = get_settings().review_batch_max_items
+    if max_items > 0 and len(batch.items) > max_items:
+        raise ErrorCodeException(
+            ErrorCode.INVALID_ARGUMENT,
+            errors=[{"field": "items", "message": f"한 번에 최대 {max_items}개까지 요청할 수 있습니다."}],
+        )
+    return batch
+
+
+async def _read_update_request(raw_request: Request) -> ReviewUpdateRequest:
+    body_bytes = await raw_request.body()
+    try:
+        payload = json.loads(body_bytes.decode("utf-8"), strict=False) if body_bytes else None
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        payload = None
+    if not isinstance(payload, dict):
+        raise ErrorCodeException(
+            ErrorCode.INVALID_ARGUMENT,
+            errors=[{"field": "body", "message": ErrorCode.INVALID_ARGUMENT.message}],
+        )
+
+    try:
+        return ReviewUpdateRequest.model_validate(payload)
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors()) from exc
+
+
+def _require_job(job: Optional[ReviewJob], job_id: str) -> ReviewJob:
+    if job is None:
+        raise ErrorCodeException(
+            ErrorCode.NOT_FOUND,
+            errors=[{"field": "jobId", "message": f"작업을 찾을 수 없습니다: {job_id}"}],
+        )
+    return job
+
+
+def _job_view(job: ReviewJob) -> Dict[str, Any]:
+    return {
+        "jobId": job.id,
+        "status": job.status,
+        "priority": job.priority,
+        "createdAt": job.created_at,
+        "updatedAt": job.updated_at,
+        "result": job.result,
+        "error": job.error,
+    }
+
+
+def _format_sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _parse_deadline_header(value: Optional[str]) -> Optional[int]:
+    if value is None or not value.strip():
+        return None
+    try:
+        deadline_ms = int(value.strip())
+    except ValueError as exc:
+        raise ErrorCodeException(
+            ErrorCode.INVALID_ARGUMENT,
+            errors=[{"field": DEADLINE_HEADER, "message": "정수(ms) 값이어야 합니다."}],
+        ) from exc
+    if deadline_ms < 0:
+        raise ErrorCodeException(
+            ErrorCode.INVALID_ARGUMENT,
+            errors=[{"field": DEADLINE_HEADER, "message": "0 이상이어야 합니다."}],
+        )
+    return deadline_ms
 
 
 def _load_payload(text: str) -> Optional[Dict[str, Any]]:
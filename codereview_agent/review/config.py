@@ -15,13 +15,110 @@ class ClaudeSettings:
         self._env = env
 
         self.api_key = self._get("CLAUDE_API_KEY") or self._get("ANTHROPIC_API_KEY")
+        extra_keys = [key.strip() for key in (self._get("CLAUDE_API_KEYS") or "").split(",")]
+        self.api_keys = list(dict.fromkeys(key for key in [self.api_key, *extra_keys] if key))
+        self.key_cooldown_seconds = float(self._get("CLAUDE_KEY_COOLDOWN_SECONDS", default="30"))
+        self.key_auth_cooldown_seconds = float(
+            self._get("CLAUDE_KEY_AUTH_COOLDOWN_SECONDS", default="300")
+        )
         self.base_url = self._get("CLAUDE_API_URL", default="https://api.anthropic.com")
         self.model = self._get("CLAUDE_MODEL", default="claude-3-haiku-20240307")
         self.timeout_seconds = int(self._get("CLAUDE_TIMEOUT_SECONDS", default="30"))
         self.max_attempts = int(self._get("CLAUDE_MAX_ATTEMPTS", default="3"))
         self.retry_delay_seconds = float(self._get("CLAUDE_RETRY_DELAY_SECONDS", default="0.5"))
+        self.retry_max_delay_seconds = float(self._get("CLAUDE_RETRY_MAX_DELAY_SECONDS", default="8"))
+        self.retry_budget_seconds = float(self._get("CLAUDE_RETRY_BUDGET_SECONDS", default="60"))
         self.max_tokens = int(self._get("CLAUDE_MAX_TOKENS", default="2048"))
         self.temperature = float(self._get("CLAUDE_TEMPERATURE", default="0.0"))
+        self.token_budget = int(self._get("CLAUDE_TOKEN_BUDGET", default="0"))
+        self.batch_poll_seconds = float(self._get("CLAUDE_BATCH_POLL_SECONDS", default="30"))
+        self.batch_timeout_seconds = float(self._get("CLAUDE_BATCH_TIMEOUT_SECONDS", default="86400"))
+        self.prompt_cache_enabled = self._get_bool("CLAUDE_PROMPT_CACHE_ENABLED", default=True)
+        self.prompt_version = self._get("CLAUDE_PROMPT_VERSION", default="v1").strip().lower()
+        self.pool_max_size = int(self._get("CLAUDE_POOL_MAX_SIZE", default="10"))
+        self.pool_idle_timeout_seconds = float(
+            self._get("CLAUDE_POOL_IDLE_TIMEOUT_SECONDS", default="30")
+        )
+        self.pool_max_lifetime_seconds = float(
+            self._get("CLAUDE_POOL_MAX_LIFETIME_SECONDS", default="300")
+        )
+
+        self.max_concurrent_requests = int(self._get("CLAUDE_MAX_CONCURRENT_REQUESTS", default="8"))
+        self.max_queued_requests = int(self._get("CLAUDE_MAX_QUEUED_REQUESTS", default="32"))
+        self.queue_timeout_seconds = float(self._get("CLAUDE_QUEUE_TIMEOUT_SECONDS", default="10"))
+
+        self.rate_limit_enabled = self._get_bool("CLAUDE_RATE_LIMIT_ENABLED", default=True)
+        self.rate_limit_rpm = int(self._get("CLAUDE_RATE_LIMIT_RPM", default="0"))
+        self.rate_limit_tpm = int(self._get("CLAUDE_RATE_LIMIT_TPM", default="0"))
+        self.rate_limit_max_wait_seconds = float(
+            self._get("CLAUDE_RATE_LIMIT_MAX_WAIT_SECONDS", default="30")
+        )
+
+        self.breaker_enabled = self._get_bool("CLAUDE_BREAKER_ENABLED", default=True)
+        self.breaker_window_seconds = float(self._get("CLAUDE_BREAKER_WINDOW_SECONDS", default="30"))
+        self.breaker_min_calls = int(self._get("CLAUDE_BREAKER_MIN_CALLS", default="10"))
+        self.breaker_error_rate = float(self._get("CLAUDE_BREAKER_ERROR_RATE", default="0.5"))
+        self.breaker_slow_call_seconds = float(
+            self._get("CLAUDE_BREAKER_SLOW_CALL_SECONDS", default="20")
+        )
+        self.breaker_slow_call_rate = float(self._get("CLAUDE_BREAKER_SLOW_CALL_RATE", default="0.8"))
+        self.breaker_open_seconds = float(self._get("CLAUDE_BREAKER_OPEN_SECONDS", default="30"))
+        self.breaker_half_open_calls = int(self._get("CLAUDE_BREAKER_HALF_OPEN_CALLS", default="1"))
+
+        self.review_cache_enabled = self._get_bool("REVIEW_CACHE_ENABLED", default=True)
+        self.review_cache_max_entries = int(self._get("REVIEW_CACHE_MAX_ENTRIES", default="256"))
+        self.review_cache_max_bytes = int(
+            self._get("REVIEW_CACHE_MAX_BYTES", default=str(16 * 1024 * 1024))
+        )
+        self.review_cache_ttl_seconds = float(self._get("REVIEW_CACHE_TTL_SECONDS", default="600"))
+        self.review_cache_persistent_enabled = self._get_bool("REVIEW_CACHE_PERSISTENT_ENABLED", default=False)
+        self.review_cache_db_path = self._get("REVIEW_CACHE_DB_PATH", default="review_cache.sqlite3")
+        self.review_cache_db_max_bytes = int(self._get("REVIEW_CACHE_DB_MAX_BYTES", default="268435456"))
+        self.review_cache_db_ttl_seconds = float(self._get("REVIEW_CACHE_DB_TTL_SECONDS", default="86400"))
+        self.review_cache_stale_seconds = float(self._get("REVIEW_CACHE_STALE_SECONDS", default="0"))
+        self.review_cache_compress = self._get_bool("REVIEW_CACHE_COMPRESS", default=True)
+        self.review_cache_normalize = self._get_bool("REVIEW_CACHE_NORMALIZE", default=False)
+        self.review_cache_strip_comments = self._get_bool("REVIEW_CACHE_STRIP_COMMENTS", default=False)
+
+        self.review_input_max_chars = int(self._get("REVIEW_INPUT_MAX_CHARS", default="500"))
+        self.review_context_selection_enabled = self._get_bool("REVIEW_CONTEXT_SELECTION_ENABLED", default=True)
+
+        self.review_chunking_enabled = self._get_bool("REVIEW_CHUNKING_ENABLED", default=False)
+        self.review_chunk_max_chars = int(self._get("REVIEW_CHUNK_MAX_CHARS", default="2000"))
+        self.review_chunk_max_count = int(self._get("REVIEW_CHUNK_MAX_COUNT", default="16"))
+        self.review_chunk_concurrency = int(self._get("REVIEW_CHUNK_CONCURRENCY", default="4"))
+        self.review_chunk_overlap_lines = int(self._get("REVIEW_CHUNK_OVERLAP_LINES", default="2"))
+
+        self.review_sessions_enabled = self._get_bool("REVIEW_SESSIONS_ENABLED", default=True)
+        self.review_session_max_entries = int(self._get("REVIEW_SESSION_MAX_ENTRIES", default="1024"))
+        self.review_session_ttl_seconds = float(self._get("REVIEW_SESSION_TTL_SECONDS", default="3600"))
+        self.review_session_context_lines = int(self._get("REVIEW_SESSION_CONTEXT_LINES", default="3"))
+
+        self.review_diff_context_lines = int(self._get("REVIEW_DIFF_CONTEXT_LINES", default="3"))
+        self.review_diff_max_lines = int(self._get("REVIEW_DIFF_MAX_LINES", default="20000"))
+
+        self.review_deadline_ms = int(self._get("REVIEW_DEADLINE_MS", default="0"))
+
+        self.review_batch_max_items = int(self._get("REVIEW_BATCH_MAX_ITEMS", default="100"))
+        self.review_batch_concurrency = int(self._get("REVIEW_BATCH_CONCURRENCY", default="4"))
+
+        self.review_micro_batch_enabled = self._get_bool("REVIEW_MICRO_BATCH_ENABLED", default=False)
+        self.review_micro_batch_window_ms = int(self._get("REVIEW_MICRO_BATCH_WINDOW_MS", default="20"))
+        self.review_micro_batch_max_size = int(self._get("REVIEW_MICRO_BATCH_MAX_SIZE", default="8"))
+
+        self.review_jobs_db_path = self._get("REVIEW_JOBS_DB_PATH", default="review_jobs.sqlite3")
+        self.review_jobs_workers = int(self._get("REVIEW_JOBS_WORKERS", default="2"))
+        self.review_jobs_run_workers = self._get_bool("REVIEW_JOBS_RUN_WORKERS", default=True)
+        self.review_jobs_lease_seconds = float(self._get("REVIEW_JOBS_LEASE_SECONDS", default="60"))
+        self.review_jobs_max_wait_seconds = float(
+            self._get("REVIEW_JOBS_MAX_WAIT_SECONDS", default="30")
+        )
+
+    def _get_bool(self, key: str, *, default: bool) -> bool:
+        value = self._get(key)
+        if value is None:
+            return default
+        return value.strip().lower() in {"1", "true", "yes", "on"}
 
     def _get(self, key: str, *, default: str | None = None) -> str | None:
         if key in os.environ:
@@ -1,9 +1,20 @@
 """Metrics model for review responses."""
 
+from typing import Optional
+
 from pydantic import BaseModel, ConfigDict, Field
 
 class ReviewMetrics(BaseModel):
     processing_time_ms: int = Field(alias="processingTimeMs")
     model: str
+    cached: bool = False
+    degraded: bool = False
+    stale: bool = False
+    reviewed_lines: Optional[int] = Field(default=None, alias="reviewedLines")
+    truncated: bool = False
+    input_tokens: Optional[int] = Field(default=None, alias="inputTokens")
+    output_tokens: Optional[int] = Field(default=None, alias="outputTokens")
+    cache_read_input_tokens: Optional[int] = Field(default=None, alias="cacheReadInputTokens")
+    cache_creation_input_tokens: Optional[int] = Field(default=None, alias="cacheCreationInputTokens")
 
     model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
@@ -1,10 +1,17 @@
 """Schema definitions for request/response payloads."""
 
+from codereview_agent.review.schemas.batch_review_request import BatchReviewItem, BatchReviewRequest
+from codereview_agent.review.schemas.review_job_request import ReviewJobRequest
 from codereview_agent.review.schemas.review_request import ReviewRequest
 from codereview_agent.review.schemas.review_response import ReviewResponse
+from codereview_agent.review.schemas.review_update_request import ReviewUpdateRequest
 
 __all__ = [
+    "BatchReviewItem",
+    "BatchReviewRequest",
+    "ReviewJobRequest",
     "ReviewRequest",
     "ReviewResponse",
+    "ReviewUpdateRequest",
 ]
 
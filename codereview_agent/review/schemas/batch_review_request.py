@@ -0,0 +1,40 @@
+"""Schema for bulk review requests."""
+
+from typing import List
+
+from pydantic import BaseModel, field_validator
+
+from codereview_agent.review.schemas.review_request import ReviewRequest
+
+__all__ = ["BatchReviewItem", "BatchReviewRequest"]
+
+
+class BatchReviewItem(ReviewRequest):
+    id: str
+
+    @field_validator("id")
+    @classmethod
+    def _ensure_id_not_empty(cls, value: str) -> str:
+        stripped = value.strip()
+        if not stripped:
+            msg = "id 필드는 비어 있을 수 없습니다."
+            raise ValueError(msg)
+        return stripped
+
+
+class BatchReviewRequest(BaseModel):
+    items: List[BatchReviewItem]
+
+    @field_validator("items")
+    @classmethod
+    def _ensure_unique_ids(cls, value: List[BatchReviewItem]) -> List[BatchReviewItem]:
+        if not value:
+            msg = "items는 최소 1개 이상이어야 합니다."
+            raise ValueError(msg)
+        seen = set()
+        for item in value:
+            if item.id in seen:
+                msg = f"중복된 id입니다: {item.id}"
+                raise ValueError(msg)
+            seen.add(item.id)
+        return value
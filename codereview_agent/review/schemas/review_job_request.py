@@ -0,0 +1,11 @@
+"""Schema for asynchronous review job submissions."""
+
+from pydantic import Field
+
+from codereview_agent.review.schemas.review_request import ReviewRequest
+
+__all__ = ["ReviewJobRequest"]
+
+
+class ReviewJobRequest(ReviewRequest):
+    priority: int = Field(default=0, ge=-100, le=100)
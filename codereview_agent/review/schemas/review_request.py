@@ -2,15 +2,19 @@
 
 from typing import Literal, Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 __all__ = ["ReviewRequest"]
 
 
 class ReviewRequest(BaseModel):
-    code: str
+    code: str = ""
     language: Optional[str] = None
     style: Literal["bug", "detail", "refactor", "test"] = "detail"
+    diff: Optional[str] = None
+    base_code: Optional[str] = Field(default=None, alias="baseCode")
+
+    model_config = ConfigDict(populate_by_name=True)
 
     @field_validator("code")
     @classmethod
@@ -34,3 +38,42 @@ class ReviewRequest(BaseModel):
         if value is None:
             return None
         return str(value).strip().lower() or None
+
+    @model_validator(mode="after")
+    def _resolve_code_from_diff(self) -> "ReviewRequest":
+        """With a ``diff``, ``code`` is the new file.
+
+        It is taken as given, rebuilt from ``baseCode``, or (without either)
+        made of the lines the diff shows, kept at their new-file line numbers.
+        """
+
+        if self.diff is None or not self.diff.strip():
+            if not self.code:
+                msg = "code 또는 diff 중 하나는 필요합니다."
+                raise ValueError(msg)
+            self.diff = None
+            return self
+
+        # Imported here because the service package itself depends on these schemas.
+        from codereview_agent.review.config import get_settings
+        from codereview_agent.review.service.unified_diff import (
+            PatchError,
+            apply_unified_diff,
+            parse_unified_diff,
+            render_new_side,
+        )
+
+        try:
+            hunks = parse_unified_diff(self.diff)
+            if not self.code:
+                self.code = (
+                    apply_unified_diff(self.base_code, hunks)
+                    if self.base_code is not None
+                    else render_new_side(hunks, max_lines=get_settings().review_diff_max_lines)
+                )
+        except PatchError as exc:
+            raise ValueError(str(exc)) from exc
+        if not self.code.strip():
+            msg = "diff 적용 결과 코드가 비어 있습니다."
+            raise ValueError(msg)
+        return self
@@ -0,0 +1,21 @@
+"""Schema for incremental updates to an existing review session."""
+
+from typing import Optional
+
+from pydantic import BaseModel, model_validator
+
+__all__ = ["ReviewUpdateRequest"]
+
+
+class ReviewUpdateRequest(BaseModel):
+    code: Optional[str] = None
+    diff: Optional[str] = None
+
+    @model_validator(mode="after")
+    def _ensure_exactly_one_source(self) -> "ReviewUpdateRequest":
+        has_code = bool(self.code and self.code.strip())
+        has_diff = bool(self.diff and self.diff.strip())
+        if has_code == has_diff:
+            msg = "code 또는 diff 중 하나만 지정해야 합니다."
+            raise ValueError(msg)
+        return self
@@ -1,6 +1,27 @@
 """Service layer for code review flows."""
 
-from codereview_agent.review.service.claude_client import ClaudeReviewClient, ClaudeReviewError
+from codereview_agent.review.service.claude_client import (
+    ClaudeCircuitOpenError,
+    ClaudeOverloadedError,
+    ClaudeReviewClient,
+    ClaudeReviewError,
+    ReviewBatchEntry,
+)
+from codereview_agent.review.service.code_normalizer import NormalizationOptions
+from codereview_agent.review.service.context_selector import ContextSelectionOptions
+from codereview_agent.review.service.micro_batcher import MicroBatchOptions
 from codereview_agent.review.service.review_service import ReviewService
+from codereview_agent.review.service.session_store import ReviewSessionStore
 
-__all__ = ["ReviewService", "ClaudeReviewClient", "ClaudeReviewError"]
+__all__ = [
+    "ReviewService",
+    "ClaudeReviewClient",
+    "ClaudeReviewError",
+    "ClaudeCircuitOpenError",
+    "ClaudeOverloadedError",
+    "ReviewBatchEntry",
+    "MicroBatchOptions",
+    "NormalizationOptions",
+    "ContextSelectionOptions",
+    "ReviewSessionStore",
+]
@@ -0,0 +1,147 @@
+"""Pool of Claude API keys spread by remaining capacity, with cooldown after 429/401."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from codereview_agent.review.service.rate_limiter import RateLimiter
+
+RATE_LIMITED_STATUSES = frozenset({429})
+UNAUTHORIZED_STATUSES = frozenset({401, 403})
+
+
+@dataclass(frozen=True)
+class ApiKeyPoolOptions:
+    rate_limited_cooldown_seconds: float = 30.0
+    unauthorized_cooldown_seconds: float = 300.0
+
+
+class ApiKeyPoolExhaustedError(Exception):
+    """Raised when every key in the pool is cooling down."""
+
+    def __init__(self, message: str, *, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.message = message
+        self.retry_after = retry_after
+
+
+class PooledApiKey:
+    """One API key (usually one workspace) with its own rate limiter and cooldown."""
+
+    def __init__(self, key: str, rate_limiter: Optional[RateLimiter] = None) -> None:
+        self.key = key
+        self.rate_limiter = rate_limiter
+        self.cooldown_until = 0.0
+        self.calls = 0
+        self.rate_limited = 0
+        self.unauthorized = 0
+
+    @property
+    def label(self) -> str:
+        """Key identifier that is safe to log or expose in metrics."""
+
+        return f"...{self.key[-4:]}" if len(self.key) > 8 else "..."
+
+    def headroom(self) -> float:
+        return self.rate_limiter.headroom() if self.rate_limiter is not None else 1.0
+
+
+class ApiKeyPool:
+    """Hand out the key with the most remaining capacity, skipping keys on cooldown.
+
+    Ties are broken round-robin so keys with unknown limits share the load. A
+    429 puts the key on cooldown for its ``Retry-After`` (or
+    ``rate_limited_cooldown_seconds``); 401/403 use the longer
+    ``unauthorized_cooldown_seconds`` so a revoked key stops receiving traffic.
+    """
+
+    def __init__(
+        self,
+        keys: Sequence[PooledApiKey],
+        options: Optional[ApiKeyPoolOptions] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._keys: List[PooledApiKey] = list(keys)
+        self._options = options or ApiKeyPoolOptions()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._cursor = 0
+
+    @classmethod
+    def from_keys(
+        cls,
+        keys: Sequence[str],
+        *,
+        rate_limiter_factory: Callable[[], Optional[RateLimiter]],
+        options: Optional[ApiKeyPoolOptions] = None,
+    ) -> "ApiKeyPool":
+        unique = list(dict.fromkeys(key for key in keys if key))
+        return cls([PooledApiKey(key, rate_limiter_factory()) for key in unique], options)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def primary(self) -> Optional[PooledApiKey]:
+        """The first key; used for calls that must stay on one workspace (Message Batches)."""
+
+        return self._keys[0] if self._keys else None
+
+    def acquire(self) -> PooledApiKey:
+        with self._lock:
+            now = self._clock()
+            count = len(self._keys)
+            rotated = [self._keys[(self._cursor + offset) % count] for offset in range(count)]
+            available = [key for key in rotated if key.cooldown_until <= now]
+            if not available:
+                wait = min(key.cooldown_until for key in self._keys) - now
+                raise ApiKeyPoolExhaustedError(
+                    "사용 가능한 Claude API 키가 없습니다. 모든 키가 대기 중입니다.",
+                    retry_after=max(0.0, wait),
+                )
+            self._cursor = (self._cursor + 1) % count
+            chosen = max(available, key=lambda key: key.headroom())
+            chosen.calls += 1
+            return chosen
+
+    def has_available(self) -> bool:
+        with self._lock:
+            now = self._clock()
+            return any(key.cooldown_until <= now for key in self._keys)
+
+    def report(self, key: PooledApiKey, status_code: Optional[int], retry_after: Optional[float] = None) -> None:
+        if status_code in RATE_LIMITED_STATUSES:
+            cooldown = retry_after if retry_after else self._options.rate_limited_cooldown_seconds
+        elif status_code in UNAUTHORIZED_STATUSES:
+            cooldown = self._options.unauthorized_cooldown_seconds
+        else:
+            return
+        with self._lock:
+            if status_code in RATE_LIMITED_STATUSES:
+                key.rate_limited += 1
+            else:
+                key.unauthorized += 1
+            key.cooldown_until = max(key.cooldown_until, self._clock() + cooldown)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            now = self._clock()
+            keys = list(self._keys)
+        return {
+            "keys": [
+                {
+                    "key": key.label,
+                    "calls": key.calls,
+                    "rateLimited": key.rate_limited,
+                    "unauthorized": key.unauthorized,
+                    "coolingDownSeconds": round(max(0.0, key.cooldown_until - now), 3),
+                    "headroom": round(key.headroom(), 3),
+                    "rateLimit": key.rate_limiter.snapshot() if key.rate_limiter is not None else None,
+                }
+                for key in keys
+            ]
+        }
@@ -0,0 +1,308 @@
+"""Minimal asyncio HTTP/1.1 transport for non-blocking Claude calls."""
+
+from __future__ import annotations
+
+import asyncio
+import ssl
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+_STREAM_READ_SIZE = 16 * 1024
+
+
+class AsyncHttpError(Exception):
+    """Raised when the connection or HTTP framing fails."""
+
+
+class AsyncStaleConnectionError(AsyncHttpError):
+    """Raised when the request could not be sent or no response byte arrived.
+
+    Only this failure is safe to replay on a fresh connection: the server never
+    started answering, as when it silently dropped an idle keep-alive socket.
+    """
+
+
+@dataclass
+class HttpResponse:
+    status: int
+    reason: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    def header(self, name: str) -> Optional[str]:
+        return self.headers.get(name.lower())
+
+
+@dataclass(frozen=True)
+class Origin:
+    scheme: str
+    host: str
+    port: int
+
+    @property
+    def use_tls(self) -> bool:
+        return self.scheme == "https"
+
+    @property
+    def host_header(self) -> str:
+        default_port = 443 if self.use_tls else 80
+        return self.host if self.port == default_port else f"{self.host}:{self.port}"
+
+    @classmethod
+    def from_url(cls, url: str) -> "Origin":
+        parts = urlsplit(url)
+        scheme = (parts.scheme or "https").lower()
+        if scheme not in {"http", "https"}:
+            raise AsyncHttpError(f"지원하지 않는 URL 스킴입니다: {scheme}")
+        if not parts.hostname:
+            raise AsyncHttpError(f"URL에 호스트가 없습니다: {url}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        return cls(scheme=scheme, host=parts.hostname, port=port)
+
+
+class AsyncHttpConnection:
+    """A single HTTP/1.1 connection driven by asyncio streams."""
+
+    def __init__(self, origin: Origin, *, ssl_context: Optional[ssl.SSLContext] = None) -> None:
+        self.origin = origin
+        self._ssl_context = ssl_context
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self.reusable = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def connect(self) -> None:
+        ssl_context = None
+        if self.origin.use_tls:
+            ssl_context = self._ssl_context or ssl.create_default_context()
+        try:
+            self._reader, self._writer = await asyncio.open_connection(
+                self.origin.host,
+                self.origin.port,
+                ssl=ssl_context,
+                server_hostname=self.origin.host if ssl_context else None,
+            )
+        except OSError as exc:
+            raise AsyncHttpError(f"연결에 실패했습니다: {exc}") from exc
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: Dict[str, str],
+        body: bytes = b"",
+        keep_alive: bool = False,
+    ) -> HttpResponse:
+        """Send a request and read the complete response."""
+
+        await self.send_head(method, path, headers=headers, body=body, keep_alive=keep_alive)
+        response = await self.read_head()
+        response.body = await self.read_body(response)
+        return response
+
+    async def send_head(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: Dict[str, str],
+        body: bytes = b"",
+        keep_alive: bool = False,
+    ) -> None:
+        if self._writer is None:
+            await self.connect()
+        assert self._writer is not None
+
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.origin.host_header}"]
+        for name, value in headers.items():
+            lines.append(f"{name}: {value}")
+        lines.append(f"Content-Length: {len(body)}")
+        lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+        try:
+            self._writer.write(head + body)
+            await self._writer.drain()
+        except OSError as exc:
+            raise AsyncStaleConnectionError(f"요청 전송에 실패했습니다: {exc}") from exc
+        self.reusable = keep_alive
+
+    async def read_head(self) -> HttpResponse:
+        assert self._reader is not None
+        try:
+            status_line = await self._readline()
+        except AsyncHttpError as exc:
+            raise AsyncStaleConnectionError(str(exc)) from exc
+        if not status_line:
+            raise AsyncStaleConnectionError("서버가 응답 없이 연결을 종료했습니다.")
+
+        try:
+            _version, status, *reason = status_line.split(" ", 2)
+            status_code = int(status)
+        except ValueError as exc:
+            raise AsyncHttpError(f"잘못된 상태 줄입니다: {status_line!r}") from exc
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await self._readline()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("connection", "").lower() == "close":
+            self.reusable = False
+
+        return HttpResponse(
+            status=status_code,
+            reason=reason[0] if reason else "",
+            headers=headers,
+        )
+
+    async def read_body(self, response: HttpResponse) -> bytes:
+        assert self._reader is not None
+        try:
+            if response.header("transfer-encoding") == "chunked":
+                return await self._read_chunked()
+            length = response.header("content-length")
+            if length is not None:
+                return await self._reader.readexactly(int(length))
+            self.reusable = False
+            return await self._reader.read()
+        except (asyncio.IncompleteReadError, ValueError, OSError) as exc:
+            self.reusable = False
+            raise AsyncHttpError(f"응답 본문을 읽을 수 없습니다: {exc}") from exc
+
+    async def iter_body(
+        self,
+        response: HttpResponse,
+        *,
+        idle_timeout: Optional[float] = None,
+    ) -> AsyncIterator[bytes]:
+        """Yield the response body piece by piece as it arrives."""
+
+        assert self._reader is not None
+        reader = self._reader
+
+        async def read(awaitable: Awaitable[bytes]) -> bytes:
+            try:
+                return await asyncio.wait_for(awaitable, timeout=idle_timeout)
+            except asyncio.TimeoutError as exc:
+                raise AsyncHttpError(f"{idle_timeout}초 동안 스트림 데이터가 없습니다.") from exc
+            except (asyncio.IncompleteReadError, ValueError, OSError) as exc:
+                raise AsyncHttpError(f"응답 본문을 읽을 수 없습니다: {exc}") from exc
+
+        self.reusable = False
+        if response.header("transfer-encoding") == "chunked":
+            while True:
+                size_line = (await read(reader.readline())).decode("latin-1").strip()
+                try:
+                    size = int(size_line.split(";", 1)[0] or "0", 16)
+                except ValueError as exc:
+                    raise AsyncHttpError(f"잘못된 청크 크기입니다: {size_line!r}") from exc
+                if size == 0:
+                    return
+                yield await read(reader.readexactly(size))
+                await read(reader.readexactly(2))
+
+        length = response.header("content-length")
+        if length is not None:
+            remaining = int(length)
+            while remaining > 0:
+                piece = await read(reader.read(min(remaining, _STREAM_READ_SIZE)))
+                if not piece:
+                    raise AsyncHttpError("응답 본문이 예상보다 일찍 끝났습니다.")
+                remaining -= len(piece)
+                yield piece
+            return
+
+        while True:
+            piece = await read(reader.read(_STREAM_READ_SIZE))
+            if not piece:
+                return
+            yield piece
+
+    def abandon(self) -> None:
+        """Drop the connection without awaiting shutdown, e.g. when its event loop is gone."""
+
+        writer, self._writer, self._reader = self._writer, None, None
+        self.reusable = False
+        if writer is None:
+            return
+        try:
+            writer.close()
+        except RuntimeError:  # pragma: no cover - the owning loop is already closed
+            pass
+
+    async def close(self) -> None:
+        writer, self._writer, self._reader = self._writer, None, None
+        self.reusable = False
+        if writer is None:
+            return
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (OSError, ssl.SSLError):  # pragma: no cover - best-effort shutdown
+            pass
+
+    async def _readline(self) -> str:
+        assert self._reader is not None
+        try:
+            raw = await self._reader.readline()
+        except (ValueError, OSError) as exc:
+            raise AsyncHttpError(f"응답 헤더를 읽을 수 없습니다: {exc}") from exc
+        return raw.decode("latin-1").rstrip("\r\n")
+
+    async def _read_chunked(self) -> bytes:
+        assert self._reader is not None
+        chunks = []
+        while True:
+            size_line = (await self._reader.readline()).decode("latin-1").strip()
+            size = int(size_line.split(";", 1)[0] or "0", 16)
+            if size == 0:
+                # Consume optional trailers until the terminating blank line.
+                while (await self._reader.readline()).strip():
+                    pass
+                break
+            chunks.append(await self._reader.readexactly(size))
+            await self._reader.readexactly(2)
+        return b"".join(chunks)
+
+
+async def iter_sse_events(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[str, str]]:
+    """Decode a ``text/event-stream`` body into ``(event, data)`` pairs."""
+
+    pending = b""
+    event = "message"
+    data_lines = []
+    async for chunk in chunks:
+        pending += chunk
+        while True:
+            newline = pending.find(b"\n")
+            if newline == -1:
+                break
+            line = pending[:newline].rstrip(b"\r").decode("utf-8", errors="replace")
+            pending = pending[newline + 1 :]
+
+            if not line:
+                if data_lines:
+                    yield event, "\n".join(data_lines)
+                event, data_lines = "message", []
+                continue
+            if line.startswith(":"):
+                continue
+            field, _, value = line.partition(":")
+            value = value[1:] if value.startswith(" ") else value
+            if field == "event":
+                event = value
+            elif field == "data":
+                data_lines.append(value)
+
+    if data_lines:
+        yield event, "\n".join(data_lines)
@@ -0,0 +1,217 @@
+"""Bulkhead limiting how many Claude calls run at once, with a bounded wait queue."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, List, Optional, Sequence
+
+WAIT_SECONDS_BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+QUEUE_DEPTH_BUCKETS = (0, 1, 2, 4, 8, 16, 32, 64, 128)
+
+
+@dataclass(frozen=True)
+class BulkheadOptions:
+    max_concurrent: int = 8
+    max_queue: int = 32
+    max_wait_seconds: float = 10.0
+
+
+class BulkheadFullError(Exception):
+    """Raised when a call is shed because the wait queue is full or the wait timed out."""
+
+    def __init__(self, message: str, *, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.message = message
+        self.retry_after = retry_after
+
+
+class Histogram:
+    """Fixed-bucket histogram rendered Prometheus style (cumulative ``le`` buckets)."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self._bounds = tuple(sorted(buckets))
+        self._counts: List[int] = [0] * (len(self._bounds) + 1)
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self._sum += value
+
+    def as_dict(self) -> Dict[str, Any]:
+        buckets: Dict[str, int] = {}
+        running = 0
+        for bound, count in zip(self._bounds, self._counts):
+            running += count
+            buckets[f"{bound:g}"] = running
+        buckets["+Inf"] = running + self._counts[-1]
+        return {"buckets": buckets, "count": buckets["+Inf"], "sum": self._sum}
+
+
+class _Waiter:
+    __slots__ = ("granted", "abandoned", "wake")
+
+    def __init__(self, wake: Callable[[], None]) -> None:
+        self.granted = False
+        self.abandoned = False
+        self.wake = wake
+
+
+class Bulkhead:
+    """Admit at most ``max_concurrent`` calls; queue up to ``max_queue`` more.
+
+    Waiters are served first-in first-out and a released slot is handed
+    directly to the next waiter. A call is shed with :class:`BulkheadFullError`
+    when the queue is already full or it waited longer than
+    ``max_wait_seconds``. Both the blocking and the asyncio entry points share
+    one budget, and async waiters may live on different event loops.
+    """
+
+    def __init__(
+        self,
+        options: Optional[BulkheadOptions] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._options = options or BulkheadOptions()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiters: Deque[_Waiter] = deque()
+        self._admitted = 0
+        self._shed_queue_full = 0
+        self._shed_timeout = 0
+        self._wait_seconds = Histogram(WAIT_SECONDS_BUCKETS)
+        self._queue_depth = Histogram(QUEUE_DEPTH_BUCKETS)
+
+    @property
+    def options(self) -> BulkheadOptions:
+        return self._options
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        await self.aacquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def acquire(self) -> None:
+        started = self._clock()
+        event = threading.Event()
+        waiter = self._enqueue(event.set)
+        if waiter is None:
+            self._observe_wait(started)
+            return
+        event.wait(self._options.max_wait_seconds)
+        self._settle(waiter, started)
+
+    async def aacquire(self) -> None:
+        started = self._clock()
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[None]" = loop.create_future()
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+        waiter = self._enqueue(wake)
+        if waiter is None:
+            self._observe_wait(started)
+            return
+        try:
+            await asyncio.wait_for(future, self._options.max_wait_seconds)
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            with self._lock:
+                granted = waiter.granted
+                if not granted:
+                    self._abandon(waiter)
+            if granted:
+                self.release()
+            raise
+        self._settle(waiter, started)
+
+    def release(self) -> None:
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if waiter.abandoned:
+                    continue
+                # The slot moves straight to the waiter, so ``in_flight`` is unchanged.
+                waiter.granted = True
+                waiter.wake()
+                return
+            self._in_flight = max(0, self._in_flight - 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "inFlight": self._in_flight,
+                "queued": len(self._waiters),
+                "maxConcurrent": self._options.max_concurrent,
+                "maxQueue": self._options.max_queue,
+                "admitted": self._admitted,
+                "shedQueueFull": self._shed_queue_full,
+                "shedTimeout": self._shed_timeout,
+                "queueDepth": self._queue_depth.as_dict(),
+                "waitSeconds": self._wait_seconds.as_dict(),
+            }
+
+    # ------------------------------------------------------------------
+
+    def _enqueue(self, wake: Callable[[], None]) -> Optional[_Waiter]:
+        """Take a free slot (returning ``None``) or join the queue."""
+
+        with self._lock:
+            depth = len(self._waiters)
+            self._queue_depth.observe(depth)
+            if self._in_flight < max(1, self._options.max_concurrent) and not depth:
+                self._in_flight += 1
+                self._admitted += 1
+                return None
+            if depth >= max(0, self._options.max_queue):
+                self._shed_queue_full += 1
+                raise BulkheadFullError(
+                    "Claude API 동시 호출 대기열이 가득 찼습니다.",
+                    retry_after=self._options.max_wait_seconds,
+                )
+            waiter = _Waiter(wake)
+            self._waiters.append(waiter)
+            return waiter
+
+    def _settle(self, waiter: _Waiter, started: float) -> None:
+        with self._lock:
+            if not waiter.granted:
+                self._abandon(waiter)
+                self._shed_timeout += 1
+                raise BulkheadFullError(
+                    f"Claude API 동시 호출 대기 시간({self._options.max_wait_seconds:g}초)을 초과했습니다.",
+                    retry_after=self._options.max_wait_seconds,
+                )
+            self._admitted += 1
+            self._wait_seconds.observe(self._clock() - started)
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        waiter.abandoned = True
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def _observe_wait(self, started: float) -> None:
+        with self._lock:
+            self._wait_seconds.observe(self._clock() - started)
@@ -0,0 +1,180 @@
+"""Split large inputs into line-aligned chunks and merge chunk reviews back."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from codereview_agent.review.models import Suggestion, SuggestionFix, SuggestionRange
+
+_BOUNDARY_PATTERN = re.compile(
+    r"^(?:@\w"
+    r"|(?:export\s+)?(?:default\s+)?(?:async\s+)?"
+    r"(?:def|class|function|interface|enum|struct|impl|func|fn|module|namespace)\b"
+    r"|(?:public|private|protected|internal|static)\b)"
+)
+_HUNK_HEADER_PATTERN = re.compile(r"^@@ -(\d+)((?:,\d+)?) \+(\d+)((?:,\d+)?) @@", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class ChunkingOptions:
+    max_chars: int = 2000
+    max_chunks: int = 16
+    concurrency: int = 4
+    overlap_lines: int = 2
+
+
+@dataclass(frozen=True)
+class CodeChunk:
+    start_line: int
+    text: str
+
+    @property
+    def end_line(self) -> int:
+        return self.start_line + self.text.count("\n")
+
+
+def split_into_chunks(code: str, options: ChunkingOptions) -> List[CodeChunk]:
+    """Split ``code`` into line-aligned chunks no larger than ``max_chars``.
+
+    Cuts prefer the last function/class boundary in the second half of a chunk,
+    then the last blank line, and only fall back to a hard cut at the size limit.
+    """
+
+    lines = code.split("\n")
+    max_chars = max(1, options.max_chars)
+    chunks: List[CodeChunk] = []
+
+    start = 0
+    while start < len(lines) and len(chunks) < max(1, options.max_chunks):
+        end = start
+        size = 0
+        while end < len(lines) and (end == start or size + len(lines[end]) + 1 <= max_chars):
+            size += len(lines[end]) + 1
+            end += 1
+
+        if end < len(lines):
+            end = _preferred_cut(lines, start, end)
+
+        context_start = max(0, start - options.overlap_lines) if chunks else start
+        chunks.append(CodeChunk(start_line=context_start + 1, text="\n".join(lines[context_start:end])))
+        start = end
+
+    return chunks
+
+
+def is_definition_line(line: str) -> bool:
+    """Whether ``line`` starts a function, class or similar definition (or a decorator)."""
+
+    return _BOUNDARY_PATTERN.match(line.lstrip()) is not None
+
+
+def remap_suggestion(suggestion: Suggestion, chunk: CodeChunk) -> Suggestion:
+    """Translate a chunk-relative suggestion into original file coordinates."""
+
+    offset = chunk.start_line - 1
+    if not offset:
+        return suggestion
+
+    original = suggestion.range
+    return suggestion.model_copy(
+        update={
+            "range": SuggestionRange(
+                start_line=original.start_line + offset,
+                start_col=original.start_col,
+                end_line=original.end_line + offset,
+                end_col=original.end_col,
+            ),
+            "fix": SuggestionFix(type=suggestion.fix.type, diff=shift_diff(suggestion.fix.diff, offset)),
+        }
+    )
+
+
+def shift_diff(diff: str, offset: int) -> str:
+    """Shift unified-diff hunk headers by ``offset`` lines."""
+
+    def _replace(match: "re.Match[str]") -> str:
+        old_start = int(match.group(1)) + offset
+        new_start = int(match.group(3)) + offset
+        return f"@@ -{old_start}{match.group(2)} +{new_start}{match.group(4)} @@"
+
+    return _HUNK_HEADER_PATTERN.sub(_replace, diff)
+
+
+def remap_suggestion_lines(
+    suggestions: Iterable[Suggestion],
+    map_start: Callable[[int], Optional[int]],
+    map_end: Callable[[int], Optional[int]],
+) -> List[Suggestion]:
+    """Move suggestions through a line mapping; those whose start line has no counterpart are dropped."""
+
+    remapped: List[Suggestion] = []
+    for suggestion in suggestions:
+        original = suggestion.range
+        start = map_start(original.start_line)
+        if start is None:
+            continue
+        end = map_end(original.end_line)
+        end = max(end, start) if end is not None else start
+        offset = start - original.start_line
+        remapped.append(
+            suggestion.model_copy(
+                update={
+                    "range": SuggestionRange(
+                        start_line=start,
+                        start_col=original.start_col,
+                        end_line=end,
+                        end_col=original.end_col,
+                    ),
+                    "fix": SuggestionFix(type=suggestion.fix.type, diff=shift_diff(suggestion.fix.diff, offset)),
+                }
+            )
+        )
+    return remapped
+
+
+def merge_chunk_suggestions(
+    results: Sequence[Tuple[CodeChunk, Iterable[Suggestion]]],
+) -> List[Suggestion]:
+    """Remap every chunk's suggestions and drop duplicates reported at chunk seams."""
+
+    merged: Dict[Tuple[int, int, str], Suggestion] = {}
+    for chunk, suggestions in results:
+        for suggestion in suggestions:
+            remapped = remap_suggestion(suggestion, chunk)
+            key = (
+                remapped.range.start_line,
+                remapped.range.end_line,
+                remapped.title.strip().lower(),
+            )
+            existing = merged.get(key)
+            if existing is None or remapped.confidence > existing.confidence:
+                merged[key] = remapped
+
+    return sorted(merged.values(), key=lambda item: (item.range.start_line, item.range.start_col))
+
+
+def merge_chunk_summaries(results: Sequence[Tuple[CodeChunk, Optional[str]]]) -> Optional[str]:
+    summaries: List[str] = []
+    for chunk, summary in results:
+        if not isinstance(summary, str) or not summary.strip():
+            continue
+        summaries.append(f"[L{chunk.start_line}-{chunk.end_line}] {summary.strip()}")
+    if not summaries:
+        return None
+    return "\n".join(summaries)
+
+
+def _preferred_cut(lines: List[str], start: int, end: int) -> int:
+    midpoint = start + max(1, (end - start) // 2)
+    for index in range(end - 1, midpoint - 1, -1):
+        if is_definition_line(lines[index]):
+            # Keep decorators/annotations attached to the definition below them.
+            while index - 1 > start and lines[index - 1].lstrip().startswith("@"):
+                index -= 1
+            return index
+    for index in range(end - 1, midpoint - 1, -1):
+        if not lines[index].strip():
+            return index + 1
+    return end
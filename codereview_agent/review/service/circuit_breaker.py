@@ -0,0 +1,177 @@
+"""Circuit breaker guarding calls to the Claude upstream."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerOptions:
+    window_seconds: float = 30.0
+    min_calls: int = 10
+    error_rate_threshold: float = 0.5
+    slow_call_seconds: float = 20.0
+    slow_call_rate_threshold: float = 0.8
+    open_seconds: float = 30.0
+    half_open_max_calls: int = 1
+
+
+@dataclass(frozen=True)
+class _Outcome:
+    at: float
+    failed: bool
+    slow: bool
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker driven by rolling error rate and latency.
+
+    While closed, outcomes inside ``window_seconds`` are kept; once at least
+    ``min_calls`` are recorded and either the error rate or the slow-call rate
+    crosses its threshold the breaker opens. After ``open_seconds`` it lets
+    ``half_open_max_calls`` probes through: all succeeding closes it again,
+    any failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        options: Optional[CircuitBreakerOptions] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._options = options or CircuitBreakerOptions()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._window: Deque[_Outcome] = deque()
+        self._opened_at: Optional[float] = None
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._rejected = 0
+        self._opened_count = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._refresh_state(self._clock())
+            return self._state
+
+    def allow(self) -> bool:
+        """Return ``True`` if a call may proceed; otherwise count a rejection."""
+
+        with self._lock:
+            now = self._clock()
+            self._refresh_state(now)
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and self._probes_in_flight < self._options.half_open_max_calls:
+                self._probes_in_flight += 1
+                return True
+            self._rejected += 1
+            return False
+
+    def record_success(self, latency_seconds: float) -> None:
+        self._record(failed=False, latency_seconds=latency_seconds)
+
+    def record_failure(self, latency_seconds: float) -> None:
+        self._record(failed=True, latency_seconds=latency_seconds)
+
+    def release(self) -> None:
+        """Give back a call admitted by :meth:`allow` that ended without an outcome (e.g. cancelled)."""
+
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def retry_in(self) -> float:
+        """Seconds until the breaker will admit a probe (0 when not open)."""
+
+        with self._lock:
+            now = self._clock()
+            self._refresh_state(now)
+            if self._state != OPEN or self._opened_at is None:
+                return 0.0
+            return max(0.0, self._opened_at + self._options.open_seconds - now)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            now = self._clock()
+            self._refresh_state(now)
+            self._trim(now)
+            calls = len(self._window)
+            failures = sum(1 for outcome in self._window if outcome.failed)
+            slow = sum(1 for outcome in self._window if outcome.slow)
+            return {
+                "state": self._state,
+                "windowCalls": calls,
+                "errorRate": failures / calls if calls else 0.0,
+                "slowCallRate": slow / calls if calls else 0.0,
+                "rejected": self._rejected,
+                "opened": self._opened_count,
+            }
+
+    # ------------------------------------------------------------------
+
+    def _record(self, *, failed: bool, latency_seconds: float) -> None:
+        with self._lock:
+            now = self._clock()
+            slow = latency_seconds >= self._options.slow_call_seconds
+            if self._state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                if failed or slow:
+                    self._open(now)
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self._options.half_open_max_calls:
+                    self._state = CLOSED
+                    self._window.clear()
+                return
+            if self._state == OPEN:
+                return
+
+            self._window.append(_Outcome(at=now, failed=failed, slow=slow))
+            self._trim(now)
+            if self._should_trip():
+                self._open(now)
+
+    def _should_trip(self) -> bool:
+        calls = len(self._window)
+        if calls < max(1, self._options.min_calls):
+            return False
+        failures = sum(1 for outcome in self._window if outcome.failed)
+        slow = sum(1 for outcome in self._window if outcome.slow)
+        return (
+            failures / calls >= self._options.error_rate_threshold
+            or slow / calls >= self._options.slow_call_rate_threshold
+        )
+
+    def _open(self, now: float) -> None:
+        self._state = OPEN
+        self._opened_at = now
+        self._opened_count += 1
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._window.clear()
+
+    def _refresh_state(self, now: float) -> None:
+        if (
+            self._state == OPEN
+            and self._opened_at is not None
+            and now - self._opened_at >= self._options.open_seconds
+        ):
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+
+    def _trim(self, now: float) -> None:
+        horizon = now - self._options.window_seconds
+        while self._window and self._window[0].at < horizon:
+            self._window.popleft()
@@ -2,22 +2,77 @@
 
 from __future__ import annotations
 
+import asyncio
+import http.client
 import json
 import logging
 import time
-from typing import Any, Dict, Optional, TYPE_CHECKING
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    TYPE_CHECKING,
+)
+from urllib.parse import urlsplit
 
 
 if TYPE_CHECKING:  # pragma: no cover - type checking helper
     from codereview_agent.review.schemas import ReviewRequest
 
-from codereview_agent.review.config import get_settings
+from codereview_agent.review.config import ClaudeSettings, get_settings
+from codereview_agent.review.service.async_http import (
+    AsyncHttpConnection,
+    AsyncHttpError,
+    HttpResponse,
+    Origin,
+    iter_sse_events,
+)
+from codereview_agent.review.service.api_key_pool import (
+    RATE_LIMITED_STATUSES,
+    ApiKeyPool,
+    ApiKeyPoolExhaustedError,
+    ApiKeyPoolOptions,
+    PooledApiKey,
+)
+from codereview_agent.review.service.bulkhead import Bulkhead, BulkheadFullError, BulkheadOptions
+from codereview_agent.review.service.circuit_breaker import CircuitBreaker, CircuitBreakerOptions
+from codereview_agent.review.service.connection_pool import (
+    AsyncConnectionPool,
+    HttpConnectionPool,
+)
+from codereview_agent.review.service.prompt_builder import PromptBuilder, estimate_tokens, min_cacheable_tokens
+from codereview_agent.review.service.rate_limiter import (
+    RateLimiter,
+    RateLimitExceededError,
+    RateLimitOptions,
+)
+from codereview_agent.review.service.retry_policy import RetryPolicy, parse_retry_after
+from codereview_agent.review.service.stream_parser import SuggestionStreamParser
 
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# (model, prompt version, prefix tokens) already reported as too short to cache.
+_UNCACHEABLE_PREFIXES_LOGGED: Set[Tuple[str, str, int]] = set()
+
+
+# Bump whenever the prompt or schema changes so cached reviews are not reused.
+PROMPT_VERSION = "v1"
 
 REVIEW_PROMPT_INSTRUCTIONS = """You are a code review assistant that returns structured JSON responses.
 
@@ -69,6 +124,62 @@ Notes:
 
 Do not wrap the JSON in Markdown or any prose."""
 
+# Token-lean schema: the server fills in ids, status, the unified diff and echoed code.
+COMPACT_PROMPT_VERSION = "v2"
+
+COMPACT_REVIEW_PROMPT_INSTRUCTIONS = """You are a code review assistant that returns compact JSON.
+
+Respond with exactly this shape:
+
+{
+  "summary": string,
+  "suggestions": [
+    {
+      "title": string,
+      "rationale": string,
+      "severity": "info" | "minor" | "major" | "critical",
+      "tags": string[],
+      "range": [startLine, startCol, endLine, endCol],
+      "replacement": string,
+      "confidence": number
+    }
+  ]
+}
+
+Notes:
+- Line and column numbers are 1-based and refer to the code snippet.
+- `replacement` is the full new text of lines startLine..endLine; use "" to delete them.
+- Do not repeat the input code, and do not add ids, diffs, status or metrics.
+- `confidence` is a float between 0.0 and 1.0.
+- Output a single valid JSON object without Markdown or prose."""
+
+SYSTEM_PROMPT = (
+    "You are CodeReviewAgent. Review the supplied code in the requested style and language. "
+    "Follow all schema requirements exactly and respond with valid JSON only. "
+    "A line like `... (N lines omitted) ...` stands for code left out of the excerpt; do not review it."
+)
+
+# Token counters copied from the response ``usage`` envelope into the review payload.
+USAGE_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_read_input_tokens",
+    "cache_creation_input_tokens",
+)
+
+MULTI_ITEM_INSTRUCTIONS = """The message contains several independent code snippets, each wrapped in
+<item id="..." language="..." style="...">...</item>. Review each snippet on its own in its
+requested style; line numbers restart at 1 inside every item.
+
+Respond with {"reviews": [{"id": "<item id>", ...}]} where each element has the review object
+described above plus the `id` of its item, one element per item in the same order."""
+
+PROMPT_INSTRUCTIONS = {
+    PROMPT_VERSION: REVIEW_PROMPT_INSTRUCTIONS,
+    COMPACT_PROMPT_VERSION: COMPACT_REVIEW_PROMPT_INSTRUCTIONS,
+}
+
+
 class ClaudeReviewError(Exception):
     """Raised when Claude API integration fails."""
 
@@ -78,11 +189,15 @@ class ClaudeReviewError(Exception):
         *,
         status_code: Optional[int] = None,
         cause: Optional[BaseException] = None,
+        retry_after: Optional[float] = None,
+        retryable: Optional[bool] = None,
     ) -> None:
         super().__init__(message)
         self.message = message
         self.status_code = status_code
         self.cause = cause
+        self.retry_after = retry_after
+        self.retryable = retryable
 
     def __str__(self) -> str:  # pragma: no cover - trivial
         return self.message
@@ -92,6 +207,96 @@ class ClaudeReviewError(Exception):
         return self.message
 
 
+class ClaudeCircuitOpenError(ClaudeReviewError):
+    """Raised without contacting the upstream while the circuit breaker is open."""
+
+    def __init__(self, message: str, *, retry_after: Optional[float] = None) -> None:
+        super().__init__(message, retry_after=retry_after, retryable=False)
+
+
+class ClaudeOverloadedError(ClaudeReviewError):
+    """Raised without contacting the upstream when the bulkhead or rate limiter sheds the call."""
+
+    def __init__(self, message: str, *, retry_after: Optional[float] = None) -> None:
+        super().__init__(message, retry_after=retry_after, retryable=False)
+
+
+@lru_cache()
+def get_shared_bulkhead() -> Optional[Bulkhead]:
+    """Process-wide bulkhead shared by every client built from settings."""
+
+    settings = get_settings()
+    if settings.max_concurrent_requests <= 0:
+        return None
+    return Bulkhead(
+        BulkheadOptions(
+            max_concurrent=settings.max_concurrent_requests,
+            max_queue=settings.max_queued_requests,
+            max_wait_seconds=settings.queue_timeout_seconds,
+        )
+    )
+
+
+def build_default_rate_limiter() -> Optional[RateLimiter]:
+    """RPM/TPM limiter for one key; zero limits are learned from response headers."""
+
+    settings = get_settings()
+    if not settings.rate_limit_enabled:
+        return None
+    return RateLimiter(
+        RateLimitOptions(
+            requests_per_minute=settings.rate_limit_rpm,
+            tokens_per_minute=settings.rate_limit_tpm,
+            max_wait_seconds=settings.rate_limit_max_wait_seconds,
+        )
+    )
+
+
+def build_key_pool(
+    keys: Sequence[str],
+    *,
+    rate_limiter_factory: Callable[[], Optional[RateLimiter]] = build_default_rate_limiter,
+) -> ApiKeyPool:
+    settings = get_settings()
+    return ApiKeyPool.from_keys(
+        keys,
+        rate_limiter_factory=rate_limiter_factory,
+        options=ApiKeyPoolOptions(
+            rate_limited_cooldown_seconds=settings.key_cooldown_seconds,
+            unauthorized_cooldown_seconds=settings.key_auth_cooldown_seconds,
+        ),
+    )
+
+
+@lru_cache()
+def get_shared_key_pool() -> ApiKeyPool:
+    """Process-wide pool over ``CLAUDE_API_KEY``/``CLAUDE_API_KEYS``, one rate limiter per key."""
+
+    return build_key_pool(get_settings().api_keys)
+
+
+@dataclass(frozen=True)
+class ReviewBatchEntry:
+    """One review inside a Message Batches submission; ``custom_id`` keys the result."""
+
+    custom_id: str
+    request: "ReviewRequest"
+    language: str
+    style: str
+    code: Optional[str] = None
+
+
+@dataclass
+class _RateReservation:
+    """Tokens held on a key's limiter for one messages call until it is settled."""
+
+    lease: PooledApiKey
+    tokens: int = 0
+    input_tokens: int = 0
+    # A response (of any status) arrived, so the input was at least received upstream.
+    answered: bool = False
+
+
 class ClaudeReviewClient:
     """Lightweight HTTP client for the Claude 3 Haiku messages API."""
 
@@ -99,32 +304,157 @@ class ClaudeReviewClient:
         self,
         *,
         api_key: Optional[str] = None,
+        api_keys: Optional[Sequence[str]] = None,
+        key_pool: Optional[ApiKeyPool] = None,
         base_url: Optional[str] = None,
         model: Optional[str] = None,
         timeout: Optional[int] = None,
         max_attempts: Optional[int] = None,
         retry_delay_seconds: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        bulkhead: Optional[Bulkhead] = None,
+        rate_limiter: Optional[RateLimiter] = None,
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
+        pool_max_size: Optional[int] = None,
+        pool_idle_timeout_seconds: Optional[float] = None,
+        pool_max_lifetime_seconds: Optional[float] = None,
+        prompt_version: Optional[str] = None,
+        token_budget: Optional[int] = None,
+        prompt_cache_enabled: Optional[bool] = None,
     ) -> None:
         settings = get_settings()
 
-        self._api_key = api_key or settings.api_key
+        explicit_keys = list(api_keys or ([api_key] if api_key else []))
+        if key_pool is not None:
+            self._key_pool = key_pool
+        elif explicit_keys:
+            limiter_factory = (lambda: rate_limiter) if rate_limiter is not None else build_default_rate_limiter
+            self._key_pool = build_key_pool(explicit_keys, rate_limiter_factory=limiter_factory)
+        else:
+            self._key_pool = get_shared_key_pool()
         configured_base = (base_url or settings.base_url).rstrip("/")
         if configured_base.endswith("/v1/messages"):
             configured_base = configured_base[: -len("/v1/messages")]
         self._base_url = configured_base.rstrip("/")
+        self._messages_path = f"{urlsplit(self._base_url).path.rstrip('/')}/v1/messages"
+        self._batches_path = f"{self._messages_path}/batches"
         self._model = model or settings.model
         self._timeout = timeout or settings.timeout_seconds
-        self._max_attempts = max(1, max_attempts or settings.max_attempts)
-        self._retry_delay = max(0.0, retry_delay_seconds or settings.retry_delay_seconds)
+        self._retry_policy = retry_policy or RetryPolicy(
+            max_attempts=max(1, max_attempts or settings.max_attempts),
+            base_delay=max(0.0, retry_delay_seconds or settings.retry_delay_seconds),
+            max_delay=settings.retry_max_delay_seconds,
+            budget_seconds=settings.retry_budget_seconds,
+        )
         self._max_tokens = max_tokens or settings.max_tokens
         self._temperature = temperature if temperature is not None else settings.temperature
+        self._prompt_version = prompt_version or settings.prompt_version
+        if self._prompt_version not in PROMPT_INSTRUCTIONS:
+            logger.warning("알 수 없는 프롬프트 버전 %s, %s를 사용합니다.", self._prompt_version, PROMPT_VERSION)
+            self._prompt_version = PROMPT_VERSION
+        self._batch_poll_seconds = settings.batch_poll_seconds
+        self._batch_timeout_seconds = settings.batch_timeout_seconds
+        self._prompt_cache_enabled = (
+            prompt_cache_enabled if prompt_cache_enabled is not None else settings.prompt_cache_enabled
+        )
+        self._prompt_builder = PromptBuilder(
+            system_prompt=SYSTEM_PROMPT,
+            instructions=PROMPT_INSTRUCTIONS[self._prompt_version],
+            max_output_tokens=self._max_tokens,
+            token_budget=token_budget if token_budget is not None else settings.token_budget,
+        )
+        self._multi_prompt_builder = PromptBuilder(
+            system_prompt=SYSTEM_PROMPT,
+            instructions=f"{PROMPT_INSTRUCTIONS[self._prompt_version]}\n\n{MULTI_ITEM_INSTRUCTIONS}",
+            max_output_tokens=self._max_tokens,
+            token_budget=token_budget if token_budget is not None else settings.token_budget,
+        )
+        self._cache_single_prefix = self._prompt_cache_enabled and self._prefix_cacheable(self._prompt_builder)
+        self._cache_multi_prefix = self._prompt_cache_enabled and self._prefix_cacheable(self._multi_prompt_builder)
+
+        pool_options = {
+            "timeout": self._timeout,
+            "max_size": pool_max_size if pool_max_size is not None else settings.pool_max_size,
+            "idle_timeout": (
+                pool_idle_timeout_seconds
+                if pool_idle_timeout_seconds is not None
+                else settings.pool_idle_timeout_seconds
+            ),
+            "max_lifetime": (
+                pool_max_lifetime_seconds
+                if pool_max_lifetime_seconds is not None
+                else settings.pool_max_lifetime_seconds
+            ),
+        }
+        self._breaker = circuit_breaker or self._build_default_breaker(settings)
+        self._bulkhead = bulkhead if bulkhead is not None else get_shared_bulkhead()
+        origin = Origin.from_url(self._base_url)
+        self._pool = HttpConnectionPool(origin, **pool_options)
+        self._async_pool = AsyncConnectionPool(origin, **pool_options)
+
+    def _prefix_cacheable(self, builder: PromptBuilder) -> bool:
+        """Whether ``builder``'s static prefix is long enough for the model's prompt cache."""
+
+        minimum = min_cacheable_tokens(self._model)
+        if builder.static_tokens >= minimum:
+            return True
+        key = (self._model, self._prompt_version, builder.static_tokens)
+        if key not in _UNCACHEABLE_PREFIXES_LOGGED:
+            _UNCACHEABLE_PREFIXES_LOGGED.add(key)
+            logger.info(
+                "정적 프롬프트(약 %s 토큰)가 %s의 최소 캐시 길이(%s 토큰)보다 짧아 cache_control을 생략합니다.",
+                builder.static_tokens,
+                self._model,
+                minimum,
+            )
+        return False
 
     @property
     def model_name(self) -> str:
         return self._model
 
+    @property
+    def prompt_version(self) -> str:
+        return self._prompt_version
+
+    def transport_stats(self) -> Dict[str, Dict[str, int]]:
+        """Return connection reuse counters for the sync and async pools."""
+
+        return {
+            "sync": self._pool.stats.as_dict(),
+            "async": self._async_pool.stats.as_dict(),
+        }
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        return self._breaker
+
+    @property
+    def key_pool(self) -> ApiKeyPool:
+        return self._key_pool
+
+    @property
+    def bulkhead(self) -> Optional[Bulkhead]:
+        return self._bulkhead
+
+    def stats(self) -> Dict[str, Any]:
+        """Return breaker, bulkhead and transport counters for metrics/health endpoints."""
+
+        return {
+            "circuitBreaker": self._breaker.snapshot() if self._breaker is not None else None,
+            "bulkhead": self._bulkhead.snapshot() if self._bulkhead is not None else None,
+            "apiKeys": self._key_pool.snapshot(),
+            "transport": self.transport_stats(),
+        }
+
+    def close(self) -> None:
+        self._pool.close()
+
+    async def aclose(self) -> None:
+        await self._async_pool.close()
+
     def create_review(
         self,
         request: "ReviewRequest",
@@ -132,8 +462,174 @@ class ClaudeReviewClient:
         language: str,
         style: str,
         code: str | None = None,
+        budget_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
-        """Request a structured review payload from Claude."""
+        """Request a structured review payload from Claude.
+
+        ``budget_seconds`` caps the wall-clock time spent across retries and
+        defaults to the retry policy budget.
+        """
+
+        payload = self._build_payload(
+            request,
+            language=language,
+            style=style,
+            code=code or request.code,
+        )
+
+        return self._with_retries(lambda: self._send(payload), budget_seconds=budget_seconds)
+
+    async def acreate_review(
+        self,
+        request: "ReviewRequest",
+        *,
+        language: str,
+        style: str,
+        code: str | None = None,
+        budget_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`create_review` that never blocks the event loop."""
+
+        payload = self._build_payload(
+            request,
+            language=language,
+            style=style,
+            code=code or request.code,
+        )
+
+        return await self._awith_retries(lambda: self._asend(payload), budget_seconds=budget_seconds)
+
+    async def acreate_review_many(
+        self,
+        entries: Sequence[ReviewBatchEntry],
+    ) -> List[Union[Dict[str, Any], ClaudeReviewError]]:
+        """Review several small inputs in a single message (micro-batching).
+
+        Returns one payload or :class:`ClaudeReviewError` per entry, in order; an
+        item missing from the answer fails alone. A failed call fails every entry.
+        """
+
+        prompt = self._multi_prompt_builder.build_many(
+            [
+                (entry.custom_id, entry.language, entry.style, entry.code or entry.request.code)
+                for entry in entries
+            ]
+        )
+        payload = {
+            "model": self._model,
+            "max_tokens": prompt.max_tokens,
+            "temperature": self._temperature,
+            "system": prompt.system_blocks(cache=self._cache_multi_prefix),
+            "messages": [{"role": "user", "content": [{"type": "text", "text": prompt.body}]}],
+        }
+        combined = await self._awith_retries(lambda: self._asend(payload))
+
+        reviews = combined.get("reviews")
+        by_id: Dict[str, Dict[str, Any]] = {}
+        if isinstance(reviews, list):
+            for review in reviews:
+                if isinstance(review, dict) and isinstance(review.get("id"), str):
+                    by_id[review["id"]] = {key: value for key, value in review.items() if key != "id"}
+
+        return [
+            by_id.get(entry.custom_id)
+            or ClaudeReviewError(f"Claude 응답에 항목 {entry.custom_id}의 리뷰가 없습니다.")
+            for entry in entries
+        ]
+
+    def run_review_batch(
+        self,
+        entries: Sequence[ReviewBatchEntry],
+        *,
+        poll_interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Union[Dict[str, Any], ClaudeReviewError]]:
+        """Review ``entries`` through the Message Batches API and wait for the results.
+
+        Returns a payload (as :meth:`create_review` would) or a
+        :class:`ClaudeReviewError` per ``custom_id``. Batches trade latency (up to
+        hours) for lower cost and a separate rate-limit pool.
+        """
+
+        batch_id = self.submit_review_batch(entries)
+        interval = poll_interval if poll_interval is not None else self._batch_poll_seconds
+        deadline = time.monotonic() + (timeout if timeout is not None else self._batch_timeout_seconds)
+        while True:
+            batch = self.get_review_batch(batch_id)
+            if batch.get("processing_status") == "ended":
+                return self.fetch_review_batch_results(batch)
+            if time.monotonic() + interval > deadline:
+                raise ClaudeReviewError(
+                    f"Claude 배치 {batch_id}가 제한 시간 안에 끝나지 않았습니다.",
+                    retryable=False,
+                )
+            time.sleep(interval)
+
+    def submit_review_batch(self, entries: Sequence[ReviewBatchEntry]) -> str:
+        requests = [
+            {
+                "custom_id": entry.custom_id,
+                "params": self._build_payload(
+                    entry.request,
+                    language=entry.language,
+                    style=entry.style,
+                    code=entry.code or entry.request.code,
+                ),
+            }
+            for entry in entries
+        ]
+        data, _, headers = self._prepare_request({"requests": requests})
+        batch = self._with_retries(
+            lambda: self._parse_json(self._exchange("POST", self._batches_path, headers=headers, body=data))
+        )
+        batch_id = batch.get("id")
+        if not isinstance(batch_id, str) or not batch_id:
+            raise ClaudeReviewError("Claude 배치 응답에 id가 없습니다.")
+        logger.info("Claude 배치 %s 제출 (%s건)", batch_id, len(requests))
+        return batch_id
+
+    def get_review_batch(self, batch_id: str) -> Dict[str, Any]:
+        _, _, headers = self._prepare_request(None)
+        path = f"{self._batches_path}/{batch_id}"
+        return self._with_retries(
+            lambda: self._parse_json(self._exchange("GET", path, headers=headers, body=b""))
+        )
+
+    def fetch_review_batch_results(
+        self,
+        batch: Dict[str, Any],
+    ) -> Dict[str, Union[Dict[str, Any], ClaudeReviewError]]:
+        _, _, headers = self._prepare_request(None)
+        path = self._results_path(batch)
+        raw = self._with_retries(lambda: self._exchange("GET", path, headers=headers, body=b""))
+
+        results: Dict[str, Union[Dict[str, Any], ClaudeReviewError]] = {}
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            custom_id = entry.get("custom_id")
+            if isinstance(custom_id, str):
+                results[custom_id] = self._batch_outcome(entry.get("result") or {})
+        return results
+
+    async def astream_review(
+        self,
+        request: "ReviewRequest",
+        *,
+        language: str,
+        style: str,
+        code: str | None = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a review, yielding each suggestion as soon as Claude finishes it.
+
+        Yields ``{"type": "suggestion", "suggestion": {...}}`` events followed by a
+        single ``{"type": "complete", "payload": {...}}`` holding the full review.
+        Retries only happen before the first byte of the stream is received.
+        """
 
         payload = self._build_payload(
             request,
@@ -141,22 +637,131 @@ class ClaudeReviewClient:
             style=style,
             code=code or request.code,
         )
+        payload["stream"] = True
 
-        last_error: Optional[ClaudeReviewError] = None
-        for attempt in range(1, self._max_attempts + 1):
+        parser = SuggestionStreamParser()
+        usage: Dict[str, Any] = {}
+        # The stream occupies an upstream slot until its last byte is read.
+        result: Optional[Dict[str, Any]] = None
+        async with self._aupstream_slot():
+            connection, head, reservation = await self._open_stream(payload)
             try:
-                return self._send(payload)
-            except ClaudeReviewError as exc:
-                last_error = exc
-                if attempt < self._max_attempts:
-                    time.sleep(self._retry_delay)
+                async for event, data in iter_sse_events(
+                    connection.iter_body(head, idle_timeout=self._timeout)
+                ):
+                    if event == "message_stop":
+                        break
+                    if event == "error":
+                        raise ClaudeReviewError(f"Claude API 스트림 오류: {data}")
+                    if event not in {"content_block_delta", "message_start", "message_delta"}:
+                        continue
+                    try:
+                        message = json.loads(data)
+                    except json.JSONDecodeError:
+                        continue
+                    if not isinstance(message, dict):
+                        continue
+                    if event == "message_start":
+                        usage.update((message.get("message") or {}).get("usage") or {})
+                        continue
+                    if event == "message_delta":
+                        usage.update(message.get("usage") or {})
+                        continue
+                    delta = message.get("delta") or {}
+                    if delta.get("type") != "text_delta":
+                        continue
+                    for element in parser.feed(delta.get("text", "")):
+                        yield {"type": "suggestion", "suggestion": element}
+            except AsyncHttpError as exc:
+                self._settle_usage(reservation, None)
+                raise ClaudeReviewError("Claude API 스트림이 중단되었습니다.", cause=exc) from exc
+            except BaseException:
+                self._settle_usage(reservation, None)
+                raise
+            finally:
+                await connection.close()
 
-        if last_error is not None:
-            raise last_error
-        raise ClaudeReviewError("Claude API 호출에 실패했습니다.")
+        envelope = {"content": [{"type": "text", "text": parser.text}], "usage": usage}
+        try:
+            result = self._extract_review_payload(envelope)
+        finally:
+            self._settle_usage(reservation, result)
+        yield {"type": "complete", "payload": result}
 
     # ------------------------------------------------------------------
 
+    async def _open_stream(
+        self,
+        payload: Dict[str, Any],
+    ) -> Tuple[AsyncHttpConnection, HttpResponse, _RateReservation]:
+        schedule = self._retry_policy.start()
+        while True:
+            try:
+                lease = self._acquire_key()
+                reservation = await self._apace(payload, lease)
+                try:
+                    connection, head = await self._aopen_stream_once(payload, lease)
+                except ClaudeReviewError as exc:
+                    reservation.answered = exc.status_code is not None
+                    self._settle_usage(reservation, None)
+                    raise
+                reservation.answered = True
+                return connection, head, reservation
+            except ClaudeReviewError as exc:
+                delay = schedule.next_delay(exc)
+                if delay is None:
+                    raise
+                logger.info("Claude API 스트림 재시도 %s회차, %.2f초 대기: %s", schedule.attempts, delay, exc)
+                await asyncio.sleep(delay)
+
+    async def _aopen_stream_once(
+        self,
+        payload: Dict[str, Any],
+        lease: PooledApiKey,
+    ) -> Tuple[AsyncHttpConnection, HttpResponse]:
+        data, path, headers = self._prepare_request(payload, lease)
+        headers["Accept"] = "text/event-stream"
+        self._admit()
+
+        started = time.monotonic()
+        try:
+            connection, head = await self._async_pool.open_stream("POST", path, headers=headers, body=data)
+        except AsyncHttpError as exc:
+            self._record_outcome(started, status_code=None)
+            raise ClaudeReviewError("Claude API 네트워크 오류", cause=exc) from exc
+        except BaseException:
+            self._release_admission()
+            raise
+        self._record_outcome(started, status_code=head.status)
+        self._observe_rate_limits(lease, head.headers)
+
+        if head.status >= 400:
+            try:
+                body = b"".join([piece async for piece in connection.iter_body(head, idle_timeout=self._timeout)])
+            except AsyncHttpError:
+                body = b""
+            finally:
+                await connection.close()
+            raise self._key_error(lease, head.status, body.decode("utf-8", errors="ignore"), head.headers)
+
+        return connection, head
+
+    @staticmethod
+    def _build_default_breaker(settings: ClaudeSettings) -> Optional[CircuitBreaker]:
+        if not settings.breaker_enabled:
+            return None
+        return CircuitBreaker(
+            CircuitBreakerOptions(
+                window_seconds=settings.breaker_window_seconds,
+                min_calls=settings.breaker_min_calls,
+                error_rate_threshold=settings.breaker_error_rate,
+                slow_call_seconds=settings.breaker_slow_call_seconds,
+                slow_call_rate_threshold=settings.breaker_slow_call_rate,
+                open_seconds=settings.breaker_open_seconds,
+                half_open_max_calls=settings.breaker_half_open_calls,
+            )
+        )
+
     def _build_payload(
         self,
         request: "ReviewRequest",
@@ -165,78 +770,339 @@ class ClaudeReviewClient:
         style: str,
         code: str,
     ) -> Dict[str, Any]:
-        request_snapshot = {
-            "code": code,
-            "language": request.language,
-            "resolvedLanguage": language,
-            "style": style,
-        }
-        user_prompt_lines = [
-            REVIEW_PROMPT_INSTRUCTIONS,
-            "",
-            "Review request context:",
-            json.dumps(request_snapshot, ensure_ascii=True, indent=2),
-            "Code snippet:",
-            f"```{language or 'text'}\n{code}\n```",
-        ]
-
-        system_prompt = (
-            "You are CodeReviewAgent. Review the supplied code in the requested style and language. "
-            "Follow all schema requirements exactly and respond with valid JSON only."
-        )
+        prompt = self._prompt_builder.build(language=language, style=style, code=code)
+        if prompt.truncated_lines:
+            logger.info(
+                "토큰 예산(%s)에 맞춰 코드 %s줄을 제외했습니다.",
+                self._prompt_builder.token_budget,
+                prompt.truncated_lines,
+            )
 
         return {
             "model": self._model,
-            "max_tokens": self._max_tokens,
+            "max_tokens": prompt.max_tokens,
             "temperature": self._temperature,
-            "system": system_prompt,
+            "system": prompt.system_blocks(cache=self._cache_single_prefix),
             "messages": [
                 {
                     "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": "\n".join(user_prompt_lines),
-                        }
-                    ],
+                    "content": [{"type": "text", "text": prompt.body}],
                 },
             ],
         }
 
-    def _send(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        if not self._api_key:
-            raise ClaudeReviewError("Claude API 키가 설정되어 있지 않습니다.")
+    async def _awith_retries(
+        self,
+        call: Callable[[], Awaitable[T]],
+        *,
+        budget_seconds: Optional[float] = None,
+    ) -> T:
+        schedule = self._retry_policy.start(budget_seconds=budget_seconds)
+        while True:
+            try:
+                return await call()
+            except ClaudeReviewError as exc:
+                delay = schedule.next_delay(exc)
+                if delay is None:
+                    raise
+                logger.info("Claude API 재시도 %s회차, %.2f초 대기: %s", schedule.attempts, delay, exc)
+                await asyncio.sleep(delay)
 
-        data = json.dumps(payload).encode("utf-8")
-        url = f"{self._base_url}/v1/messages"
-        headers = {
-            "Content-Type": "application/json",
-            "x-api-key": self._api_key,
-            "anthropic-version": "2023-06-01",
-        }
+    def _with_retries(self, call: Callable[[], T], *, budget_seconds: Optional[float] = None) -> T:
+        schedule = self._retry_policy.start(budget_seconds=budget_seconds)
+        while True:
+            try:
+                return call()
+            except ClaudeReviewError as exc:
+                delay = schedule.next_delay(exc)
+                if delay is None:
+                    raise
+                logger.info("Claude API 재시도 %s회차, %.2f초 대기: %s", schedule.attempts, delay, exc)
+                time.sleep(delay)
 
-        request = Request(url=url, data=data, headers=headers, method="POST")
+    def _results_path(self, batch: Dict[str, Any]) -> str:
+        results_url = batch.get("results_url")
+        if isinstance(results_url, str) and results_url:
+            parts = urlsplit(results_url)
+            if not parts.netloc or parts.netloc == urlsplit(self._base_url).netloc:
+                return parts.path + (f"?{parts.query}" if parts.query else "")
+        return f"{self._batches_path}/{batch.get('id')}/results"
 
-        try:
-            with urlopen(request, timeout=self._timeout) as response:
-                raw_body = response.read().decode("utf-8")
-        except HTTPError as exc:  # pragma: no cover - network failure handling
-            error_body = exc.read().decode("utf-8", errors="ignore") if exc.fp else ""
-            message = f"Claude API HTTP 오류 {exc.code}"
-            if error_body:
-                message = f"{message}: {error_body}"
-            raise ClaudeReviewError(message, status_code=exc.code, cause=exc) from exc
-        except URLError as exc:  # pragma: no cover - network failure handling
-            raise ClaudeReviewError("Claude API 네트워크 오류", cause=exc) from exc
-        except Exception as exc:  # pragma: no cover - defensive catch-all
-            raise ClaudeReviewError("Claude API 호출 중 알 수 없는 오류가 발생했습니다.", cause=exc) from exc
+    def _batch_outcome(self, result: Dict[str, Any]) -> Union[Dict[str, Any], ClaudeReviewError]:
+        result_type = result.get("type")
+        if result_type == "succeeded":
+            try:
+                return self._extract_review_payload(result.get("message") or {})
+            except ClaudeReviewError as exc:
+                return exc
+        if result_type == "errored":
+            return ClaudeReviewError(f"Claude 배치 요청 오류: {result.get('error')}", retryable=False)
+        return ClaudeReviewError(f"Claude 배치 요청이 처리되지 않았습니다: {result_type}", retryable=False)
 
+    @staticmethod
+    def _parse_json(raw_body: str) -> Dict[str, Any]:
         try:
-            envelope = json.loads(raw_body)
+            parsed = json.loads(raw_body)
         except json.JSONDecodeError as exc:
             raise ClaudeReviewError("Claude API 응답을 JSON으로 파싱할 수 없습니다.", cause=exc) from exc
+        if not isinstance(parsed, dict):
+            raise ClaudeReviewError("Claude API 응답이 객체 형태가 아닙니다.")
+        return parsed
 
-        return self._extract_review_payload(envelope)
+    def _send(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        lease = self._acquire_key()
+        data, path, headers = self._prepare_request(payload, lease)
+        reservation = self._pace(payload, lease)
+        result: Optional[Dict[str, Any]] = None
+        try:
+            raw_body = self._exchange("POST", path, headers=headers, body=data, lease=lease)
+            reservation.answered = True
+            result = self._parse_envelope(raw_body)
+        except ClaudeReviewError as exc:
+            reservation.answered = reservation.answered or exc.status_code is not None
+            raise
+        finally:
+            self._settle_usage(reservation, result)
+        return result
+
+    def _exchange(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: Dict[str, str],
+        body: bytes,
+        lease: Optional[PooledApiKey] = None,
+    ) -> str:
+        """Send one request; ``lease`` marks a live messages call that feeds the key's limiter."""
+
+        with self._upstream_slot():
+            self._admit()
+
+            started = time.monotonic()
+            try:
+                response = self._pool.request(method, path, headers=headers, body=body)
+            except (http.client.HTTPException, OSError) as exc:  # pragma: no cover - network failure handling
+                self._record_outcome(started, status_code=None)
+                raise ClaudeReviewError("Claude API 네트워크 오류", cause=exc) from exc
+            except Exception as exc:  # pragma: no cover - defensive catch-all
+                self._record_outcome(started, status_code=None)
+                raise ClaudeReviewError("Claude API 호출 중 알 수 없는 오류가 발생했습니다.", cause=exc) from exc
+            except BaseException:
+                self._release_admission()
+                raise
+            self._record_outcome(started, status_code=response.status)
+        if lease is not None:
+            self._observe_rate_limits(lease, response.headers)
+
+        raw_body = response.body.decode("utf-8", errors="ignore")
+        if response.status >= 400:
+            if lease is None:
+                raise self._http_error(response.status, raw_body, headers=response.headers)
+            raise self._key_error(lease, response.status, raw_body, response.headers)
+        return raw_body
+
+    async def _asend(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        lease = self._acquire_key()
+        data, path, headers = self._prepare_request(payload, lease)
+        reservation = await self._apace(payload, lease)
+        result: Optional[Dict[str, Any]] = None
+        try:
+            async with self._aupstream_slot():
+                self._admit()
+
+                started = time.monotonic()
+                try:
+                    response = await self._async_pool.request("POST", path, headers=headers, body=data)
+                except AsyncHttpError as exc:
+                    self._record_outcome(started, status_code=None)
+                    raise ClaudeReviewError("Claude API 네트워크 오류", cause=exc) from exc
+                except Exception as exc:  # pragma: no cover - defensive catch-all
+                    self._record_outcome(started, status_code=None)
+                    raise ClaudeReviewError("Claude API 호출 중 알 수 없는 오류가 발생했습니다.", cause=exc) from exc
+                except BaseException:
+                    self._release_admission()
+                    raise
+                self._record_outcome(started, status_code=response.status)
+            reservation.answered = True
+            self._observe_rate_limits(lease, response.headers)
+
+            raw_body = response.body.decode("utf-8", errors="ignore")
+            if response.status >= 400:
+                raise self._key_error(lease, response.status, raw_body, response.headers)
+
+            result = self._parse_envelope(raw_body)
+        finally:
+            self._settle_usage(reservation, result)
+        return result
+
+    def _acquire_key(self) -> PooledApiKey:
+        if not len(self._key_pool):
+            raise ClaudeReviewError("Claude API 키가 설정되어 있지 않습니다.", retryable=False)
+        try:
+            return self._key_pool.acquire()
+        except ApiKeyPoolExhaustedError as exc:
+            raise ClaudeOverloadedError(exc.message, retry_after=exc.retry_after) from exc
+
+    def _key_error(
+        self,
+        lease: PooledApiKey,
+        status_code: int,
+        error_body: str,
+        headers: Optional[Dict[str, str]],
+    ) -> ClaudeReviewError:
+        error = self._http_error(status_code, error_body, headers=headers)
+        self._key_pool.report(lease, status_code, error.retry_after)
+        if status_code in RATE_LIMITED_STATUSES and self._key_pool.has_available():
+            # Another key has capacity, so the retry need not honour this key's Retry-After.
+            error.retry_after = None
+        return error
+
+    def _pace(self, payload: Dict[str, Any], lease: PooledApiKey) -> _RateReservation:
+        """Wait until the key's rate limiter admits ``payload``; return the reservation to settle."""
+
+        reservation, delay = self._reserve_rate(payload, lease)
+        if delay > 0:
+            time.sleep(delay)
+        return reservation
+
+    async def _apace(self, payload: Dict[str, Any], lease: PooledApiKey) -> _RateReservation:
+        reservation, delay = self._reserve_rate(payload, lease)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return reservation
+
+    def _reserve_rate(self, payload: Dict[str, Any], lease: PooledApiKey) -> Tuple[_RateReservation, float]:
+        if lease.rate_limiter is None:
+            return _RateReservation(lease), 0.0
+        texts = [block.get("text", "") for block in payload.get("system") or []]
+        for message in payload.get("messages") or []:
+            texts.extend(block.get("text", "") for block in message.get("content") or [])
+        input_tokens = sum(estimate_tokens(text) for text in texts)
+        # Output is reserved at its ceiling and refunded once the real usage is known.
+        tokens = input_tokens + int(payload.get("max_tokens") or 0)
+        try:
+            delay = lease.rate_limiter.reserve(tokens)
+        except RateLimitExceededError as exc:
+            raise ClaudeOverloadedError(exc.message, retry_after=exc.retry_after) from exc
+        return _RateReservation(lease, tokens=tokens, input_tokens=input_tokens), delay
+
+    @staticmethod
+    def _settle_usage(reservation: _RateReservation, result: Optional[Dict[str, Any]]) -> None:
+        """Correct the reservation with the real usage, or refund it when the call failed.
+
+        A failed call keeps only its input estimate when a response arrived
+        (the request reached the API) and nothing when it never got one, so
+        retries during an outage do not drain the key's token bucket.
+        """
+
+        limiter = reservation.lease.rate_limiter
+        if limiter is None:
+            return
+        if result is None:
+            limiter.settle(reservation.tokens, reservation.input_tokens if reservation.answered else 0)
+            return
+        usage = result.get("usage") or {}
+        counted = [usage.get(field) for field in ("input_tokens", "output_tokens", "cache_creation_input_tokens")]
+        used = sum(value for value in counted if isinstance(value, int)) if usage else None
+        limiter.settle(reservation.tokens, used)
+
+    @staticmethod
+    def _observe_rate_limits(lease: PooledApiKey, headers: Optional[Dict[str, str]]) -> None:
+        if lease.rate_limiter is not None and headers:
+            lease.rate_limiter.update_from_headers(headers)
+
+    @contextmanager
+    def _upstream_slot(self) -> Iterator[None]:
+        if self._bulkhead is None:
+            yield
+            return
+        try:
+            self._bulkhead.acquire()
+        except BulkheadFullError as exc:
+            raise ClaudeOverloadedError(exc.message, retry_after=exc.retry_after) from exc
+        try:
+            yield
+        finally:
+            self._bulkhead.release()
+
+    @asynccontextmanager
+    async def _aupstream_slot(self) -> AsyncIterator[None]:
+        if self._bulkhead is None:
+            yield
+            return
+        try:
+            await self._bulkhead.aacquire()
+        except BulkheadFullError as exc:
+            raise ClaudeOverloadedError(exc.message, retry_after=exc.retry_after) from exc
+        try:
+            yield
+        finally:
+            self._bulkhead.release()
+
+    def _admit(self) -> None:
+        if self._breaker is None or self._breaker.allow():
+            return
+        raise ClaudeCircuitOpenError(
+            "Claude API 장애로 회로 차단기가 열려 있어 호출을 건너뜁니다.",
+            retry_after=self._breaker.retry_in(),
+        )
+
+    def _release_admission(self) -> None:
+        """Free an admitted call that was cancelled before it produced an outcome."""
+
+        if self._breaker is not None:
+            self._breaker.release()
+
+    def _record_outcome(self, started: float, *, status_code: Optional[int]) -> None:
+        if self._breaker is None:
+            return
+        latency = time.monotonic() - started
+        # Client errors say nothing about upstream health; only outages and overload count.
+        if status_code is None or status_code == 429 or status_code >= 500:
+            self._breaker.record_failure(latency)
+        else:
+            self._breaker.record_success(latency)
+
+    def _prepare_request(
+        self,
+        payload: Optional[Dict[str, Any]],
+        lease: Optional[PooledApiKey] = None,
+    ) -> tuple[bytes, str, Dict[str, str]]:
+        # Message Batches stay on the primary key: a batch is only visible to its workspace.
+        lease = lease or self._key_pool.primary
+        if lease is None:
+            raise ClaudeReviewError("Claude API 키가 설정되어 있지 않습니다.", retryable=False)
+
+        data = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        headers = {
+            "Content-Type": "application/json",
+            "x-api-key": lease.key,
+            "anthropic-version": "2023-06-01",
+        }
+        return data, self._messages_path, headers
+
+    @staticmethod
+    def _http_error(
+        status_code: int,
+        error_body: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        cause: Optional[BaseException] = None,
+    ) -> ClaudeReviewError:
+        message = f"Claude API HTTP 오류 {status_code}"
+        if error_body:
+            message = f"{message}: {error_body}"
+        retry_after = parse_retry_after((headers or {}).get("retry-after"))
+        return ClaudeReviewError(
+            message,
+            status_code=status_code,
+            cause=cause,
+            retry_after=retry_after,
+        )
+
+    def _parse_envelope(self, raw_body: str) -> Dict[str, Any]:
+        return self._extract_review_payload(self._parse_json(raw_body))
 
     def _extract_review_payload(self, envelope: Dict[str, Any]) -> Dict[str, Any]:
         content = envelope.get("content")
@@ -260,13 +1126,30 @@ class ClaudeReviewClient:
             raise ClaudeReviewError("Claude API 응답 JSON 형식이 올바르지 않습니다.", cause=exc) from exc
 
         if "data" in payload and isinstance(payload["data"], dict):
-            return payload["data"]
+            payload = payload["data"]
 
         if not isinstance(payload, dict):
             raise ClaudeReviewError("Claude API 응답이 객체 형태가 아닙니다.")
 
+        usage = self._read_usage(envelope.get("usage"))
+        if usage:
+            logger.info(
+                "Claude 토큰 사용량 input=%s output=%s cache_read=%s cache_creation=%s",
+                *(usage.get(field) for field in USAGE_FIELDS),
+            )
+            payload["usage"] = usage
         return payload
 
+    @staticmethod
+    def _read_usage(raw: Any) -> Dict[str, int]:
+        if not isinstance(raw, dict):
+            return {}
+        return {
+            field: raw[field]
+            for field in USAGE_FIELDS
+            if isinstance(raw.get(field), int) and raw[field] >= 0
+        }
+
     @staticmethod
     def _strip_code_fences(text: str) -> str:
         if not text.startswith("```"):
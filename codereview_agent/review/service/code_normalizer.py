@@ -0,0 +1,170 @@
+"""Canonical form of source code for near-duplicate cache keys, with a line map back."""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from codereview_agent.review.models import Suggestion
+from codereview_agent.review.service.chunking import remap_suggestion_lines
+
+_LINE_BREAK_PATTERN = re.compile(r"\r\n|\r|\n")
+
+
+@dataclass(frozen=True)
+class NormalizationOptions:
+    strip_comments: bool = False
+
+
+@dataclass(frozen=True)
+class CommentSyntax:
+    line_markers: Tuple[str, ...]
+    block: Optional[Tuple[str, str]] = None
+    # Longest delimiters first so triple quotes win over single ones.
+    quotes: Tuple[str, ...] = ('"', "'")
+    multiline_quotes: Tuple[str, ...] = ()
+
+
+_C_LIKE = CommentSyntax(line_markers=("//",), block=("/*", "*/"))
+_JS_LIKE = CommentSyntax(
+    line_markers=("//",),
+    block=("/*", "*/"),
+    quotes=('"', "'", "`"),
+    multiline_quotes=("`",),
+)
+_HASH = CommentSyntax(line_markers=("#",))
+_PYTHON = CommentSyntax(
+    line_markers=("#",),
+    quotes=('"""', "'''", '"', "'"),
+    multiline_quotes=('"""', "'''"),
+)
+_SQL = CommentSyntax(line_markers=("--",), block=("/*", "*/"), quotes=("'", '"'))
+
+COMMENT_SYNTAX: Dict[str, CommentSyntax] = {
+    **dict.fromkeys(("javascript", "js", "jsx", "typescript", "ts", "tsx"), _JS_LIKE),
+    **dict.fromkeys(
+        ("java", "c", "cpp", "c++", "csharp", "c#", "go", "rust", "kotlin", "swift", "scala", "php", "dart"),
+        _C_LIKE,
+    ),
+    **dict.fromkeys(("python", "py"), _PYTHON),
+    **dict.fromkeys(("ruby", "rb", "shell", "bash", "sh", "yaml", "yml", "toml", "perl", "r"), _HASH),
+    "sql": _SQL,
+}
+
+
+@dataclass(frozen=True)
+class NormalizedCode:
+    """Canonical text plus, for every canonical line, the original line it came from.
+
+    ``line_map[i]`` is the 1-based original line number of canonical line
+    ``i + 1``; it is strictly increasing because lines are only ever dropped.
+    """
+
+    text: str
+    line_map: Tuple[int, ...]
+
+    def original_line(self, line: int) -> Optional[int]:
+        if 1 <= line <= len(self.line_map):
+            return self.line_map[line - 1]
+        return None
+
+    def canonical_line(self, line: int, *, floor: bool = False) -> Optional[int]:
+        """Canonical line for original ``line``; with ``floor`` a dropped line maps to the kept line above it."""
+
+        index = bisect_right(self.line_map, line)
+        if index and (floor or self.line_map[index - 1] == line):
+            return index
+        return None
+
+    def to_canonical(self, suggestions: Iterable[Suggestion]) -> List[Suggestion]:
+        """Move suggestions from original coordinates onto the canonical text."""
+
+        return remap_suggestion_lines(
+            suggestions, self.canonical_line, lambda line: self.canonical_line(line, floor=True)
+        )
+
+    def to_original(self, suggestions: Iterable[Suggestion]) -> List[Suggestion]:
+        """Move suggestions from canonical coordinates back onto this input's own lines."""
+
+        return remap_suggestion_lines(suggestions, self.original_line, self.original_line)
+
+
+def normalize_code(code: str, language: str, *, strip_comments: bool = False) -> NormalizedCode:
+    """Canonicalize ``code`` so inputs that only differ cosmetically share a key.
+
+    Line endings become ``\\n``, trailing whitespace and blank lines are dropped
+    and, with ``strip_comments``, so are lines holding nothing but comments for
+    languages listed in ``COMMENT_SYNTAX``. Lines mixing code and comments are
+    kept whole: every canonical line is then text the input really contains, so
+    cached columns and fix snippets stay valid for any input sharing the key.
+    Indentation is kept because it is significant in some languages and
+    suggestion columns depend on it.
+    """
+
+    syntax = COMMENT_SYNTAX.get(language.lower()) if strip_comments else None
+    scanner = _CommentScanner(syntax) if syntax is not None else None
+    kept: List[str] = []
+    line_map: List[int] = []
+    for number, line in enumerate(_LINE_BREAK_PATTERN.split(code), start=1):
+        if scanner is not None and not scanner.strip(line).strip():
+            continue
+        line = line.rstrip()
+        if line:
+            kept.append(line)
+            line_map.append(number)
+    return NormalizedCode(text="\n".join(kept), line_map=tuple(line_map))
+
+
+class _CommentScanner:
+    """Remove comments line by line while tracking strings and block comments across lines."""
+
+    def __init__(self, syntax: CommentSyntax) -> None:
+        self._syntax = syntax
+        self._in_block = False
+        self._quote: Optional[str] = None
+
+    def strip(self, line: str) -> str:
+        syntax = self._syntax
+        out: List[str] = []
+        index = 0
+        length = len(line)
+        while index < length:
+            if self._in_block:
+                close = line.find(syntax.block[1], index)  # type: ignore[index]
+                if close < 0:
+                    break
+                index = close + len(syntax.block[1])  # type: ignore[index]
+                self._in_block = False
+                continue
+            if self._quote is not None:
+                if line[index] == "\\":
+                    out.append(line[index : index + 2])
+                    index += 2
+                elif line.startswith(self._quote, index):
+                    out.append(self._quote)
+                    index += len(self._quote)
+                    self._quote = None
+                else:
+                    out.append(line[index])
+                    index += 1
+                continue
+            if syntax.block is not None and line.startswith(syntax.block[0], index):
+                self._in_block = True
+                index += len(syntax.block[0])
+                continue
+            if any(line.startswith(marker, index) for marker in syntax.line_markers):
+                break
+            quote = next((quote for quote in syntax.quotes if line.startswith(quote, index)), None)
+            if quote is not None:
+                self._quote = quote
+                out.append(quote)
+                index += len(quote)
+                continue
+            out.append(line[index])
+            index += 1
+        if self._quote is not None and self._quote not in syntax.multiline_quotes:
+            # An unterminated single-line string is most likely a mis-read; do not let it leak.
+            self._quote = None
+        return "".join(out)
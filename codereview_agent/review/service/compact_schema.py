@@ -0,0 +1,97 @@
+"""Expansion of the token-lean (compact) suggestion schema into full suggestions."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import uuid4
+
+
+def is_compact_suggestion(entry: Dict[str, Any]) -> bool:
+    return "replacement" in entry or isinstance(entry.get("range"), list)
+
+
+def expand_compact_suggestion(entry: Dict[str, Any], lines: Sequence[str]) -> Optional[Dict[str, Any]]:
+    """Build a full suggestion dict from a compact one.
+
+    A compact suggestion carries ``range`` as ``[startLine, startCol, endLine,
+    endCol]`` and ``replacement`` as the new text of lines ``startLine..endLine``.
+    The id, status, unified diff and fix snippet are produced here instead of
+    being generated (and paid for) as model output. Returns ``None`` when the
+    range cannot be read.
+    """
+
+    bounds = _read_range(entry.get("range"))
+    if bounds is None:
+        return None
+    start_line, start_col, end_line, end_col = bounds
+    if lines:
+        start_line = min(start_line, len(lines))
+        end_line = min(max(end_line, start_line), len(lines))
+    else:
+        end_line = max(end_line, start_line)
+
+    replacement = entry.get("replacement")
+    if isinstance(replacement, str):
+        diff = build_replacement_diff(lines, start_line, end_line, replacement)
+        snippet = replacement.strip()
+    else:
+        diff = ""
+        snippet = ""
+
+    expanded = {
+        key: value for key, value in entry.items() if key not in {"range", "replacement"}
+    }
+    expanded.update(
+        {
+            "id": entry.get("id") or str(uuid4()),
+            "status": entry.get("status") or "pending",
+            "tags": entry.get("tags") or [],
+            "range": {
+                "startLine": start_line,
+                "startCol": start_col,
+                "endLine": end_line,
+                "endCol": end_col,
+            },
+            "fix": {"type": "unified-diff", "diff": diff},
+            "fixSnippet": snippet,
+        }
+    )
+    expanded.setdefault("confidence", 0.5)
+    return expanded
+
+
+def build_replacement_diff(
+    lines: Sequence[str],
+    start_line: int,
+    end_line: int,
+    replacement: str,
+) -> str:
+    """Unified diff replacing ``lines[start_line..end_line]`` (1-based) with ``replacement``."""
+
+    before = list(lines[start_line - 1 : end_line])
+    after = replacement.split("\n") if replacement else []
+    if before == after:
+        return ""
+
+    diff_lines: List[str] = [
+        "--- original",
+        "+++ updated",
+        f"@@ -{start_line},{len(before)} +{start_line},{len(after)} @@",
+    ]
+    diff_lines += [f"-{line}" for line in before]
+    diff_lines += [f"+{line}" for line in after]
+    return "\n".join(diff_lines)
+
+
+def _read_range(raw: Any) -> Optional[List[int]]:
+    if not isinstance(raw, list) or len(raw) not in (2, 4):
+        return None
+    try:
+        values = [int(value) for value in raw]
+    except (TypeError, ValueError):
+        return None
+    if len(values) == 2:
+        # ``[startLine, endLine]`` is accepted for whole-line findings.
+        values = [values[0], 1, values[1], 1]
+    start_line, start_col, end_line, end_col = values
+    return [max(1, start_line), max(1, start_col), max(1, end_line), max(1, end_col)]
@@ -0,0 +1,344 @@
+"""Keep-alive connection pools for the Claude upstream."""
+
+from __future__ import annotations
+
+import asyncio
+import http.client
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Tuple, Union
+
+from codereview_agent.review.service.async_http import (
+    AsyncHttpConnection,
+    AsyncHttpError,
+    AsyncStaleConnectionError,
+    HttpResponse,
+    Origin,
+)
+
+_SyncConnection = Union[http.client.HTTPConnection, http.client.HTTPSConnection]
+
+# Errors that indicate the peer silently dropped an idle keep-alive socket. They
+# only mean that while sending or waiting for the status line; once a response
+# has started, the request reached the upstream and must not be replayed.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+@dataclass
+class PoolStats:
+    requests: int = 0
+    connects: int = 0
+    reuses: int = 0
+    idle_expired: int = 0
+    lifetime_expired: int = 0
+    discarded: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+@dataclass
+class _Pooled:
+    connection: object
+    created_at: float
+    last_used: float
+
+
+class _PoolPolicy:
+    """Shared idle/lifetime bookkeeping for the sync and async pools."""
+
+    def __init__(self, *, max_size: int, idle_timeout: float, max_lifetime: float) -> None:
+        self.max_size = max(0, max_size)
+        self.idle_timeout = max(0.0, idle_timeout)
+        self.max_lifetime = max(0.0, max_lifetime)
+        self.stats = PoolStats()
+
+    def is_expired(self, entry: _Pooled, now: float) -> bool:
+        if self.idle_timeout and now - entry.last_used > self.idle_timeout:
+            self.stats.idle_expired += 1
+            return True
+        if self.max_lifetime and now - entry.created_at > self.max_lifetime:
+            self.stats.lifetime_expired += 1
+            return True
+        return False
+
+
+class HttpConnectionPool(_PoolPolicy):
+    """Thread-safe pool of ``http.client`` connections to a single origin."""
+
+    def __init__(
+        self,
+        origin: Origin,
+        *,
+        timeout: float,
+        max_size: int,
+        idle_timeout: float,
+        max_lifetime: float,
+    ) -> None:
+        super().__init__(max_size=max_size, idle_timeout=idle_timeout, max_lifetime=max_lifetime)
+        self._origin = origin
+        self._timeout = timeout
+        self._idle: List[_Pooled] = []
+        self._lock = threading.Lock()
+
+    def request(self, method: str, path: str, *, headers: Dict[str, str], body: bytes) -> HttpResponse:
+        with self._lock:
+            self.stats.requests += 1
+
+        entry, reused = self._acquire()
+        try:
+            raw = self._send(entry, method, path, headers, body)
+        except _STALE_CONNECTION_ERRORS:
+            self._discard(entry)
+            if not reused:
+                raise
+            # The idle socket was closed by the server; retry once on a fresh one.
+            entry = self._connect()
+            try:
+                raw = self._send(entry, method, path, headers, body)
+            except BaseException:
+                self._discard(entry)
+                raise
+        except BaseException:
+            self._discard(entry)
+            raise
+
+        try:
+            response = self._read(raw)
+        except BaseException:
+            self._discard(entry)
+            raise
+
+        keep_alive = response.header("connection") != "close"
+        self._release(entry, keep_alive=keep_alive)
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for entry in idle:
+            entry.connection.close()
+
+    def _acquire(self) -> Tuple[_Pooled, bool]:
+        now = time.monotonic()
+        expired: List[_Pooled] = []
+        with self._lock:
+            while self._idle:
+                entry = self._idle.pop()
+                if self.is_expired(entry, now):
+                    expired.append(entry)
+                    continue
+                self.stats.reuses += 1
+                break
+            else:
+                entry = None
+
+        for stale in expired:
+            stale.connection.close()
+
+        if entry is not None:
+            return entry, True
+        return self._connect(), False
+
+    def _connect(self) -> _Pooled:
+        connection_cls = (
+            http.client.HTTPSConnection if self._origin.use_tls else http.client.HTTPConnection
+        )
+        connection: _SyncConnection = connection_cls(
+            self._origin.host,
+            self._origin.port,
+            timeout=self._timeout,
+        )
+        with self._lock:
+            self.stats.connects += 1
+        now = time.monotonic()
+        return _Pooled(connection=connection, created_at=now, last_used=now)
+
+    @staticmethod
+    def _send(
+        entry: _Pooled,
+        method: str,
+        path: str,
+        headers: Dict[str, str],
+        body: bytes,
+    ) -> http.client.HTTPResponse:
+        """Write the request and read the response head; the body is left unread."""
+
+        connection: _SyncConnection = entry.connection  # type: ignore[assignment]
+        connection.request(method, path, body=body, headers={**headers, "Connection": "keep-alive"})
+        return connection.getresponse()
+
+    @staticmethod
+    def _read(raw: http.client.HTTPResponse) -> HttpResponse:
+        payload = raw.read()
+        return HttpResponse(
+            status=raw.status,
+            reason=raw.reason,
+            headers={name.lower(): value for name, value in raw.getheaders()},
+            body=payload,
+        )
+
+    def _release(self, entry: _Pooled, *, keep_alive: bool) -> None:
+        entry.last_used = time.monotonic()
+        with self._lock:
+            if keep_alive and len(self._idle) < self.max_size:
+                self._idle.append(entry)
+                return
+            self.stats.discarded += 1
+        entry.connection.close()
+
+    def _discard(self, entry: _Pooled) -> None:
+        with self._lock:
+            self.stats.discarded += 1
+        entry.connection.close()
+
+
+class AsyncConnectionPool(_PoolPolicy):
+    """Pool of asyncio HTTP/1.1 connections bound to the running event loop."""
+
+    def __init__(
+        self,
+        origin: Origin,
+        *,
+        timeout: float,
+        max_size: int,
+        idle_timeout: float,
+        max_lifetime: float,
+    ) -> None:
+        super().__init__(max_size=max_size, idle_timeout=idle_timeout, max_lifetime=max_lifetime)
+        self._origin = origin
+        self._timeout = timeout
+        self._idle: List[_Pooled] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def request(self, method: str, path: str, *, headers: Dict[str, str], body: bytes) -> HttpResponse:
+        self._bind_loop()
+        self.stats.requests += 1
+
+        entry, reused = await self._acquire()
+        try:
+            response = await self._perform(entry, method, path, headers, body)
+        except asyncio.TimeoutError as exc:
+            await self._discard(entry)
+            raise AsyncHttpError(f"{self._timeout}초 내에 응답을 받지 못했습니다.") from exc
+        except AsyncStaleConnectionError:
+            await self._discard(entry)
+            if not reused:
+                raise
+            # The idle socket was closed by the server before it answered; retry once on a
+            # fresh one. Failures after response bytes arrived are never replayed.
+            entry = await self._connect()
+            try:
+                response = await self._perform(entry, method, path, headers, body)
+            except asyncio.TimeoutError as exc:
+                await self._discard(entry)
+                raise AsyncHttpError(f"{self._timeout}초 내에 응답을 받지 못했습니다.") from exc
+            except BaseException:
+                await self._discard(entry)
+                raise
+        except BaseException:
+            await self._discard(entry)
+            raise
+
+        await self._release(entry)
+        return response
+
+    async def open_stream(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: Dict[str, str],
+        body: bytes,
+    ) -> Tuple[AsyncHttpConnection, HttpResponse]:
+        """Send a request on a dedicated connection and return it with the response head.
+
+        Streamed bodies are read incrementally, so the connection is not pooled;
+        the caller owns it and must close it once the body is consumed.
+        """
+
+        self.stats.requests += 1
+        self.stats.connects += 1
+        connection = AsyncHttpConnection(self._origin)
+        try:
+            await asyncio.wait_for(
+                connection.send_head(method, path, headers=headers, body=body),
+                timeout=self._timeout,
+            )
+            head = await asyncio.wait_for(connection.read_head(), timeout=self._timeout)
+        except asyncio.TimeoutError as exc:
+            await connection.close()
+            raise AsyncHttpError(f"{self._timeout}초 내에 응답을 받지 못했습니다.") from exc
+        except BaseException:
+            await connection.close()
+            raise
+        return connection, head
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for entry in idle:
+            await entry.connection.close()
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Connections opened on another loop cannot be reused (or awaited) here.
+            idle, self._idle = self._idle, []
+            for entry in idle:
+                self.stats.discarded += 1
+                entry.connection.abandon()  # type: ignore[attr-defined]
+            self._loop = loop
+
+    async def _acquire(self) -> Tuple[_Pooled, bool]:
+        now = time.monotonic()
+        while self._idle:
+            entry = self._idle.pop()
+            connection: AsyncHttpConnection = entry.connection  # type: ignore[assignment]
+            if self.is_expired(entry, now) or not connection.is_open:
+                await connection.close()
+                continue
+            self.stats.reuses += 1
+            return entry, True
+        return await self._connect(), False
+
+    async def _connect(self) -> _Pooled:
+        connection = AsyncHttpConnection(self._origin)
+        try:
+            await asyncio.wait_for(connection.connect(), timeout=self._timeout)
+        except asyncio.TimeoutError as exc:
+            raise AsyncHttpError(f"{self._timeout}초 내에 연결하지 못했습니다.") from exc
+        self.stats.connects += 1
+        now = time.monotonic()
+        return _Pooled(connection=connection, created_at=now, last_used=now)
+
+    async def _perform(
+        self,
+        entry: _Pooled,
+        method: str,
+        path: str,
+        headers: Dict[str, str],
+        body: bytes,
+    ) -> HttpResponse:
+        connection: AsyncHttpConnection = entry.connection  # type: ignore[assignment]
+        return await asyncio.wait_for(
+            connection.request(method, path, headers=headers, body=body, keep_alive=True),
+            timeout=self._timeout,
+        )
+
+    async def _release(self, entry: _Pooled) -> None:
+        connection: AsyncHttpConnection = entry.connection  # type: ignore[assignment]
+        entry.last_used = time.monotonic()
+        if connection.reusable and len(self._idle) < self.max_size:
+            self._idle.append(entry)
+            return
+        await self._discard(entry)
+
+    async def _discard(self, entry: _Pooled) -> None:
+        self.stats.discarded += 1
+        await entry.connection.close()
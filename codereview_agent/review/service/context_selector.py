@@ -0,0 +1,204 @@
+"""Pick the most review-worthy regions of an oversized input and mark what was left out."""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import AbstractSet, Iterable, List, Optional, Sequence, Tuple
+
+from codereview_agent.review.models import Suggestion
+from codereview_agent.review.service.chunking import is_definition_line, remap_suggestion_lines
+
+# Comment-only, import and similar lines carry little review value on their own.
+_LOW_VALUE_PATTERN = re.compile(
+    r"^(?:$|//|#|/\*|\*|--|import\b|from\s+\S+\s+import\b|using\s|package\s|require\(|use\s)"
+)
+
+
+@dataclass(frozen=True)
+class ContextSelectionOptions:
+    hit_weight: float = 4.0
+    changed_weight: float = 3.0
+    definition_weight: float = 2.0
+    code_weight: float = 0.1
+    max_region_lines: int = 12
+
+
+@dataclass(frozen=True)
+class ContextSelection:
+    """Text sent to the model plus, per excerpt line, the original line it shows.
+
+    ``line_map[i]`` is the 1-based original line of excerpt line ``i + 1`` or
+    ``None`` for a gap marker; ``line_map`` itself is ``None`` when ``text`` is
+    the whole input.
+    """
+
+    text: str
+    line_map: Optional[Tuple[Optional[int], ...]] = None
+
+    @property
+    def complete(self) -> bool:
+        return self.line_map is None
+
+    def original_line(self, line: int) -> Optional[int]:
+        if self.line_map is None:
+            return line
+        if 1 <= line <= len(self.line_map):
+            return self.line_map[line - 1]
+        return None
+
+    def to_original(self, suggestions: Iterable[Suggestion]) -> List[Suggestion]:
+        """Move excerpt-relative suggestions onto original lines; those starting on a gap marker are dropped."""
+
+        if self.line_map is None:
+            return list(suggestions)
+        return remap_suggestion_lines(suggestions, self.original_line, self.original_line)
+
+
+def gap_marker(count: int) -> str:
+    return f"... ({count} lines omitted) ..."
+
+
+def truncate_context(code: str, max_chars: int) -> ContextSelection:
+    """Keep the first ``max_chars`` characters; lines keep their own numbers."""
+
+    if len(code) <= max_chars:
+        return ContextSelection(text=code)
+    text = code[:max_chars]
+    return ContextSelection(text=text, line_map=tuple(range(1, text.count("\n") + 2)))
+
+
+def select_context(
+    code: str,
+    *,
+    max_chars: int,
+    hit_lines: AbstractSet[int] = frozenset(),
+    changed_lines: AbstractSet[int] = frozenset(),
+    options: Optional[ContextSelectionOptions] = None,
+) -> ContextSelection:
+    """Fit ``code`` into ``max_chars`` by keeping its highest-value regions.
+
+    The code is split into regions at blank lines and definitions. Each line
+    scores for heuristic hits (``hit_lines``), recent changes
+    (``changed_lines``), definitions and plain code; regions are taken by
+    score per character until the budget is spent and rendered in file order,
+    with a :func:`gap_marker` line standing in for every omitted run. Falls
+    back to :func:`truncate_context` when not even one region fits.
+    """
+
+    if len(code) <= max_chars:
+        return ContextSelection(text=code)
+
+    options = options or ContextSelectionOptions()
+    lines = code.split("\n")
+    regions = _split_regions(lines, max(1, options.max_region_lines))
+
+    # offsets[i] is the rendered size of lines[:i], one newline per line included.
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line) + 1)
+
+    ranked: List[Tuple[float, int]] = []
+    for index, (start, end) in enumerate(regions):
+        score = sum(_line_score(lines, number, hit_lines, changed_lines, options) for number in range(start, end))
+        ranked.append((score / (offsets[end] - offsets[start]), index))
+    ranked.sort(key=lambda item: (-item[0], item[1]))
+
+    # Rendered size plus one, tracked per change instead of re-rendering each candidate.
+    chosen: List[int] = []
+    size = _gap_cost(offsets, 0, len(lines))
+    for _, index in ranked:
+        start, end = regions[index]
+        position = bisect_left(chosen, index)
+        before = regions[chosen[position - 1]][1] if position else 0
+        after = regions[chosen[position]][0] if position < len(chosen) else len(lines)
+        candidate = (
+            size
+            - _gap_cost(offsets, before, after)
+            + _gap_cost(offsets, before, start)
+            + offsets[end]
+            - offsets[start]
+            + _gap_cost(offsets, end, after)
+        )
+        if candidate - 1 <= max_chars:
+            chosen.insert(position, index)
+            size = candidate
+    if not chosen:
+        return truncate_context(code, max_chars)
+    return _render(lines, regions, chosen)
+
+
+def _split_regions(lines: Sequence[str], max_lines: int) -> List[Tuple[int, int]]:
+    regions: List[Tuple[int, int]] = []
+    start = 0
+    for index in range(1, len(lines)):
+        previous = lines[index - 1]
+        starts_definition = is_definition_line(lines[index]) and not previous.lstrip().startswith("@")
+        if index - start >= max_lines or starts_definition or not previous.strip():
+            regions.append((start, index))
+            start = index
+    regions.append((start, len(lines)))
+    return regions
+
+
+def _line_score(
+    lines: Sequence[str],
+    index: int,
+    hit_lines: AbstractSet[int],
+    changed_lines: AbstractSet[int],
+    options: ContextSelectionOptions,
+) -> float:
+    number = index + 1
+    stripped = lines[index].strip()
+    score = 0.0
+    if number in hit_lines:
+        score += options.hit_weight
+    if number in changed_lines:
+        score += options.changed_weight
+    if is_definition_line(stripped):
+        score += options.definition_weight
+    elif not _LOW_VALUE_PATTERN.match(stripped):
+        score += options.code_weight
+    return score
+
+
+def _gap_cost(offsets: Sequence[int], start: int, end: int) -> int:
+    """Rendered size (with its newline) of omitting ``lines[start:end]``; mirrors ``omit`` in :func:`_render`."""
+
+    if start >= end:
+        return 0
+    marker = gap_marker(end - start)
+    kept = offsets[end] - offsets[start]
+    if end - start <= len(marker) and kept <= len(marker) + 1:
+        return kept
+    return len(marker) + 1
+
+
+def _render(lines: Sequence[str], regions: Sequence[Tuple[int, int]], chosen: Sequence[int]) -> ContextSelection:
+    parts: List[str] = []
+    line_map: List[Optional[int]] = []
+
+    def omit(start: int, end: int) -> None:
+        if start >= end:
+            return
+        marker = gap_marker(end - start)
+        # Short runs (a blank line, a closing brace) are cheaper to keep than to mark.
+        if end - start <= len(marker) and sum(len(line) + 1 for line in lines[start:end]) <= len(marker) + 1:
+            keep(start, end)
+            return
+        parts.append(marker)
+        line_map.append(None)
+
+    def keep(start: int, end: int) -> None:
+        parts.extend(lines[start:end])
+        line_map.extend(range(start + 1, end + 1))
+
+    cursor = 0
+    for index in chosen:
+        start, end = regions[index]
+        omit(cursor, start)
+        keep(start, end)
+        cursor = end
+    omit(cursor, len(lines))
+    return ContextSelection(text="\n".join(parts), line_map=tuple(line_map))
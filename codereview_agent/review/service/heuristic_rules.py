@@ -0,0 +1,332 @@
+"""Rule registry and single-pass scanner for heuristic review suggestions."""
+
+from __future__ import annotations
+
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Sequence, Set, Tuple
+from uuid import uuid4
+
+from codereview_agent.review.models import Suggestion, SuggestionFix, SuggestionRange
+
+
+@dataclass(frozen=True)
+class LineMatch:
+    """A token hit together with the (1-based) line it was found on."""
+
+    line_no: int
+    line: str
+    token: str
+
+
+@dataclass
+class ScanSummary:
+    total_lines: int
+    matched_rules: Set[str] = field(default_factory=set)
+
+
+class HeuristicRule:
+    """Base class for heuristic rules.
+
+    ``tokens`` are literal trigger strings; the scanner calls :meth:`match_line`
+    at most once per line on which any of them occurs. Rules that need a verdict
+    on the whole document override :meth:`finish`.
+    """
+
+    key: str = ""
+    styles: FrozenSet[str] = frozenset()
+    tokens: Tuple[str, ...] = ()
+    ignore_case: bool = False
+
+    def match_line(self, match: LineMatch) -> Optional[Suggestion]:
+        return None
+
+    def finish(self, summary: ScanSummary) -> Iterable[Suggestion]:
+        return ()
+
+
+def _line_diff(line_no: int, before: str, after: str) -> str:
+    return "\n".join(
+        [
+            "--- original",
+            "+++ updated",
+            f"@@ -{line_no} +{line_no} @@",
+            f"-{before}",
+            f"+{after}",
+        ]
+    )
+
+
+class NonStrictEqualityRule(HeuristicRule):
+    key = "non-strict-equality"
+    styles = frozenset({"bug", "detail"})
+    tokens = ("==",)
+
+    def match_line(self, match: LineMatch) -> Optional[Suggestion]:
+        line = match.line
+        if "===" in line or "!==" in line:
+            return None
+        col = line.index("==") + 1
+        new_line = line.replace("==", "===", 1)
+        return Suggestion(
+            id=str(uuid4()),
+            title="동등 연산자 강화",
+            rationale="JavaScript에서는 엄격한 비교(===)가 암묵적 형 변환으로 인한 버그를 예방합니다.",
+            severity="major",
+            tags=["bug", "best-practice"],
+            range=SuggestionRange(
+                start_line=match.line_no,
+                start_col=col,
+                end_line=match.line_no,
+                end_col=col + 2,
+            ),
+            fix=SuggestionFix(type="unified-diff", diff=_line_diff(match.line_no, line, new_line)),
+            fix_snippet=new_line.strip(),
+            confidence=0.7,
+            status="pending",
+        )
+
+
+class ConsoleLogRule(HeuristicRule):
+    key = "console-log"
+    styles = frozenset({"bug", "refactor", "detail"})
+    tokens = ("console.log",)
+
+    def match_line(self, match: LineMatch) -> Optional[Suggestion]:
+        stripped = match.line
+        indent = len(stripped) - len(stripped.lstrip(" "))
+        replacement = " " * indent + "// TODO: 필요한 경우 로깅 가드를 적용하세요."
+        col = stripped.index("console.log")
+        return Suggestion(
+            id=str(uuid4()),
+            title="디버그 로그 정리",
+            rationale="프로덕션 코드에서는 console.log를 제거하거나 환경에 따라 제어하는 것이 좋습니다.",
+            severity="minor",
+            tags=["cleanup", "refactor"],
+            range=SuggestionRange(
+                start_line=match.line_no,
+                start_col=col + 1,
+                end_line=match.line_no,
+                end_col=col + len("console.log") + 1,
+            ),
+            fix=SuggestionFix(type="unified-diff", diff=_line_diff(match.line_no, stripped, replacement)),
+            fix_snippet=replacement.strip(),
+            confidence=0.6,
+            status="pending",
+        )
+
+
+class SparseTodoRule(HeuristicRule):
+    key = "sparse-todo"
+    styles = frozenset({"detail", "refactor"})
+    tokens = ("TODO",)
+
+    def match_line(self, match: LineMatch) -> Optional[Suggestion]:
+        stripped = match.line
+        if ":" in stripped:
+            # Already has a description.
+            return None
+        placeholder = stripped.replace("TODO", "TODO: 세부 설명을 추가하세요")
+        col = stripped.index("TODO")
+        return Suggestion(
+            id=str(uuid4()),
+            title="TODO 세부 설명 추가",
+            rationale="TODO에는 구체적인 작업 내용을 작성해야 추후 처리하기 쉽습니다.",
+            severity="minor",
+            tags=["documentation", "detail"],
+            range=SuggestionRange(
+                start_line=match.line_no,
+                start_col=col + 1,
+                end_line=match.line_no,
+                end_col=col + len("TODO") + 1,
+            ),
+            fix=SuggestionFix(type="unified-diff", diff=_line_diff(match.line_no, stripped, placeholder)),
+            fix_snippet=placeholder.strip(),
+            confidence=0.5,
+            status="pending",
+        )
+
+
+class MissingTestScaffoldRule(HeuristicRule):
+    key = "test-scaffold"
+    styles = frozenset({"test"})
+    tokens = ("test(", "it(", "describe(", "expect(", "assert(")
+    ignore_case = True
+
+    def match_line(self, match: LineMatch) -> Optional[Suggestion]:
+        # Presence is recorded by the scanner; the verdict is made in ``finish``.
+        return None
+
+    def finish(self, summary: ScanSummary) -> Iterable[Suggestion]:
+        if self.key in summary.matched_rules:
+            return []
+
+        snippet = (
+            "describe('module', () => {\n"
+            "  it('should do something meaningful', () => {\n"
+            "    // TODO: add assertions matching the new behaviour\n"
+            "  });\n"
+            "});"
+        )
+        total_lines = summary.total_lines
+        diff_lines = [
+            "--- original",
+            "+++ updated",
+            f"@@ +{total_lines + 1},{4} @@",
+        ] + [f"+{line}" for line in snippet.splitlines()]
+
+        return [
+            Suggestion(
+                id=str(uuid4()),
+                title="테스트 스캐폴드 추가",
+                rationale="새로운 변경 사항이 테스트로 검증되면 회귀를 예방할 수 있습니다.",
+                severity="major",
+                tags=["test", "quality"],
+                range=SuggestionRange(
+                    start_line=total_lines,
+                    start_col=1,
+                    end_line=total_lines,
+                    end_col=1,
+                ),
+                fix=SuggestionFix(type="unified-diff", diff="\n".join(diff_lines)),
+                fix_snippet=snippet,
+                confidence=0.4,
+                status="pending",
+            )
+        ]
+
+
+class HeuristicScanner:
+    """Matches every rule token in one left-to-right pass over the buffer.
+
+    All tokens are compiled into a single alternation (longest first); the regex
+    engine walks the text once and skips positions whose first character cannot
+    start any token, so adding rules does not add passes over the input.
+    A hit also triggers rules whose tokens are substrings of the matched text,
+    so overlapping tokens such as ``==`` and ``===`` never hide each other.
+    """
+
+    def __init__(self, rules: Sequence[HeuristicRule]) -> None:
+        self._rules = list(rules)
+        self._pattern: Optional[Pattern[str]] = None
+        self._triggers: Dict[str, List[int]] = {}
+
+        exact: Set[str] = set()
+        folded: Set[str] = set()
+        for rule in self._rules:
+            if rule.ignore_case:
+                folded.update(token.lower() for token in rule.tokens)
+            else:
+                exact.update(rule.tokens)
+
+        alternatives = [re.escape(token) for token in sorted(exact, key=len, reverse=True)]
+        alternatives += [
+            f"(?i:{re.escape(token)})" for token in sorted(folded, key=len, reverse=True)
+        ]
+        if alternatives:
+            self._pattern = re.compile("|".join(alternatives))
+
+    def scan(self, code: str) -> List[Suggestion]:
+        per_rule: List[List[Suggestion]] = [[] for _ in self._rules]
+        summary = ScanSummary(total_lines=0)
+
+        line_no = 1
+        cursor = 0
+        line_start = 0
+        line_end = -1
+        fired: Set[int] = set()
+
+        if self._pattern is not None:
+            for hit in self._pattern.finditer(code):
+                position = hit.start()
+                if position > line_end:
+                    line_no += code.count("\n", cursor, position)
+                    cursor = position
+                    line_start = code.rfind("\n", 0, position) + 1
+                    line_end = code.find("\n", position)
+                    if line_end == -1:
+                        line_end = len(code)
+                    fired = set()
+
+                text = hit.group()
+                line: Optional[str] = None
+                for index in self._rules_for(text):
+                    if index in fired:
+                        continue
+                    fired.add(index)
+                    rule = self._rules[index]
+                    summary.matched_rules.add(rule.key)
+                    if line is None:
+                        line = code[line_start:line_end].rstrip("\r")
+                    suggestion = rule.match_line(LineMatch(line_no=line_no, line=line, token=text))
+                    if suggestion is not None:
+                        per_rule[index].append(suggestion)
+
+        summary.total_lines = line_no + code.count("\n", cursor)
+
+        suggestions: List[Suggestion] = []
+        for index, rule in enumerate(self._rules):
+            suggestions.extend(per_rule[index])
+            suggestions.extend(rule.finish(summary))
+        return suggestions
+
+    def _rules_for(self, text: str) -> List[int]:
+        triggered = self._triggers.get(text)
+        if triggered is None:
+            lowered = text.lower()
+            triggered = [
+                index
+                for index, rule in enumerate(self._rules)
+                if any(
+                    (token.lower() in lowered) if rule.ignore_case else (token in text)
+                    for token in rule.tokens
+                )
+            ]
+            self._triggers[text] = triggered
+        return triggered
+
+
+class RuleRegistry:
+    """Holds heuristic rules and hands out one compiled scanner per review style."""
+
+    def __init__(self, rules: Iterable[HeuristicRule] = ()) -> None:
+        self._rules: List[HeuristicRule] = []
+        self._scanners: Dict[str, HeuristicScanner] = {}
+        self._lock = threading.Lock()
+        for rule in rules:
+            self.register(rule)
+
+    def register(self, rule: HeuristicRule) -> None:
+        with self._lock:
+            if any(existing.key == rule.key for existing in self._rules):
+                raise ValueError(f"이미 등록된 규칙입니다: {rule.key}")
+            self._rules.append(rule)
+            self._scanners.clear()
+
+    def rules_for(self, style: str) -> List[HeuristicRule]:
+        return [rule for rule in self._rules if style in rule.styles]
+
+    def scan(self, code: str, style: str) -> List[Suggestion]:
+        return self._scanner_for(style).scan(code)
+
+    def _scanner_for(self, style: str) -> HeuristicScanner:
+        scanner = self._scanners.get(style)
+        if scanner is None:
+            with self._lock:
+                scanner = self._scanners.get(style)
+                if scanner is None:
+                    scanner = HeuristicScanner(self.rules_for(style))
+                    self._scanners[style] = scanner
+        return scanner
+
+
+def build_default_registry() -> RuleRegistry:
+    return RuleRegistry(
+        [
+            NonStrictEqualityRule(),
+            ConsoleLogRule(),
+            SparseTodoRule(),
+            MissingTestScaffoldRule(),
+        ]
+    )
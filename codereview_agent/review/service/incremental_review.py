@@ -0,0 +1,146 @@
+"""Plan partial reviews: changed regions of an edited session or of a diff, and what still applies."""
+
+from __future__ import annotations
+
+import difflib
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Tuple
+
+from codereview_agent.review.models import Suggestion, SuggestionFix, SuggestionRange
+from codereview_agent.review.service.chunking import CodeChunk, shift_diff
+from codereview_agent.review.service.unified_diff import DiffHunk
+
+
+@dataclass(frozen=True)
+class IncrementalPlan:
+    # New-file regions to send upstream: changed lines plus context.
+    windows: Tuple[CodeChunk, ...]
+    # Unchanged lines, old line number -> new line number (1-based).
+    line_map: Dict[int, int]
+    changed_lines: int
+    total_lines: int
+
+    @property
+    def reviewed_lines(self) -> int:
+        return sum(window.end_line - window.start_line + 1 for window in self.windows)
+
+    @property
+    def window_lines(self) -> FrozenSet[int]:
+        return frozenset(
+            line for window in self.windows for line in range(window.start_line, window.end_line + 1)
+        )
+
+    def carry_over(self, suggestions: Iterable[Suggestion]) -> List[Suggestion]:
+        """Suggestions that only touch unchanged lines outside every window, moved to their new lines."""
+
+        carried: List[Suggestion] = []
+        for suggestion in suggestions:
+            original = suggestion.range
+            old_lines = range(original.start_line, max(original.end_line, original.start_line) + 1)
+            if any(line not in self.line_map for line in old_lines):
+                continue
+            start = self.line_map[original.start_line]
+            end = self.line_map[old_lines[-1]]
+            if any(start <= window.end_line and end >= window.start_line for window in self.windows):
+                continue
+            offset = start - original.start_line
+            carried.append(
+                suggestion.model_copy(
+                    update={
+                        "range": SuggestionRange(
+                            start_line=start,
+                            start_col=original.start_col,
+                            end_line=end,
+                            end_col=original.end_col,
+                        ),
+                        "fix": SuggestionFix(type=suggestion.fix.type, diff=shift_diff(suggestion.fix.diff, offset)),
+                    }
+                )
+            )
+        return carried
+
+
+def plan_incremental_review(old_code: str, new_code: str, *, context_lines: int = 3) -> IncrementalPlan:
+    """Diff ``old_code`` against ``new_code`` line by line and build re-review windows.
+
+    Every inserted or replaced block, and every deletion point, is widened by
+    ``context_lines`` on both sides; overlapping or touching windows are merged.
+    """
+
+    old_lines = old_code.split("\n")
+    new_lines = new_code.split("\n")
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    context = max(0, context_lines)
+
+    line_map: Dict[int, int] = {}
+    spans: List[Tuple[int, int]] = []
+    changed = 0
+    for tag, old_start, old_end, new_start, new_end in matcher.get_opcodes():
+        if tag == "equal":
+            for offset in range(old_end - old_start):
+                line_map[old_start + offset + 1] = new_start + offset + 1
+            continue
+        changed += max(old_end - old_start, new_end - new_start)
+        start = max(0, new_start - context)
+        end = min(len(new_lines), max(new_end, new_start + 1) + context)
+        if start >= end:
+            # A deletion at the very end with no context still needs its last line reviewed.
+            start = max(0, end - 1)
+        if spans and start <= spans[-1][1]:
+            spans[-1] = (spans[-1][0], max(spans[-1][1], end))
+        else:
+            spans.append((start, end))
+
+    windows = tuple(
+        CodeChunk(start_line=start + 1, text="\n".join(new_lines[start:end]))
+        for start, end in spans
+        if end > start
+    )
+    return IncrementalPlan(
+        windows=windows,
+        line_map=line_map,
+        changed_lines=changed,
+        total_lines=len(new_lines),
+    )
+
+
+@dataclass(frozen=True)
+class DiffReviewPlan:
+    windows: Tuple[CodeChunk, ...]
+    # New-file line numbers added or modified by the diff.
+    added_lines: FrozenSet[int]
+
+    def touches_change(self, start_line: int, end_line: int) -> bool:
+        return any(line in self.added_lines for line in range(start_line, max(start_line, end_line) + 1))
+
+
+def plan_diff_review(hunks: Sequence[DiffHunk], new_code: str, *, context_lines: int = 3) -> DiffReviewPlan:
+    """Windows of ``new_code`` around the lines a diff adds, widened by ``context_lines``.
+
+    Pure deletions add nothing to review and produce no window.
+    """
+
+    new_lines = new_code.split("\n")
+    context = max(0, context_lines)
+    added = sorted(
+        number
+        for hunk in hunks
+        for number, _, is_added in hunk.new_lines()
+        if is_added and number <= len(new_lines)
+    )
+
+    spans: List[Tuple[int, int]] = []
+    for number in added:
+        start = max(0, number - 1 - context)
+        end = min(len(new_lines), number + context)
+        if spans and start <= spans[-1][1]:
+            spans[-1] = (spans[-1][0], max(spans[-1][1], end))
+        else:
+            spans.append((start, end))
+
+    return DiffReviewPlan(
+        windows=tuple(
+            CodeChunk(start_line=start + 1, text="\n".join(new_lines[start:end])) for start, end in spans
+        ),
+        added_lines=frozenset(added),
+    )
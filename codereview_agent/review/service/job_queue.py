@@ -0,0 +1,471 @@
+"""SQLite-backed review job queue and the worker pool that drains it."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from uuid import uuid4
+
+from codereview_agent.common import (
+    ApiErrorDetail,
+    ApiErrorResponse,
+    CustomInternalServerException,
+    ErrorCode,
+)
+from codereview_agent.review.config import get_settings
+from codereview_agent.review.schemas import ReviewRequest
+
+if TYPE_CHECKING:  # pragma: no cover - type checking helper
+    from codereview_agent.review.service.review_service import ReviewService
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+TERMINAL_STATUSES = frozenset({SUCCEEDED, FAILED, CANCELLED})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS review_jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    request TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    owner TEXT,
+    lease_expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS review_jobs_queue ON review_jobs (status, priority DESC, created_at);
+"""
+# Columns added after the first release, created on databases that predate them.
+_MIGRATED_COLUMNS = (("owner", "TEXT"), ("lease_expires_at", "REAL"))
+
+
+@dataclass(frozen=True)
+class ReviewJob:
+    id: str
+    status: str
+    priority: int
+    request: Dict[str, Any]
+    result: Optional[Dict[str, Any]]
+    error: Optional[Dict[str, Any]]
+    created_at: float
+    updated_at: float
+
+    @property
+    def done(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+
+class JobStore:
+    """Durable job table; every state transition is a single SQL statement.
+
+    Jobs are claimed highest ``priority`` first, then oldest first. A job only
+    moves to a terminal state from ``running`` (or ``queued`` for cancellation),
+    so a result arriving after a cancellation is discarded.
+
+    A claim records its ``owner`` and a lease of ``lease_seconds`` that the
+    owner renews while the job runs; only jobs whose lease has run out (their
+    worker died) are put back on the queue, so workers in other processes never
+    requeue each other's live jobs.
+    """
+
+    def __init__(self, path: str, *, clock=time.time, lease_seconds: float = 60.0) -> None:
+        self._clock = clock
+        self._lease_seconds = max(1.0, lease_seconds)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(review_jobs)")}
+        for column, column_type in _MIGRATED_COLUMNS:
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE review_jobs ADD COLUMN {column} {column_type}")
+
+    @property
+    def lease_seconds(self) -> float:
+        return self._lease_seconds
+
+    def enqueue(self, request: Dict[str, Any], *, priority: int = 0) -> ReviewJob:
+        job_id = str(uuid4())
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO review_jobs (id, status, priority, request, created_at, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, QUEUED, priority, json.dumps(request, ensure_ascii=False), now, now),
+            )
+        return self.get(job_id)  # type: ignore[return-value]
+
+    def get(self, job_id: str) -> Optional[ReviewJob]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, status, priority, request, result, error, created_at, updated_at"
+                " FROM review_jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        return self._to_job(row) if row else None
+
+    def claim_next(self, owner: str = "") -> Optional[ReviewJob]:
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute(
+                "UPDATE review_jobs SET status = ?, updated_at = ?, owner = ?, lease_expires_at = ? WHERE id = ("
+                " SELECT id FROM review_jobs WHERE status = ?"
+                " ORDER BY priority DESC, created_at LIMIT 1"
+                ") RETURNING id, status, priority, request, result, error, created_at, updated_at",
+                (RUNNING, now, owner, now + self._lease_seconds, QUEUED),
+            ).fetchone()
+        return self._to_job(row) if row else None
+
+    def renew_lease(self, job_id: str, owner: str) -> bool:
+        """Extend ``owner``'s lease; ``False`` once the job is no longer running under that owner."""
+
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE review_jobs SET lease_expires_at = ? WHERE id = ? AND status = ? AND owner = ?",
+                (self._clock() + self._lease_seconds, job_id, RUNNING, owner),
+            )
+        return cursor.rowcount > 0
+
+    def complete(self, job_id: str, result: Dict[str, Any], *, owner: Optional[str] = None) -> bool:
+        return self._finish(job_id, SUCCEEDED, result=result, owner=owner)
+
+    def fail(self, job_id: str, error: Dict[str, Any], *, owner: Optional[str] = None) -> bool:
+        return self._finish(job_id, FAILED, error=error, owner=owner)
+
+    def cancel(self, job_id: str) -> bool:
+        """Mark a queued or running job cancelled.
+
+        A running job's upstream call is not interrupted; its worker only
+        notices when it finishes, and the late result is discarded.
+        """
+
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE review_jobs SET status = ?, updated_at = ? WHERE id = ? AND status IN (?, ?)",
+                (CANCELLED, self._clock(), job_id, QUEUED, RUNNING),
+            )
+        return cursor.rowcount > 0
+
+    def requeue_expired(self) -> int:
+        """Put ``running`` jobs whose lease ran out (their worker died) back on the queue."""
+
+        now = self._clock()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE review_jobs SET status = ?, updated_at = ?, owner = NULL, lease_expires_at = NULL"
+                " WHERE status = ? AND (lease_expires_at IS NULL OR lease_expires_at <= ?)",
+                (QUEUED, now, RUNNING, now),
+            )
+        return cursor.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM review_jobs GROUP BY status"
+            ).fetchall()
+        return {status: count for status, count in rows}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _finish(
+        self,
+        job_id: str,
+        status: str,
+        *,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[Dict[str, Any]] = None,
+        owner: Optional[str] = None,
+    ) -> bool:
+        # With an owner, a worker whose lease was taken over cannot overwrite the new run.
+        owner_clause = " AND owner = ?" if owner is not None else ""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE review_jobs SET status = ?, result = ?, error = ?, updated_at = ?,"
+                " lease_expires_at = NULL WHERE id = ? AND status = ?" + owner_clause,
+                (
+                    status,
+                    json.dumps(result, ensure_ascii=False) if result is not None else None,
+                    json.dumps(error, ensure_ascii=False) if error is not None else None,
+                    self._clock(),
+                    job_id,
+                    RUNNING,
+                    *((owner,) if owner is not None else ()),
+                ),
+            )
+        return cursor.rowcount > 0
+
+    @staticmethod
+    def _to_job(row: Any) -> ReviewJob:
+        job_id, status, priority, request, result, error, created_at, updated_at = row
+        return ReviewJob(
+            id=job_id,
+            status=status,
+            priority=priority,
+            request=json.loads(request),
+            result=json.loads(result) if result else None,
+            error=json.loads(error) if error else None,
+            created_at=created_at,
+            updated_at=updated_at,
+        )
+
+
+class ReviewJobWorkerPool:
+    """Worker threads that claim queued jobs and run them through ``ReviewService``.
+
+    Workers use the blocking ``generate_review`` path so they never share an
+    event loop with the HTTP tier. ``notify`` wakes an idle worker right away;
+    otherwise the queue is polled every ``poll_interval`` seconds, which also
+    picks up jobs enqueued by other processes and requeues jobs whose lease
+    expired. A heartbeat renews the lease of the job being run.
+    """
+
+    def __init__(
+        self,
+        service: "ReviewService",
+        store: JobStore,
+        *,
+        workers: int = 2,
+        poll_interval: float = 0.5,
+    ) -> None:
+        self._service = service
+        self._store = store
+        self._workers = max(1, workers)
+        self._poll_interval = max(0.01, poll_interval)
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._start_lock = threading.Lock()
+        self._owner = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+    @property
+    def running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self) -> None:
+        with self._start_lock:
+            if self.running:
+                return
+            self._stopping.clear()
+            self._requeue_expired()
+            self._threads = [
+                threading.Thread(target=self._run, name=f"review-job-worker-{index}", daemon=True)
+                for index in range(self._workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stopping.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def notify(self) -> None:
+        self._wakeup.set()
+
+    def run_once(self) -> bool:
+        """Claim and execute one job; return ``False`` when the queue is empty."""
+
+        job = self._store.claim_next(self._owner)
+        if job is None:
+            return False
+
+        stop_heartbeat = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat,
+            args=(job.id, stop_heartbeat),
+            name=f"review-job-heartbeat-{job.id[:8]}",
+            daemon=True,
+        )
+        heartbeat.start()
+        try:
+            self._execute(job)
+        finally:
+            stop_heartbeat.set()
+            heartbeat.join()
+        return True
+
+    def _execute(self, job: ReviewJob) -> None:
+        # Cancelled between the claim and now: skip the upstream call entirely.
+        current = self._store.get(job.id)
+        if current is None or current.status != RUNNING:
+            return
+
+        try:
+            request = ReviewRequest.model_validate(job.request)
+            response = self._service.generate_review(request)
+        except CustomInternalServerException as exc:
+            self._store.fail(job.id, self._error_body(exc.code, exc.detail or exc.code.message), owner=self._owner)
+        except Exception as exc:  # noqa: BLE001 - a failing job must not kill the worker
+            logger.exception("리뷰 작업 %s 처리 중 오류가 발생했습니다.", job.id)
+            self._store.fail(job.id, self._error_body(ErrorCode.PROCESSING_ERROR, str(exc)), owner=self._owner)
+        else:
+            self._store.complete(job.id, response.model_dump(mode="json", by_alias=True), owner=self._owner)
+
+    def _heartbeat(self, job_id: str, stop: threading.Event) -> None:
+        interval = self._store.lease_seconds / 3
+        while not stop.wait(interval):
+            if not self._store.renew_lease(job_id, self._owner):
+                return
+
+    def _requeue_expired(self) -> None:
+        requeued = self._store.requeue_expired()
+        if requeued:
+            logger.info("임대가 만료된 리뷰 작업 %s건을 다시 대기열에 넣었습니다.", requeued)
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            if self.run_once():
+                continue
+            self._requeue_expired()
+            self._wakeup.wait(self._poll_interval)
+            self._wakeup.clear()
+
+    @staticmethod
+    def _error_body(error_code: ErrorCode, message: str) -> Dict[str, Any]:
+        return ApiErrorResponse.from_error_code(
+            error_code,
+            errors=[ApiErrorDetail(field="general", message=message)],
+        ).model_dump(mode="json")
+
+
+class ReviewJobQueue:
+    """Facade used by the API: submit, inspect, cancel and long-poll review jobs.
+
+    The SQLite store is opened (and, with ``run_workers``, the in-process worker
+    pool started) on first use. With ``run_workers=False`` jobs are only queued
+    and another process running a :class:`ReviewJobWorkerPool` on the same
+    database executes them. ``submit``, ``get`` and ``cancel`` block on SQLite;
+    async callers run them with ``asyncio.to_thread``.
+    """
+
+    def __init__(
+        self,
+        service: "ReviewService",
+        *,
+        path: str,
+        workers: int = 2,
+        run_workers: bool = True,
+        poll_interval: float = 0.5,
+        lease_seconds: float = 60.0,
+    ) -> None:
+        self._service = service
+        self._path = path
+        self._lease_seconds = lease_seconds
+        self._workers = workers
+        self._run_workers = run_workers
+        self._poll_interval = poll_interval
+        self._store: Optional[JobStore] = None
+        self._pool: Optional[ReviewJobWorkerPool] = None
+        self._lock = threading.Lock()
+
+    def submit(self, request: ReviewRequest, *, priority: int = 0) -> ReviewJob:
+        store = self._ensure_open()
+        job = store.enqueue(request.model_dump(mode="json"), priority=priority)
+        if self._pool is not None:
+            self._pool.notify()
+        return job
+
+    def get(self, job_id: str) -> Optional[ReviewJob]:
+        return self._ensure_open().get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[ReviewJob]:
+        store = self._ensure_open()
+        store.cancel(job_id)
+        return store.get(job_id)
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[ReviewJob]:
+        """Return the job once it is finished or ``timeout`` seconds have passed.
+
+        Store reads run in a worker thread so polling never blocks the event loop.
+        """
+
+        deadline = time.monotonic() + max(0.0, timeout)
+        delay = 0.05
+        while True:
+            job = await asyncio.to_thread(self.get, job_id)
+            remaining = deadline - time.monotonic()
+            if job is None or job.done or remaining <= 0:
+                return job
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, self._poll_interval)
+
+    def stats(self) -> Dict[str, int]:
+        if self._store is None:
+            return {}
+        return self._store.counts()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.stop(timeout=5)
+                self._pool = None
+            if self._store is not None:
+                self._store.close()
+                self._store = None
+
+    def _ensure_open(self) -> JobStore:
+        if self._store is not None:
+            return self._store
+        with self._lock:
+            if self._store is None:
+                store = JobStore(self._path, lease_seconds=self._lease_seconds)
+                if self._run_workers:
+                    self._pool = ReviewJobWorkerPool(
+                        self._service,
+                        store,
+                        workers=self._workers,
+                        poll_interval=self._poll_interval,
+                    )
+                    self._pool.start()
+                self._store = store
+        return self._store
+
+
+def build_default_job_queue(service: "ReviewService") -> ReviewJobQueue:
+    settings = get_settings()
+    return ReviewJobQueue(
+        service,
+        path=settings.review_jobs_db_path,
+        workers=settings.review_jobs_workers,
+        run_workers=settings.review_jobs_run_workers,
+        lease_seconds=settings.review_jobs_lease_seconds,
+    )
+
+
+def run_worker() -> None:
+    """Entry point for a standalone worker process sharing the job database."""
+
+    from codereview_agent.review.service.review_service import ReviewService
+
+    settings = get_settings()
+    store = JobStore(settings.review_jobs_db_path, lease_seconds=settings.review_jobs_lease_seconds)
+    pool = ReviewJobWorkerPool(ReviewService(), store, workers=settings.review_jobs_workers)
+    pool.start()
+    try:
+        while pool.running:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pool.stop()
+
+
+if __name__ == "__main__":
+    run_worker()
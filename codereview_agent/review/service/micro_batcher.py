@@ -0,0 +1,134 @@
+"""Pack small concurrent calls that arrive within a short window into one batch."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, Sequence, Set, TypeVar, Union
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class MicroBatchOptions:
+    window_ms: int = 20
+    max_batch_size: int = 8
+    max_item_chars: int = 500
+
+
+@dataclass
+class MicroBatchStats:
+    batches: int = 0
+    items: int = 0
+    size_flushes: int = 0
+    window_flushes: int = 0
+    fill_histogram: Dict[int, int] = field(default_factory=dict)
+
+    def as_dict(self, max_batch_size: int) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "sizeFlushes": self.size_flushes,
+            "windowFlushes": self.window_flushes,
+            "averageFill": (self.items / self.batches / max_batch_size) if self.batches else 0.0,
+            "fillHistogram": {str(size): count for size, count in sorted(self.fill_histogram.items())},
+        }
+
+
+class _Batch(Generic[T, R]):
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.items: List[T] = []
+        self.futures: List["asyncio.Future[R]"] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class MicroBatcher(Generic[T, R]):
+    """Collect items for up to ``window_ms`` (or ``max_batch_size`` items) and run them together.
+
+    ``runner`` receives the items in submission order and returns one result or
+    exception per item, so each caller only ever sees its own outcome. If the
+    runner itself raises, every caller in that batch gets the exception.
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[List[T]], Awaitable[Sequence[Union[R, BaseException]]]],
+        options: Optional[MicroBatchOptions] = None,
+    ) -> None:
+        self._runner = runner
+        self._options = options or MicroBatchOptions()
+        self._current: Optional[_Batch[T, R]] = None
+        self._running: Set["asyncio.Task[None]"] = set()
+        self._stats = MicroBatchStats()
+
+    @property
+    def options(self) -> MicroBatchOptions:
+        return self._options
+
+    async def submit(self, item: T) -> R:
+        loop = asyncio.get_running_loop()
+        batch = self._current
+        if batch is None or batch.loop is not loop:
+            batch = _Batch(loop)
+            self._current = batch
+            batch.timer = loop.call_later(
+                max(0, self._options.window_ms) / 1000, self._flush, batch, False
+            )
+
+        future: "asyncio.Future[R]" = loop.create_future()
+        batch.items.append(item)
+        batch.futures.append(future)
+        if len(batch.items) >= max(1, self._options.max_batch_size):
+            self._flush(batch, True)
+        return await future
+
+    def stats(self) -> Dict[str, Any]:
+        return self._stats.as_dict(max(1, self._options.max_batch_size))
+
+    def _flush(self, batch: _Batch[T, R], by_size: bool) -> None:
+        if self._current is batch:
+            self._current = None
+        if batch.timer is not None:
+            batch.timer.cancel()
+            batch.timer = None
+        if not batch.items:
+            return
+
+        size = len(batch.items)
+        self._stats.batches += 1
+        self._stats.items += size
+        self._stats.fill_histogram[size] = self._stats.fill_histogram.get(size, 0) + 1
+        if by_size:
+            self._stats.size_flushes += 1
+        else:
+            self._stats.window_flushes += 1
+        task = batch.loop.create_task(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: _Batch[T, R]) -> None:
+        try:
+            results: List[Union[R, BaseException]] = list(await self._runner(batch.items))
+        except asyncio.CancelledError:
+            for future in batch.futures:
+                future.cancel()
+            raise
+        except Exception as exc:  # noqa: BLE001 - forwarded to every caller
+            results = [exc] * len(batch.items)
+
+        if len(results) != len(batch.items):
+            error = RuntimeError("micro-batch runner returned a mismatched number of results")
+            results = [error] * len(batch.items)
+        self._settle(batch, results)
+
+    @staticmethod
+    def _settle(batch: _Batch[T, R], results: List[Union[R, BaseException]]) -> None:
+        for future, result in zip(batch.futures, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
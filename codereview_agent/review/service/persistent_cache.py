@@ -0,0 +1,259 @@
+"""SQLite-backed review cache tier shared by every worker process on a node."""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional
+
+from pydantic import ValidationError
+
+from codereview_agent.review.schemas import ReviewResponse
+from codereview_agent.review.service.review_cache import CacheLookup, ReviewCache
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS review_cache (
+    key TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    compressed INTEGER NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS review_cache_accessed ON review_cache (accessed_at);
+CREATE INDEX IF NOT EXISTS review_cache_expires ON review_cache (expires_at);
+-- Running total of stored bytes, kept by triggers so every process sees the same figure.
+CREATE TABLE IF NOT EXISTS review_cache_size (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO review_cache_size (id, bytes)
+    SELECT 0, COALESCE(SUM(size), 0) FROM review_cache;
+CREATE TRIGGER IF NOT EXISTS review_cache_size_insert AFTER INSERT ON review_cache
+    BEGIN UPDATE review_cache_size SET bytes = bytes + NEW.size WHERE id = 0; END;
+CREATE TRIGGER IF NOT EXISTS review_cache_size_update AFTER UPDATE OF size ON review_cache
+    BEGIN UPDATE review_cache_size SET bytes = bytes + NEW.size - OLD.size WHERE id = 0; END;
+CREATE TRIGGER IF NOT EXISTS review_cache_size_delete AFTER DELETE ON review_cache
+    BEGIN UPDATE review_cache_size SET bytes = bytes - OLD.size WHERE id = 0; END;
+"""
+
+
+@dataclass
+class PersistentCacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    errors: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class PersistentReviewCache:
+    """Serialized ``ReviewResponse`` payloads keyed by content hash in a WAL database.
+
+    Every process opens its own connection; SQLite's locking (with a busy
+    timeout) makes concurrent readers and writers safe. Payloads at least
+    ``compress_min_bytes`` long are zlib-compressed when ``compress`` is set.
+    Once the stored bytes exceed ``max_bytes`` the least recently read entries
+    are evicted. Entries past their TTL are still served as stale for
+    ``stale_seconds`` so callers can answer immediately and refresh in the
+    background. Database errors are logged and treated as misses.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl_seconds: float = 86400.0,
+        stale_seconds: float = 0.0,
+        compress: bool = True,
+        compress_min_bytes: int = 1024,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._path = path
+        self._max_bytes = max(1, max_bytes)
+        self._ttl = max(0.0, ttl_seconds)
+        self._stale = max(0.0, stale_seconds)
+        self._compress = compress
+        self._compress_min_bytes = max(0, compress_min_bytes)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats = PersistentCacheStats()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=5.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def get(self, key: str) -> Optional[ReviewResponse]:
+        found = self.lookup(key)
+        return found.response if found is not None and not found.stale else None
+
+    def lookup(self, key: str) -> Optional[CacheLookup]:
+        now = self._clock()
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT payload, compressed, expires_at FROM review_cache WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    self._stats.misses += 1
+                    return None
+                payload, compressed, expires_at = row
+                stale = expires_at is not None and expires_at <= now
+                if stale and expires_at + self._stale <= now:
+                    self._conn.execute("DELETE FROM review_cache WHERE key = ?", (key,))
+                    self._stats.misses += 1
+                    return None
+                self._conn.execute("UPDATE review_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        except sqlite3.Error:
+            return self._on_error("조회")
+
+        try:
+            raw = zlib.decompress(payload) if compressed else payload
+            response = ReviewResponse.model_validate_json(raw)
+        except (zlib.error, ValidationError, ValueError):
+            logger.warning("손상된 영구 캐시 항목 %s를 무시합니다.", key)
+            self._delete(key)
+            return None
+
+        with self._lock:
+            if stale:
+                self._stats.stale_hits += 1
+            else:
+                self._stats.hits += 1
+        return CacheLookup(response, stale=stale)
+
+    def put(self, key: str, response: ReviewResponse) -> None:
+        raw = response.model_dump_json(by_alias=True).encode("utf-8")
+        compressed = self._compress and len(raw) >= self._compress_min_bytes
+        payload = zlib.compress(raw, 6) if compressed else raw
+        if len(payload) > self._max_bytes:
+            return
+
+        now = self._clock()
+        expires_at = now + self._ttl if self._ttl else None
+        try:
+            with self._lock:
+                # An upsert rather than INSERT OR REPLACE: REPLACE deletes without firing the size trigger.
+                self._conn.execute(
+                    "INSERT INTO review_cache (key, payload, compressed, size, expires_at, accessed_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?)"
+                    " ON CONFLICT (key) DO UPDATE SET payload = excluded.payload,"
+                    " compressed = excluded.compressed, size = excluded.size,"
+                    " expires_at = excluded.expires_at, accessed_at = excluded.accessed_at",
+                    (key, payload, int(compressed), len(payload), expires_at, now),
+                )
+                self._evict(now)
+        except sqlite3.Error:
+            self._on_error("저장")
+
+    def clear(self) -> None:
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM review_cache")
+        except sqlite3.Error:
+            self._on_error("초기화")
+
+    def stats(self) -> Dict[str, Any]:
+        try:
+            with self._lock:
+                (entries,) = self._conn.execute("SELECT COUNT(*) FROM review_cache").fetchone()
+                stored = self._stored_bytes()
+                return {**self._stats.as_dict(), "entries": entries, "bytes": stored}
+        except sqlite3.Error:
+            return {**self._stats.as_dict(), "entries": None, "bytes": None}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self, now: float) -> None:
+        if self._ttl:
+            cursor = self._conn.execute(
+                "DELETE FROM review_cache WHERE expires_at <= ?",
+                (now - self._stale,),
+            )
+            self._stats.evictions += max(0, cursor.rowcount)
+        stored = self._stored_bytes()
+        if stored <= self._max_bytes:
+            return
+        # Walk entries oldest-read first and drop them until the total fits.
+        excess = stored - self._max_bytes
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM review_cache ORDER BY accessed_at"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM review_cache WHERE key = ?", victims)
+        self._stats.evictions += len(victims)
+
+    def _stored_bytes(self) -> int:
+        (stored,) = self._conn.execute("SELECT bytes FROM review_cache_size WHERE id = 0").fetchone()
+        return stored
+
+    def _delete(self, key: str) -> None:
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM review_cache WHERE key = ?", (key,))
+        except sqlite3.Error:
+            self._on_error("삭제")
+
+    def _on_error(self, action: str) -> None:
+        logger.exception("영구 리뷰 캐시 %s 중 오류가 발생했습니다.", action)
+        with self._lock:
+            self._stats.errors += 1
+        return None
+
+
+class TieredReviewCache:
+    """In-memory LRU in front of the persistent tier.
+
+    Fresh persistent hits are promoted into memory; stale hits are served as
+    is so the caller can revalidate them.
+    """
+
+    def __init__(self, memory: Optional[ReviewCache], persistent: PersistentReviewCache) -> None:
+        self._memory = memory
+        self._persistent = persistent
+
+    def get(self, key: str) -> Optional[ReviewResponse]:
+        found = self.lookup(key)
+        return found.response if found is not None and not found.stale else None
+
+    def lookup(self, key: str) -> Optional[CacheLookup]:
+        if self._memory is not None:
+            found = self._memory.lookup(key)
+            if found is not None:
+                return found
+        found = self._persistent.lookup(key)
+        if found is not None and not found.stale and self._memory is not None:
+            self._memory.put(key, found.response)
+        return found
+
+    def put(self, key: str, response: ReviewResponse) -> None:
+        if self._memory is not None:
+            self._memory.put(key, response)
+        self._persistent.put(key, response)
+
+    def clear(self) -> None:
+        if self._memory is not None:
+            self._memory.clear()
+        self._persistent.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        memory = self._memory.stats() if self._memory is not None else {}
+        return {**memory, "persistent": self._persistent.stats()}
+
+    def close(self) -> None:
+        self._persistent.close()
@@ -0,0 +1,178 @@
+"""Assemble Claude review prompts and size them against a local token estimate."""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+# Per-message framing the API adds around system/user content.
+_MESSAGE_OVERHEAD_TOKENS = 8
+# Closing fence plus the optional truncation note.
+_FOOTER_RESERVE_TOKENS = 12
+# Output ceiling of the smallest supported model (Claude 3 Haiku).
+_MULTI_ITEM_MAX_OUTPUT_TOKENS = 4096
+# Shortest prefix Anthropic's prompt cache accepts; a ``cache_control`` marker on
+# anything shorter is silently ignored. Haiku models need twice the default.
+_MIN_CACHEABLE_TOKENS = 1024
+_MIN_CACHEABLE_TOKENS_BY_MODEL = (("claude-3-haiku", 2048), ("claude-3-5-haiku", 2048))
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap local estimate of Claude tokens for ``text``.
+
+    Words are counted as one token per four characters (at least one), every
+    punctuation character as one token and non-ASCII characters as one token
+    each, which tracks the real tokenizer closely enough for budgeting code.
+    """
+
+    if not text:
+        return 0
+    total = 0
+    for match in _TOKEN_PATTERN.finditer(text):
+        piece = match.group()
+        if piece.isascii():
+            total += max(1, math.ceil(len(piece) / 4))
+        else:
+            total += len(piece)
+    return total + text.count("\n") // 4
+
+
+def min_cacheable_tokens(model: str) -> int:
+    """Minimum cacheable prompt prefix for ``model``."""
+
+    for prefix, tokens in _MIN_CACHEABLE_TOKENS_BY_MODEL:
+        if model.startswith(prefix):
+            return tokens
+    return _MIN_CACHEABLE_TOKENS
+
+
+@dataclass(frozen=True)
+class BuiltPrompt:
+    system: str
+    static_prefix: str
+    body: str
+    input_tokens: int
+    max_tokens: int
+    truncated_lines: int = 0
+
+    def system_blocks(self, *, cache: bool = False) -> List[Dict[str, Any]]:
+        """System content: the role prompt followed by the schema instructions.
+
+        With ``cache`` the last static block carries a ``cache_control`` marker so
+        the whole prefix is served from Anthropic's prompt cache on repeat calls.
+        """
+
+        instructions: Dict[str, Any] = {"type": "text", "text": self.static_prefix}
+        if cache:
+            instructions["cache_control"] = {"type": "ephemeral"}
+        return [{"type": "text", "text": self.system}, instructions]
+
+
+class PromptBuilder:
+    """Builds review prompts with the code included exactly once.
+
+    The system prompt and schema instructions never change for a given prompt
+    version, so they are rendered and measured once when the builder is created.
+    With a ``token_budget`` (input plus output), code is trimmed at line
+    boundaries so the estimated input leaves room for the answer, and
+    ``max_tokens`` is lowered to whatever the budget has left.
+    """
+
+    def __init__(
+        self,
+        *,
+        system_prompt: str,
+        instructions: str,
+        max_output_tokens: int,
+        token_budget: int = 0,
+        min_output_tokens: int = 256,
+    ) -> None:
+        self._system = system_prompt
+        self._static_prefix = instructions
+        self._static_tokens = (
+            estimate_tokens(system_prompt) + estimate_tokens(instructions) + _MESSAGE_OVERHEAD_TOKENS
+        )
+        self._max_output_tokens = max(1, max_output_tokens)
+        self._token_budget = max(0, token_budget)
+        self._min_output_tokens = max(1, min(min_output_tokens, self._max_output_tokens))
+
+    @property
+    def static_tokens(self) -> int:
+        return self._static_tokens
+
+    @property
+    def token_budget(self) -> int:
+        return self._token_budget
+
+    def build(self, *, language: str, style: str, code: str) -> BuiltPrompt:
+        fence = language or "text"
+        header = f"Language: {fence}\nStyle: {style}\nCode:\n```{fence}\n"
+        fixed_tokens = self._static_tokens + estimate_tokens(header) + _FOOTER_RESERVE_TOKENS
+
+        lines = code.split("\n")
+        line_tokens = [estimate_tokens(line) + 1 for line in lines]
+        code_tokens = sum(line_tokens)
+
+        footer = "\n```"
+        truncated_lines = 0
+        input_limit = self._input_limit()
+        if input_limit is not None and fixed_tokens + code_tokens > input_limit:
+            available = max(0, input_limit - fixed_tokens)
+            kept = 0
+            for tokens in line_tokens:
+                if tokens > available:
+                    break
+                available -= tokens
+                kept += 1
+            kept = max(1, kept)
+            truncated_lines = len(lines) - kept
+            code_tokens = sum(line_tokens[:kept])
+            code = "\n".join(lines[:kept])
+            footer = f"\n```\n(code truncated after line {kept})"
+
+        input_tokens = fixed_tokens + code_tokens
+        return BuiltPrompt(
+            system=self._system,
+            static_prefix=self._static_prefix,
+            body=f"{header}{code}{footer}",
+            input_tokens=input_tokens,
+            max_tokens=self._max_tokens_for(input_tokens),
+            truncated_lines=truncated_lines,
+        )
+
+    def build_many(self, items: Sequence[Tuple[str, str, str, str]]) -> BuiltPrompt:
+        """Pack ``(item_id, language, style, code)`` snippets into one delimited body.
+
+        Used for micro-batches of small inputs, so code is never trimmed; the
+        output allowance grows with the number of items up to the output cap.
+        """
+
+        body = "\n\n".join(
+            f'<item id="{item_id}" language="{language or "text"}" style="{style}">\n{code}\n</item>'
+            for item_id, language, style, code in items
+        )
+        input_tokens = self._static_tokens + estimate_tokens(body)
+        max_tokens = min(self._max_output_tokens * max(1, len(items)), _MULTI_ITEM_MAX_OUTPUT_TOKENS)
+        if self._token_budget:
+            max_tokens = max(self._min_output_tokens, min(max_tokens, self._token_budget - input_tokens))
+        return BuiltPrompt(
+            system=self._system,
+            static_prefix=self._static_prefix,
+            body=body,
+            input_tokens=input_tokens,
+            max_tokens=max_tokens,
+        )
+
+    def _input_limit(self) -> Optional[int]:
+        if not self._token_budget:
+            return None
+        return max(0, self._token_budget - self._min_output_tokens)
+
+    def _max_tokens_for(self, input_tokens: int) -> int:
+        if not self._token_budget:
+            return self._max_output_tokens
+        remaining = self._token_budget - input_tokens
+        return max(self._min_output_tokens, min(self._max_output_tokens, remaining))
@@ -0,0 +1,197 @@
+"""Client-side pacing for Anthropic's requests-per-minute and tokens-per-minute limits."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+RATELIMIT_HEADER_PREFIX = "anthropic-ratelimit-"
+
+
+@dataclass(frozen=True)
+class RateLimitOptions:
+    requests_per_minute: int = 0
+    tokens_per_minute: int = 0
+    max_wait_seconds: float = 30.0
+
+
+class RateLimitExceededError(Exception):
+    """Raised when pacing a call would take longer than ``max_wait_seconds``."""
+
+    def __init__(self, message: str, *, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.message = message
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Continuously refilling bucket that may go into debt.
+
+    ``reserve`` always takes the amount and returns how long the caller must
+    wait for the bucket to be back at zero, so concurrent callers are paced in
+    the order they reserved. A bucket with a zero limit is disabled.
+    """
+
+    def __init__(self, per_minute: float, *, clock: Callable[[], float]) -> None:
+        self._clock = clock
+        self._capacity = max(0.0, float(per_minute))
+        self._level = self._capacity
+        self._updated = clock()
+
+    @property
+    def limit(self) -> float:
+        return self._capacity
+
+    @property
+    def enabled(self) -> bool:
+        return self._capacity > 0
+
+    def available(self) -> float:
+        self._refill()
+        return self._level
+
+    def configure(self, per_minute: float) -> None:
+        self._refill()
+        per_minute = max(0.0, float(per_minute))
+        if not self.enabled:
+            self._level = per_minute
+        self._capacity = per_minute
+        self._level = min(self._level, per_minute)
+
+    def reserve(self, amount: float) -> float:
+        if not self.enabled:
+            return 0.0
+        self._refill()
+        self._level -= min(max(0.0, amount), self._capacity)
+        return 0.0 if self._level >= 0 else -self._level / (self._capacity / 60.0)
+
+    def adjust(self, amount: float) -> None:
+        """Give back (positive) or take (negative) tokens after the fact."""
+
+        if not self.enabled:
+            return
+        self._refill()
+        self._level = min(self._capacity, self._level + amount)
+
+    def observe_remaining(self, remaining: float) -> None:
+        """Trust the server when it reports less headroom than we track."""
+
+        if not self.enabled:
+            return
+        self._refill()
+        self._level = min(self._level, max(0.0, remaining))
+
+    def _refill(self) -> None:
+        now = self._clock()
+        if self.enabled:
+            self._level = min(self._capacity, self._level + (now - self._updated) * self._capacity / 60.0)
+        self._updated = now
+
+
+class RateLimiter:
+    """Pace calls ahead of time so they stay under the org's RPM and TPM limits.
+
+    Each call reserves one request and its estimated input+output tokens and
+    is told how long to wait before sending. Once the answer arrives the token
+    reservation is corrected with the reported usage. ``anthropic-ratelimit-*``
+    response headers replace the configured limits and lower the buckets to the
+    server-reported remaining capacity, so unknown (zero) limits are learned
+    from the first response.
+    """
+
+    def __init__(
+        self,
+        options: Optional[RateLimitOptions] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._options = options or RateLimitOptions()
+        self._lock = threading.Lock()
+        self._requests = TokenBucket(self._options.requests_per_minute, clock=clock)
+        self._tokens = TokenBucket(self._options.tokens_per_minute, clock=clock)
+        self._paced = 0
+        self._shed = 0
+        self._waited_seconds = 0.0
+        self._header_updates = 0
+
+    def reserve(self, tokens: int) -> float:
+        """Reserve one request and ``tokens``; return the seconds to wait before sending."""
+
+        with self._lock:
+            delay = max(self._requests.reserve(1), self._tokens.reserve(tokens))
+            if delay > self._options.max_wait_seconds:
+                self._requests.adjust(1)
+                self._tokens.adjust(tokens)
+                self._shed += 1
+                raise RateLimitExceededError(
+                    f"Claude API 사용량 한도에 맞추려면 {delay:.1f}초를 기다려야 해 요청을 거절합니다.",
+                    retry_after=delay,
+                )
+            if delay > 0:
+                self._paced += 1
+                self._waited_seconds += delay
+            return delay
+
+    def headroom(self) -> float:
+        """Fraction (0..1) of the tighter limit that is currently available; 1 when unknown."""
+
+        with self._lock:
+            fractions = [
+                max(0.0, bucket.available()) / bucket.limit
+                for bucket in (self._requests, self._tokens)
+                if bucket.enabled
+            ]
+        return min(fractions, default=1.0)
+
+    def settle(self, reserved_tokens: int, used_tokens: Optional[int]) -> None:
+        """Correct a reservation once the real token usage is known."""
+
+        if used_tokens is None:
+            return
+        with self._lock:
+            self._tokens.adjust(reserved_tokens - used_tokens)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        requests = _read_limit_headers(headers, "requests")
+        tokens = _read_limit_headers(headers, "tokens")
+        if requests == (None, None) and tokens == (None, None):
+            return
+        with self._lock:
+            self._header_updates += 1
+            for bucket, (limit, remaining) in ((self._requests, requests), (self._tokens, tokens)):
+                if limit is not None and limit != bucket.limit:
+                    bucket.configure(limit)
+                if remaining is not None:
+                    bucket.observe_remaining(remaining)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requestsPerMinute": self._requests.limit,
+                "tokensPerMinute": self._tokens.limit,
+                "requestsAvailable": round(self._requests.available(), 2),
+                "tokensAvailable": round(self._tokens.available(), 2),
+                "paced": self._paced,
+                "shed": self._shed,
+                "waitedSeconds": round(self._waited_seconds, 3),
+                "headerUpdates": self._header_updates,
+            }
+
+
+def _read_limit_headers(headers: Mapping[str, str], kind: str) -> Tuple[Optional[float], Optional[float]]:
+    lowered = {name.lower(): value for name, value in headers.items()}
+    return (
+        _to_float(lowered.get(f"{RATELIMIT_HEADER_PREFIX}{kind}-limit")),
+        _to_float(lowered.get(f"{RATELIMIT_HEADER_PREFIX}{kind}-remaining")),
+    )
+
+
+def _to_float(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
@@ -0,0 +1,99 @@
+"""Retry classification and backoff scheduling for Claude API calls."""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Callable, FrozenSet, Optional
+
+if TYPE_CHECKING:  # pragma: no cover - type checking helper
+    from codereview_agent.review.service.claude_client import ClaudeReviewError
+
+# 408/409 are transient conflicts, 429 is rate limiting and 529 is Anthropic's "overloaded".
+DEFAULT_RETRYABLE_STATUSES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+
+
+def parse_retry_after(value: Optional[str], *, now: Optional[float] = None) -> Optional[float]:
+    """Parse a ``Retry-After`` header given as delta-seconds or an HTTP date."""
+
+    if value is None or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    current = now if now is not None else time.time()
+    return max(0.0, retry_at.timestamp() - current)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with decorrelated jitter bounded by a wall-clock budget."""
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    budget_seconds: float = 60.0
+    retryable_statuses: FrozenSet[int] = DEFAULT_RETRYABLE_STATUSES
+    rng: random.Random = field(default_factory=random.Random, compare=False)
+
+    def is_retryable(self, error: "ClaudeReviewError") -> bool:
+        if error.retryable is not None:
+            return error.retryable
+        if error.status_code is None:
+            # Network failures and malformed bodies are worth another attempt.
+            return True
+        return error.status_code in self.retryable_statuses
+
+    def backoff(self, previous_delay: float) -> float:
+        """Decorrelated jitter: ``min(max, uniform(base, previous * 3))``."""
+
+        base = max(0.0, self.base_delay)
+        upper = max(base, previous_delay * 3)
+        return min(self.max_delay, self.rng.uniform(base, upper))
+
+    def start(
+        self,
+        *,
+        budget_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> "RetrySchedule":
+        budget = self.budget_seconds if budget_seconds is None else budget_seconds
+        return RetrySchedule(policy=self, deadline=clock() + max(0.0, budget), clock=clock)
+
+
+@dataclass
+class RetrySchedule:
+    """Per-call retry state; ask it for the next delay after each failure."""
+
+    policy: RetryPolicy
+    deadline: float
+    clock: Callable[[], float] = time.monotonic
+    attempts: int = 0
+    previous_delay: float = 0.0
+
+    def next_delay(self, error: "ClaudeReviewError") -> Optional[float]:
+        """Return seconds to wait before retrying, or ``None`` to give up."""
+
+        self.attempts += 1
+        if self.attempts >= max(1, self.policy.max_attempts):
+            return None
+        if not self.policy.is_retryable(error):
+            return None
+
+        delay = self.policy.backoff(self.previous_delay or self.policy.base_delay)
+        if error.retry_after is not None:
+            delay = max(delay, error.retry_after)
+
+        if self.clock() + delay >= self.deadline:
+            return None
+
+        self.previous_delay = delay
+        return delay
@@ -0,0 +1,130 @@
+"""Content-addressed in-memory cache for review results."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Optional
+
+from codereview_agent.review.schemas import ReviewResponse
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class CacheLookup:
+    """A cache hit; ``stale`` entries are past their TTL but may be served while refreshing."""
+
+    response: ReviewResponse
+    stale: bool = False
+
+
+@dataclass
+class _CacheEntry:
+    response: ReviewResponse
+    size: int
+    expires_at: Optional[float]
+
+
+def build_cache_key(
+    *,
+    code: str,
+    language: str,
+    style: str,
+    model: str,
+    prompt_version: str,
+) -> str:
+    """Hash everything that can change the upstream answer into a stable key."""
+
+    digest = hashlib.sha256()
+    for part in (prompt_version, model, style, language, code):
+        encoded = part.encode("utf-8")
+        # Length-prefix each part so field boundaries cannot collide.
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+class ReviewCache:
+    """LRU cache bounded by entry count, total payload bytes and TTL."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 256,
+        max_bytes: int = 16 * 1024 * 1024,
+        ttl_seconds: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max(1, max_entries)
+        self._max_bytes = max(1, max_bytes)
+        self._ttl = max(0.0, ttl_seconds)
+        self._clock = clock
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[ReviewResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            if entry.expires_at is not None and entry.expires_at <= self._clock():
+                self._remove(key)
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry.response
+
+    def lookup(self, key: str) -> Optional[CacheLookup]:
+        response = self.get(key)
+        return CacheLookup(response) if response is not None else None
+
+    def put(self, key: str, response: ReviewResponse) -> None:
+        size = len(response.model_dump_json())
+        if size > self._max_bytes:
+            return
+
+        expires_at = self._clock() + self._ttl if self._ttl else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _CacheEntry(response=response, size=size, expires_at=expires_at)
+            self._bytes += size
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._stats.entries = len(self._entries)
+            self._stats.bytes = self._bytes
+            return self._stats.as_dict()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
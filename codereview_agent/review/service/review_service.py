@@ -2,29 +2,86 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import time
-from dataclasses import dataclass
-from typing import Any, Iterable, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 from uuid import uuid4
 
 from pydantic import ValidationError
 
 from codereview_agent.common import (
     CustomInternalServerException,
+    DEGRADED_REVIEW_MESSAGE,
     ErrorCode,
     REMOTE_REVIEW_FAILURE_MESSAGE,
 )
 from codereview_agent.review.models import (
     ReviewMetrics,
     Suggestion,
-    SuggestionFix,
-    SuggestionRange,
 )
 from codereview_agent.review.schemas import ReviewRequest, ReviewResponse
+from codereview_agent.review.config import get_settings
+from codereview_agent.review.service.chunking import (
+    ChunkingOptions,
+    CodeChunk,
+    merge_chunk_suggestions,
+    merge_chunk_summaries,
+    split_into_chunks,
+)
 from codereview_agent.review.service.claude_client import (
+    PROMPT_VERSION,
+    ClaudeOverloadedError,
     ClaudeReviewClient,
     ClaudeReviewError,
+    ReviewBatchEntry,
+)
+from codereview_agent.review.service.code_normalizer import (
+    NormalizationOptions,
+    NormalizedCode,
+    normalize_code,
+)
+from codereview_agent.review.service.context_selector import (
+    ContextSelection,
+    ContextSelectionOptions,
+    select_context,
+    truncate_context,
+)
+from codereview_agent.review.service.compact_schema import (
+    expand_compact_suggestion,
+    is_compact_suggestion,
 )
+from codereview_agent.review.service.heuristic_rules import RuleRegistry, build_default_registry
+from codereview_agent.review.service.incremental_review import (
+    DiffReviewPlan,
+    plan_diff_review,
+    plan_incremental_review,
+)
+from codereview_agent.review.service.micro_batcher import MicroBatcher, MicroBatchOptions
+from codereview_agent.review.service.persistent_cache import PersistentReviewCache, TieredReviewCache
+from codereview_agent.review.service.review_cache import ReviewCache, build_cache_key
+from codereview_agent.review.service.session_store import ReviewSession, ReviewSessionStore
+from codereview_agent.review.service.single_flight import SingleFlight
+from codereview_agent.review.service.unified_diff import PatchError, apply_unified_diff, parse_unified_diff
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -59,32 +116,142 @@ STYLE_PROFILES = {
 
 DEFAULT_STYLE = "detail"
 DEFAULT_LANGUAGE = "javascript"
+FALLBACK_MODEL_NAME = "codex-heuristic-v1"
+# Above this share of re-reviewed lines an edit is reviewed as a whole file again.
+INCREMENTAL_MAX_REVIEWED_RATIO = 0.6
+DEFAULT_RULE_REGISTRY = build_default_registry()
 
 
 class ReviewService:
     """Generates structured code review results via Claude integration with fallback heuristics."""
 
-    def __init__(self, review_client: Optional[ClaudeReviewClient] = None) -> None:
+    def __init__(
+        self,
+        review_client: Optional[ClaudeReviewClient] = None,
+        *,
+        cache: Optional[Union[ReviewCache, TieredReviewCache]] = None,
+        chunking: Optional[ChunkingOptions] = None,
+        rule_registry: Optional[RuleRegistry] = None,
+        micro_batching: Optional[MicroBatchOptions] = None,
+        normalization: Optional[NormalizationOptions] = None,
+        sessions: Optional[ReviewSessionStore] = None,
+        context_selection: Optional[ContextSelectionOptions] = None,
+    ) -> None:
         self._review_client = review_client
+        self._rules = rule_registry if rule_registry is not None else DEFAULT_RULE_REGISTRY
+        self._cache = cache if cache is not None else self._build_default_cache()
+        self._chunking = chunking if chunking is not None else self._build_default_chunking()
+        self._normalization = normalization if normalization is not None else self._build_default_normalization()
+        self._single_flight: SingleFlight[ReviewResponse] = SingleFlight()
+        self._revalidations: Set["asyncio.Future[ReviewResponse]"] = set()
+        self._sessions = sessions if sessions is not None else self._build_default_sessions()
+        self._context_selection = (
+            context_selection if context_selection is not None else self._build_default_context_selection()
+        )
+        settings = get_settings()
+        self._max_input_chars = max(1, settings.review_input_max_chars)
+        self._session_context_lines = settings.review_session_context_lines
+        self._diff_context_lines = settings.review_diff_context_lines
+        self._default_deadline_ms = settings.review_deadline_ms
+        self._batch_concurrency = settings.review_batch_concurrency
+        micro_batching = micro_batching if micro_batching is not None else self._build_default_micro_batching()
+        self._micro_batcher: Optional[MicroBatcher[ReviewBatchEntry, dict]] = (
+            MicroBatcher(self._run_micro_batch, micro_batching) if micro_batching is not None else None
+        )
+
+    @property
+    def cache(self) -> Optional[Union[ReviewCache, TieredReviewCache]]:
+        return self._cache
+
+    def stats(self) -> Dict[str, Any]:
+        """Return operational counters for the cache, request coalescing and upstream."""
+
+        client_stats = getattr(self._review_client, "stats", None)
+        return {
+            "cache": self._cache.stats() if self._cache is not None else None,
+            "singleFlight": self._single_flight.stats(),
+            "upstream": client_stats() if callable(client_stats) else None,
+            "microBatch": self._micro_batcher.stats() if self._micro_batcher is not None else None,
+            "sessions": self._sessions.stats() if self._sessions is not None else None,
+        }
 
     def generate_review(self, request: ReviewRequest) -> ReviewResponse:
+        """Review ``request`` and remember the result as a session :meth:`aupdate_review` can continue."""
+
+        response = self._generate_review(request)
+        self._remember_session(request, response)
+        return response
+
+    def _generate_review(self, request: ReviewRequest) -> ReviewResponse:
         start_time = time.perf_counter()
         style = self._normalize_style(request.style)
         language = self._resolve_language(request.language, request.code)
 
-        code_for_model = self._prepare_code_for_model(request.code)
-
-        client = self._review_client or ClaudeReviewClient()
-        self._review_client = client
+        client = self._get_client()
+        canonical = self._canonicalize(request.code, language)
+        cache_key = self._cache_key(request, style, language, client, canonical)
+        cached = self._lookup_cache(cache_key, start_time, code=request.code, canonical=canonical)
+        if cached is not None:
+            return cached
 
         try:
-            remote_payload = client.create_review(
+            remote_payload = self._fetch_remote(client, request, language=language, style=style)
+        except ClaudeReviewError as exc:
+            raise self._remote_failure(request, style, language, exc) from exc
+
+        response = self._build_remote_data(
+            request=request,
+            style=style,
+            language=language,
+            remote_payload=remote_payload,
+            client=client,
+            started_at=start_time,
+        )
+        self._store_cache(cache_key, response, canonical)
+        return response
+
+    async def agenerate_review(
+        self,
+        request: ReviewRequest,
+        *,
+        deadline_ms: Optional[int] = None,
+    ) -> ReviewResponse:
+        """Async counterpart of :meth:`generate_review` for use inside the event loop.
+
+        When a deadline is set (argument or ``REVIEW_DEADLINE_MS``), heuristics run
+        alongside the upstream call and a ``degraded`` heuristic response is returned
+        if Claude fails or misses the deadline instead of raising a 503. The result
+        is remembered as a session that :meth:`aupdate_review` can continue.
+        """
+
+        response = await self._agenerate_review(request, deadline_ms=deadline_ms)
+        self._remember_session(request, response)
+        return response
+
+    async def _agenerate_review(
+        self,
+        request: ReviewRequest,
+        *,
+        deadline_ms: Optional[int] = None,
+        focus_lines: FrozenSet[int] = frozenset(),
+    ) -> ReviewResponse:
+        start_time = time.perf_counter()
+        style = self._normalize_style(request.style)
+        language = self._resolve_language(request.language, request.code)
+
+        client = self._get_client()
+        canonical = self._canonicalize(request.code, language)
+        cache_key = self._cache_key(request, style, language, client, canonical)
+
+        async def fetch_and_build() -> ReviewResponse:
+            remote_payload = await self._fetch_remote_async(
+                client,
                 request,
                 language=language,
                 style=style,
-                code=code_for_model,
+                focus_lines=focus_lines,
             )
-            data = self._build_remote_data(
+            response = self._build_remote_data(
                 request=request,
                 style=style,
                 language=language,
@@ -92,21 +259,890 @@ class ReviewService:
                 client=client,
                 started_at=start_time,
             )
-            return data
+            # Stored by the shared task so late answers still warm the cache.
+            await self._astore_cache(cache_key, response, canonical)
+            return response
+
+        cached = await self._alookup_cache(
+            cache_key, start_time, code=request.code, canonical=canonical, allow_stale=True
+        )
+        if cached is not None:
+            if cached.metrics.stale:
+                self._revalidate(cache_key, fetch_and_build)
+            return cached
+
+        # Identical concurrent requests share one upstream call.
+        upstream = self._single_flight.run(cache_key, fetch_and_build)
+
+        deadline_ms = deadline_ms if deadline_ms is not None else self._default_deadline_ms
+        if not deadline_ms or deadline_ms <= 0:
+            try:
+                shared = await upstream
+            except ClaudeReviewError as exc:
+                raise self._remote_failure(request, style, language, exc) from exc
+            return self._share(shared, request, language)
+
+        heuristics = asyncio.ensure_future(
+            asyncio.to_thread(self._fallback_suggestions, request, style)
+        )
+        remaining = max(0.0, deadline_ms / 1000 - (time.perf_counter() - start_time))
+        try:
+            shared = await asyncio.wait_for(upstream, timeout=remaining)
+        except (asyncio.TimeoutError, ClaudeReviewError) as exc:
+            reason = (
+                f"{deadline_ms}ms 내에 응답하지 않음"
+                if isinstance(exc, asyncio.TimeoutError)
+                else exc.user_message
+            )
+            return self._build_degraded_data(
+                request=request,
+                style=style,
+                language=language,
+                suggestions=await heuristics,
+                reason=reason,
+                started_at=start_time,
+            )
+
+        heuristics.cancel()
+        return self._share(shared, request, language)
+
+    async def astream_review(self, request: ReviewRequest) -> AsyncIterator[Tuple[str, Any]]:
+        """Yield ``("suggestion", Suggestion)`` events as they are generated, then
+        a final ``("complete", ReviewResponse)``.
+
+        Clients without streaming support, cache hits and chunked inputs are
+        served from the regular path and replayed as the same event sequence.
+        """
+
+        start_time = time.perf_counter()
+        style = self._normalize_style(request.style)
+        language = self._resolve_language(request.language, request.code)
+
+        client = self._get_client()
+        canonical = self._canonicalize(request.code, language)
+        cache_key = self._cache_key(request, style, language, client, canonical)
+        response = await self._alookup_cache(cache_key, start_time, code=request.code, canonical=canonical)
+
+        stream = getattr(client, "astream_review", None)
+        if response is None and (
+            stream is None or request.diff is not None or self._plan_chunks(request.code) is not None
+        ):
+            response = await self.agenerate_review(request)
+
+        if response is not None:
+            for suggestion in response.suggestions:
+                yield "suggestion", suggestion
+            yield "complete", response
+            return
+
+        streamed: List[Suggestion] = []
+        remote_payload: dict = {}
+        selection = self._select_context(request.code, style)
+        try:
+            async for event in stream(
+                request,
+                language=language,
+                style=style,
+                code=selection.text,
+            ):
+                if event.get("type") == "suggestion":
+                    for suggestion in selection.to_original(
+                        self._normalize_remote_suggestions([event.get("suggestion")], selection.text)
+                    ):
+                        streamed.append(suggestion)
+                        yield "suggestion", suggestion
+                elif event.get("type") == "complete":
+                    remote_payload = event.get("payload") or {}
         except ClaudeReviewError as exc:
-            suggestions = self._collect_suggestions(request.code, style)
-            fallback_summary = self._build_summary(style, language, suggestions)
-            error_context = REMOTE_REVIEW_FAILURE_MESSAGE.format(
-                reason=exc.user_message,
-                summary=fallback_summary,
+            raise self._remote_failure(request, style, language, exc) from exc
+
+        if streamed:
+            # Keep the ids the client already received.
+            remote_payload = {
+                **remote_payload,
+                "suggestions": [suggestion.model_dump(by_alias=True) for suggestion in streamed],
+            }
+        response = self._build_remote_data(
+            request=request,
+            style=style,
+            language=language,
+            remote_payload=remote_payload,
+            client=client,
+            started_at=start_time,
+        )
+        await self._astore_cache(cache_key, response, canonical)
+        yield "complete", response
+
+    async def aupdate_review(
+        self,
+        session_id: str,
+        *,
+        code: Optional[str] = None,
+        diff: Optional[str] = None,
+    ) -> Optional[ReviewResponse]:
+        """Re-review an edited session given its new ``code`` or a unified ``diff`` against it.
+
+        Only the changed lines plus ``REVIEW_SESSION_CONTEXT_LINES`` of context go
+        upstream; suggestions on untouched lines are carried over with shifted
+        ranges. Large edits fall back to a whole-file review. Returns ``None`` for
+        unknown or expired sessions.
+        """
+
+        session = self._sessions.get(session_id) if self._sessions is not None else None
+        if session is None:
+            return None
+
+        start_time = time.perf_counter()
+        try:
+            if code is None:
+                code = apply_unified_diff(session.code, parse_unified_diff(diff or ""))
+            request = ReviewRequest(code=code, language=session.language, style=session.style)
+        except PatchError as exc:
+            raise CustomInternalServerException(ErrorCode.INVALID_ARGUMENT, detail=str(exc)) from exc
+        except ValidationError as exc:
+            raise CustomInternalServerException(ErrorCode.INVALID_ARGUMENT, detail=exc.errors()[0]["msg"]) from exc
+        plan = plan_incremental_review(session.code, code, context_lines=self._session_context_lines)
+
+        reviewed_lines = plan.reviewed_lines
+        if reviewed_lines > plan.total_lines * INCREMENTAL_MAX_REVIEWED_RATIO:
+            reviewed_lines = plan.total_lines
+            response = await self._agenerate_review(request, focus_lines=plan.window_lines)
+        else:
+            client = self._get_client()
+            payload: Dict[str, Any] = {"summary": session.response.summary, "suggestions": [], "usage": {}}
+            if plan.windows:
+                try:
+                    payload = await self._review_chunks_async(
+                        client,
+                        request,
+                        list(plan.windows),
+                        language=session.language,
+                        style=session.style,
+                    )
+                except ClaudeReviewError as exc:
+                    raise self._remote_failure(request, session.style, session.language, exc) from exc
+            carried = plan.carry_over(session.response.suggestions)
+            fresh = self._normalize_remote_suggestions(payload.get("suggestions"), code)
+            suggestions = sorted(carried + fresh, key=lambda item: (item.range.start_line, item.range.start_col))
+            response = self._build_remote_data(
+                request=request,
+                style=session.style,
+                language=session.language,
+                remote_payload={
+                    **payload,
+                    "suggestions": [suggestion.model_dump(by_alias=True) for suggestion in suggestions],
+                },
+                client=client,
+                started_at=start_time,
+            )
+
+        response = response.model_copy(
+            update={
+                "session_id": session_id,
+                "original_code": session.original_code,
+                "metrics": response.metrics.model_copy(update={"reviewed_lines": reviewed_lines}),
+            }
+        )
+        self._sessions.put(  # type: ignore[union-attr]
+            replace(session, code=code, response=response, revision=session.revision + 1)
+        )
+        return response
+
+    async def abatch_review(
+        self,
+        items: Sequence[Tuple[str, ReviewRequest]],
+        *,
+        concurrency: Optional[int] = None,
+        deadline_ms: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[str, Union[ReviewResponse, CustomInternalServerException]]]:
+        """Review ``(item_id, request)`` pairs and yield each result as soon as it is ready.
+
+        Items that would share a cache key are reviewed once and the result is
+        fanned out to every id. At most ``concurrency`` distinct reviews run at a
+        time; failures are yielded per item instead of aborting the batch.
+        """
+
+        client = self._get_client()
+        groups: Dict[str, List[Tuple[str, ReviewRequest]]] = {}
+        languages: Dict[str, str] = {}
+        for item_id, request in items:
+            style = self._normalize_style(request.style)
+            language = self._resolve_language(request.language, request.code)
+            key = self._cache_key(request, style, language, client, self._canonicalize(request.code, language))
+            groups.setdefault(key, []).append((item_id, request))
+            languages[key] = language
+
+        limit = max(1, concurrency or self._batch_concurrency)
+        semaphore = asyncio.Semaphore(limit)
+
+        async def review_group(key: str) -> Tuple[str, Union[ReviewResponse, CustomInternalServerException]]:
+            async with semaphore:
+                try:
+                    return key, await self.agenerate_review(groups[key][0][1], deadline_ms=deadline_ms)
+                except CustomInternalServerException as exc:
+                    return key, exc
+                except Exception as exc:  # noqa: BLE001 - one bad item must not sink the batch
+                    return key, CustomInternalServerException(ErrorCode.PROCESSING_ERROR, detail=str(exc))
+
+        tasks = [asyncio.ensure_future(review_group(key)) for key in groups]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                key, outcome = await next_done
+                for index, (item_id, request) in enumerate(groups[key]):
+                    if index and isinstance(outcome, ReviewResponse):
+                        shared = self._share(outcome, request, languages[key])
+                        self._remember_session(request, shared)
+                        yield item_id, shared
+                    else:
+                        yield item_id, outcome
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def generate_reviews_in_batch(
+        self,
+        items: Sequence[Tuple[str, ReviewRequest]],
+        *,
+        poll_interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Union[ReviewResponse, CustomInternalServerException]]:
+        """Review many requests through the Message Batches API (non-interactive).
+
+        Cache hits are answered locally, identical inputs are submitted once and
+        large inputs are chunked like the interactive path. Results go through the
+        usual normalization and are cached. Clients without batch support fall
+        back to one :meth:`generate_review` call per distinct input.
+        """
+
+        start_time = time.perf_counter()
+        client = self._get_client()
+        results: Dict[str, Union[ReviewResponse, CustomInternalServerException]] = {}
+        pending: Dict[str, Tuple[ReviewRequest, str, str, List[Tuple[str, ReviewRequest]]]] = {}
+        for item_id, request in items:
+            style = self._normalize_style(request.style)
+            language = self._resolve_language(request.language, request.code)
+            canonical = self._canonicalize(request.code, language)
+            key = self._cache_key(request, style, language, client, canonical)
+            cached = self._lookup_cache(key, start_time, code=request.code, canonical=canonical)
+            if cached is not None:
+                self._remember_session(request, cached)
+                results[item_id] = cached
+            elif key in pending:
+                pending[key][3].append((item_id, request))
+            else:
+                pending[key] = (request, style, language, [(item_id, request)])
+        if not pending:
+            return results
+
+        run_batch = getattr(client, "run_review_batch", None)
+        if run_batch is None:
+            for request, _, language, members in pending.values():
+                try:
+                    outcome: Union[ReviewResponse, CustomInternalServerException] = self._generate_review(request)
+                except CustomInternalServerException as exc:
+                    outcome = exc
+                self._fan_out(results, members, language, outcome)
+            return results
+
+        entries: List[ReviewBatchEntry] = []
+        plans: Dict[
+            str,
+            Tuple[Optional[List[CodeChunk]], List[str], Optional[DiffReviewPlan], Optional[ContextSelection]],
+        ] = {}
+        for index, (key, (request, style, language, _)) in enumerate(pending.items()):
+            diff_plan = self._plan_diff(request) if request.diff is not None else None
+            selection: Optional[ContextSelection] = None
+            if diff_plan is not None:
+                chunks: Optional[List[CodeChunk]] = list(diff_plan.windows)
+                codes = [chunk.text for chunk in diff_plan.windows]
+            else:
+                chunks = self._plan_chunks(request.code)
+                if chunks is None:
+                    selection = self._select_context(request.code, style)
+                codes = [chunk.text for chunk in chunks] if chunks else [selection.text]  # type: ignore[union-attr]
+            custom_ids = [f"review-{index}-{part}" for part in range(len(codes))]
+            entries.extend(
+                ReviewBatchEntry(custom_id=custom_id, request=request, language=language, style=style, code=code)
+                for custom_id, code in zip(custom_ids, codes)
+            )
+            plans[key] = (chunks, custom_ids, diff_plan, selection)
+
+        try:
+            batch_results = run_batch(entries, poll_interval=poll_interval, timeout=timeout) if entries else {}
+        except ClaudeReviewError as exc:
+            for request, style, language, members in pending.values():
+                self._fan_out(results, members, language, self._remote_failure(request, style, language, exc))
+            return results
+
+        for key, (request, style, language, members) in pending.items():
+            chunks, custom_ids, diff_plan, selection = plans[key]
+            payloads = [
+                batch_results.get(custom_id, ClaudeReviewError("Claude 배치 결과가 없습니다."))
+                for custom_id in custom_ids
+            ]
+            failure = next((payload for payload in payloads if isinstance(payload, ClaudeReviewError)), None)
+            if failure is not None:
+                self._fan_out(results, members, language, self._remote_failure(request, style, language, failure))
+                continue
+
+            if diff_plan is not None:
+                merged = self._merge_chunk_payloads(chunks, payloads) if chunks else {"suggestions": []}
+                remote_payload = self._keep_changed_suggestions(merged, diff_plan)
+            elif chunks:
+                remote_payload = self._mark_chunk_coverage(
+                    request.code, chunks, self._merge_chunk_payloads(chunks, payloads)
+                )
+            else:
+                remote_payload = self._restore_selection(payloads[0], selection)  # type: ignore[arg-type]
+            response = self._build_remote_data(
+                request=request,
+                style=style,
+                language=language,
+                remote_payload=remote_payload,
+                client=client,
+                started_at=start_time,
             )
-            raise CustomInternalServerException(
-                ErrorCode.SERVICE_UNAVAILABLE,
-                detail=error_context,
-            ) from exc
+            self._store_cache(key, response, self._canonicalize(request.code, language))
+            self._fan_out(results, members, language, response)
+        return results
 
     # --- helpers -----------------------------------------------------------------
 
+    def _fan_out(
+        self,
+        results: Dict[str, Union[ReviewResponse, CustomInternalServerException]],
+        members: List[Tuple[str, ReviewRequest]],
+        language: str,
+        outcome: Union[ReviewResponse, CustomInternalServerException],
+    ) -> None:
+        """Give every member its own copy of ``outcome``; successful copies become sessions."""
+
+        for index, (item_id, request) in enumerate(members):
+            result = outcome
+            if index and isinstance(outcome, ReviewResponse):
+                result = self._share(outcome, request, language)
+            if isinstance(result, ReviewResponse):
+                self._remember_session(request, result)
+            results[item_id] = result
+
+    @staticmethod
+    def _build_default_cache() -> Optional[Union[ReviewCache, TieredReviewCache]]:
+        settings = get_settings()
+        memory = (
+            ReviewCache(
+                max_entries=settings.review_cache_max_entries,
+                max_bytes=settings.review_cache_max_bytes,
+                ttl_seconds=settings.review_cache_ttl_seconds,
+            )
+            if settings.review_cache_enabled
+            else None
+        )
+        if not settings.review_cache_persistent_enabled:
+            return memory
+        persistent = PersistentReviewCache(
+            settings.review_cache_db_path,
+            max_bytes=settings.review_cache_db_max_bytes,
+            ttl_seconds=settings.review_cache_db_ttl_seconds,
+            stale_seconds=settings.review_cache_stale_seconds,
+            compress=settings.review_cache_compress,
+        )
+        return TieredReviewCache(memory, persistent)
+
+    @staticmethod
+    def _build_default_normalization() -> Optional[NormalizationOptions]:
+        settings = get_settings()
+        if not settings.review_cache_normalize:
+            return None
+        return NormalizationOptions(strip_comments=settings.review_cache_strip_comments)
+
+    @staticmethod
+    def _build_default_sessions() -> Optional[ReviewSessionStore]:
+        settings = get_settings()
+        if not settings.review_sessions_enabled:
+            return None
+        return ReviewSessionStore(
+            max_entries=settings.review_session_max_entries,
+            ttl_seconds=settings.review_session_ttl_seconds,
+        )
+
+    @staticmethod
+    def _build_default_context_selection() -> Optional[ContextSelectionOptions]:
+        settings = get_settings()
+        if not settings.review_context_selection_enabled:
+            return None
+        return ContextSelectionOptions()
+
+    @staticmethod
+    def _build_default_chunking() -> Optional[ChunkingOptions]:
+        settings = get_settings()
+        if not settings.review_chunking_enabled:
+            return None
+        return ChunkingOptions(
+            max_chars=settings.review_chunk_max_chars,
+            max_chunks=settings.review_chunk_max_count,
+            concurrency=settings.review_chunk_concurrency,
+            overlap_lines=settings.review_chunk_overlap_lines,
+        )
+
+    @staticmethod
+    def _build_default_micro_batching() -> Optional[MicroBatchOptions]:
+        settings = get_settings()
+        if not settings.review_micro_batch_enabled:
+            return None
+        return MicroBatchOptions(
+            window_ms=settings.review_micro_batch_window_ms,
+            max_batch_size=settings.review_micro_batch_max_size,
+            max_item_chars=settings.review_input_max_chars,
+        )
+
+    def _fetch_remote(
+        self,
+        client: ClaudeReviewClient,
+        request: ReviewRequest,
+        *,
+        language: str,
+        style: str,
+    ) -> dict:
+        if request.diff is not None:
+            plan = self._plan_diff(request)
+            if not plan.windows:
+                return {"suggestions": []}
+            payload = self._review_chunks(client, request, list(plan.windows), language=language, style=style)
+            return self._keep_changed_suggestions(payload, plan)
+
+        chunks = self._plan_chunks(request.code)
+        if chunks is None:
+            selection = self._select_context(request.code, style)
+            payload = client.create_review(request, language=language, style=style, code=selection.text)
+            return self._restore_selection(payload, selection)
+        payload = self._review_chunks(client, request, chunks, language=language, style=style)
+        return self._mark_chunk_coverage(request.code, chunks, payload)
+
+    def _review_chunks(
+        self,
+        client: ClaudeReviewClient,
+        request: ReviewRequest,
+        chunks: List[CodeChunk],
+        *,
+        language: str,
+        style: str,
+    ) -> dict:
+        def review_chunk(chunk: CodeChunk) -> dict:
+            return client.create_review(request, language=language, style=style, code=chunk.text)
+
+        workers = max(1, min(self._chunk_concurrency(), len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            payloads = list(executor.map(review_chunk, chunks))
+        return self._merge_chunk_payloads(chunks, payloads)
+
+    async def _fetch_remote_async(
+        self,
+        client: ClaudeReviewClient,
+        request: ReviewRequest,
+        *,
+        language: str,
+        style: str,
+        focus_lines: FrozenSet[int] = frozenset(),
+    ) -> dict:
+        if request.diff is not None:
+            plan = self._plan_diff(request)
+            if not plan.windows:
+                return {"suggestions": []}
+            payload = await self._review_chunks_async(
+                client, request, list(plan.windows), language=language, style=style
+            )
+            return self._keep_changed_suggestions(payload, plan)
+
+        chunks = self._plan_chunks(request.code)
+        if chunks is None and self._can_micro_batch(client, request.code):
+            entry = ReviewBatchEntry(
+                custom_id="",
+                request=request,
+                language=language,
+                style=style,
+                code=request.code,
+            )
+            return await self._micro_batcher.submit(entry)  # type: ignore[union-attr]
+        if chunks is None:
+            selection = self._select_context(request.code, style, focus_lines)
+            payload = await self._call_client_async(
+                client,
+                request,
+                language=language,
+                style=style,
+                code=selection.text,
+            )
+            return self._restore_selection(payload, selection)
+        payload = await self._review_chunks_async(client, request, chunks, language=language, style=style)
+        return self._mark_chunk_coverage(request.code, chunks, payload)
+
+    async def _review_chunks_async(
+        self,
+        client: ClaudeReviewClient,
+        request: ReviewRequest,
+        chunks: List[CodeChunk],
+        *,
+        language: str,
+        style: str,
+    ) -> dict:
+        semaphore = asyncio.Semaphore(max(1, self._chunk_concurrency()))
+
+        async def review_chunk(chunk: CodeChunk) -> dict:
+            async with semaphore:
+                return await self._call_client_async(
+                    client,
+                    request,
+                    language=language,
+                    style=style,
+                    code=chunk.text,
+                )
+
+        tasks = [asyncio.ensure_future(review_chunk(chunk)) for chunk in chunks]
+        try:
+            payloads = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return self._merge_chunk_payloads(chunks, payloads)
+
+    def _can_micro_batch(self, client: ClaudeReviewClient, code: str) -> bool:
+        return (
+            self._micro_batcher is not None
+            and len(code) <= self._micro_batcher.options.max_item_chars
+            and callable(getattr(client, "acreate_review_many", None))
+        )
+
+    async def _run_micro_batch(
+        self, entries: List[ReviewBatchEntry]
+    ) -> List[Union[dict, BaseException]]:
+        client = self._get_client()
+        if len(entries) == 1:
+            entry = entries[0]
+            return [
+                await self._call_client_async(
+                    client,
+                    entry.request,
+                    language=entry.language,
+                    style=entry.style,
+                    code=entry.code or entry.request.code,
+                )
+            ]
+
+        # Item ids only need to be unique inside one upstream message.
+        tagged = [replace(entry, custom_id=f"item-{index}") for index, entry in enumerate(entries)]
+        return list(await client.acreate_review_many(tagged))
+
+    def _chunk_concurrency(self) -> int:
+        return (self._chunking or ChunkingOptions()).concurrency
+
+    def _plan_diff(self, request: ReviewRequest) -> DiffReviewPlan:
+        return plan_diff_review(
+            parse_unified_diff(request.diff or ""),
+            request.code,
+            context_lines=self._diff_context_lines,
+        )
+
+    @staticmethod
+    def _keep_changed_suggestions(payload: dict, plan: DiffReviewPlan) -> dict:
+        """Drop suggestions that only concern context lines around the diff."""
+
+        kept = [
+            suggestion
+            for suggestion in payload.get("suggestions") or []
+            if plan.touches_change(suggestion["range"]["startLine"], suggestion["range"]["endLine"])
+        ]
+        return {**payload, "suggestions": kept}
+
+    def _fallback_suggestions(self, request: ReviewRequest, style: str) -> List[Suggestion]:
+        """Local heuristics for ``request``, limited to the changed lines of a diff request."""
+
+        suggestions = self._collect_suggestions(request.code, style)
+        if request.diff is None:
+            return suggestions
+        plan = self._plan_diff(request)
+        return [
+            suggestion
+            for suggestion in suggestions
+            if plan.touches_change(suggestion.range.start_line, suggestion.range.end_line)
+        ]
+
+    def _plan_chunks(self, code: str) -> Optional[List[CodeChunk]]:
+        if self._chunking is None or len(code) <= self._max_input_chars:
+            return None
+        return split_into_chunks(code, self._chunking)
+
+    @staticmethod
+    def _mark_chunk_coverage(code: str, chunks: List[CodeChunk], payload: dict) -> dict:
+        """Flag a chunked review that stopped at ``max_chunks`` before the end of the input."""
+
+        total_lines = code.count("\n") + 1
+        reviewed_lines = chunks[-1].end_line if chunks else total_lines
+        if reviewed_lines >= total_lines:
+            return payload
+        logger.warning(
+            "청크 수 제한(%s개)에 도달해 전체 %s줄 중 %s줄까지만 리뷰했습니다.",
+            len(chunks),
+            total_lines,
+            reviewed_lines,
+        )
+        return {**payload, "reviewedLines": reviewed_lines, "truncated": True}
+
+    def _merge_chunk_payloads(self, chunks: List[CodeChunk], payloads: List[dict]) -> dict:
+        suggestions = merge_chunk_suggestions(
+            [
+                (chunk, self._normalize_remote_suggestions(payload.get("suggestions"), chunk.text))
+                for chunk, payload in zip(chunks, payloads)
+            ]
+        )
+        summary = merge_chunk_summaries(
+            [(chunk, payload.get("summary")) for chunk, payload in zip(chunks, payloads)]
+        )
+        usage: Dict[str, int] = {}
+        for payload in payloads:
+            for field, value in (payload.get("usage") or {}).items():
+                usage[field] = usage.get(field, 0) + value
+        return {
+            "summary": summary,
+            "suggestions": [suggestion.model_dump(by_alias=True) for suggestion in suggestions],
+            "usage": usage,
+        }
+
+    def _cache_key(
+        self,
+        request: ReviewRequest,
+        style: str,
+        language: str,
+        client: ClaudeReviewClient,
+        canonical: Optional[NormalizedCode] = None,
+    ) -> str:
+        code = canonical.text if canonical is not None else request.code
+        if request.diff is not None:
+            # Diff requests only review the changed lines, so the diff is part of the input.
+            code = f"{code}\n\0diff\0\n{request.diff}"
+        return build_cache_key(
+            code=code,
+            language=language,
+            style=style,
+            model=client.model_name,
+            prompt_version=getattr(client, "prompt_version", PROMPT_VERSION),
+        )
+
+    def _canonicalize(self, code: str, language: str) -> Optional[NormalizedCode]:
+        if self._normalization is None:
+            return None
+        return normalize_code(code, language, strip_comments=self._normalization.strip_comments)
+
+    def _lookup_cache(
+        self,
+        cache_key: str,
+        started_at: float,
+        *,
+        code: str,
+        canonical: Optional[NormalizedCode] = None,
+        allow_stale: bool = False,
+    ) -> Optional[ReviewResponse]:
+        """Return a cache hit as a new session for ``code``; stale hits only when ``allow_stale``."""
+
+        if self._cache is None:
+            return None
+        found = self._cache.lookup(cache_key)
+        if found is None or (found.stale and not allow_stale):
+            return None
+
+        cached = self._from_canonical(found.response, code, canonical)
+        return cached.model_copy(
+            deep=True,
+            update={
+                "session_id": str(uuid4()),
+                "metrics": ReviewMetrics(
+                    processing_time_ms=int((time.perf_counter() - started_at) * 1000),
+                    model=cached.metrics.model,
+                    cached=True,
+                    stale=found.stale,
+                ),
+            },
+        )
+
+    async def _alookup_cache(
+        self,
+        cache_key: str,
+        started_at: float,
+        *,
+        code: str,
+        canonical: Optional[NormalizedCode] = None,
+        allow_stale: bool = False,
+    ) -> Optional[ReviewResponse]:
+        """:meth:`_lookup_cache` for the event loop; the SQLite tier is read in a worker thread."""
+
+        lookup = partial(
+            self._lookup_cache, cache_key, started_at, code=code, canonical=canonical, allow_stale=allow_stale
+        )
+        if isinstance(self._cache, TieredReviewCache):
+            return await asyncio.to_thread(lookup)
+        return lookup()
+
+    async def _astore_cache(
+        self,
+        cache_key: str,
+        response: ReviewResponse,
+        canonical: Optional[NormalizedCode] = None,
+    ) -> None:
+        if isinstance(self._cache, TieredReviewCache):
+            await asyncio.to_thread(self._store_cache, cache_key, response, canonical)
+        else:
+            self._store_cache(cache_key, response, canonical)
+
+    def _revalidate(self, cache_key: str, refresh: Callable[[], Awaitable[ReviewResponse]]) -> None:
+        """Refresh a stale entry in the background; failures keep serving the stale copy."""
+
+        task = asyncio.ensure_future(self._single_flight.run(cache_key, refresh))
+        self._revalidations.add(task)
+
+        def finished(done: "asyncio.Future[ReviewResponse]") -> None:
+            self._revalidations.discard(done)
+            if not done.cancelled() and done.exception() is not None:
+                logger.warning("오래된 캐시 항목 갱신에 실패했습니다: %s", done.exception())
+
+        task.add_done_callback(finished)
+
+    def _store_cache(
+        self,
+        cache_key: str,
+        response: ReviewResponse,
+        canonical: Optional[NormalizedCode] = None,
+    ) -> None:
+        if self._cache is not None:
+            self._cache.put(cache_key, self._to_canonical(response, canonical))
+
+    @staticmethod
+    def _to_canonical(response: ReviewResponse, canonical: Optional[NormalizedCode]) -> ReviewResponse:
+        """Cached copies of normalized inputs hold the canonical text and canonical line numbers."""
+
+        if canonical is None:
+            return response
+        return response.model_copy(
+            update={
+                "original_code": canonical.text,
+                "current_code": canonical.text,
+                "suggestions": canonical.to_canonical(response.suggestions),
+            }
+        )
+
+    @staticmethod
+    def _from_canonical(
+        response: ReviewResponse,
+        code: str,
+        canonical: Optional[NormalizedCode],
+    ) -> ReviewResponse:
+        if canonical is None:
+            return response
+        return response.model_copy(
+            update={
+                "original_code": code,
+                "current_code": code,
+                "suggestions": canonical.to_original(response.suggestions),
+            }
+        )
+
+    def _share(self, response: ReviewResponse, request: ReviewRequest, language: str) -> ReviewResponse:
+        """Copy a response as a new session for ``request``, rebased if it was built for a near-duplicate."""
+
+        if self._normalization is not None and response.original_code != request.code:
+            source = self._canonicalize(response.original_code, language)
+            target = self._canonicalize(request.code, language)
+            response = self._from_canonical(self._to_canonical(response, source), request.code, target)
+        return response.model_copy(deep=True, update={"session_id": str(uuid4())})
+
+    def _remember_session(self, request: ReviewRequest, response: ReviewResponse) -> None:
+        if self._sessions is None:
+            return
+        self._sessions.put(
+            ReviewSession(
+                session_id=response.session_id,
+                original_code=request.code,
+                code=request.code,
+                language=self._resolve_language(request.language, request.code),
+                style=self._normalize_style(request.style),
+                response=response,
+            )
+        )
+
+    def _get_client(self) -> ClaudeReviewClient:
+        client = self._review_client or ClaudeReviewClient()
+        self._review_client = client
+        return client
+
+    @staticmethod
+    async def _call_client_async(
+        client: ClaudeReviewClient,
+        request: ReviewRequest,
+        *,
+        language: str,
+        style: str,
+        code: str,
+    ) -> dict:
+        async_create = getattr(client, "acreate_review", None)
+        if async_create is not None:
+            return await async_create(request, language=language, style=style, code=code)
+
+        # Clients that only expose the blocking API run on a worker thread.
+        return await asyncio.to_thread(
+            client.create_review,
+            request,
+            language=language,
+            style=style,
+            code=code,
+        )
+
+    def _build_degraded_data(
+        self,
+        *,
+        request: ReviewRequest,
+        style: str,
+        language: str,
+        suggestions: List[Suggestion],
+        reason: str,
+        started_at: float,
+    ) -> ReviewResponse:
+        summary = DEGRADED_REVIEW_MESSAGE.format(
+            reason=reason,
+            summary=self._build_summary(style, language, suggestions),
+        )
+        return ReviewResponse(
+            session_id=str(uuid4()),
+            original_code=request.code,
+            current_code=request.code,
+            summary=summary,
+            suggestions=suggestions,
+            metrics=ReviewMetrics(
+                processing_time_ms=int((time.perf_counter() - started_at) * 1000),
+                model=FALLBACK_MODEL_NAME,
+                degraded=True,
+            ),
+        )
+
+    def _remote_failure(
+        self,
+        request: ReviewRequest,
+        style: str,
+        language: str,
+        exc: ClaudeReviewError,
+    ) -> CustomInternalServerException:
+        suggestions = self._fallback_suggestions(request, style)
+        fallback_summary = self._build_summary(style, language, suggestions)
+        error_context = REMOTE_REVIEW_FAILURE_MESSAGE.format(
+            reason=exc.user_message,
+            summary=fallback_summary,
+        )
+        # Shed calls never reached Claude; 429 tells the caller to back off rather than fail over.
+        error_code = (
+            ErrorCode.TOO_MANY_REQUESTS
+            if isinstance(exc, ClaudeOverloadedError)
+            else ErrorCode.SERVICE_UNAVAILABLE
+        )
+        return CustomInternalServerException(error_code, detail=error_context)
+
     def _build_remote_data(
         self,
         *,
@@ -118,7 +1154,7 @@ class ReviewService:
         started_at: float,
     ) -> ReviewResponse:
         remote_suggestions = remote_payload.get("suggestions")
-        suggestions = self._normalize_remote_suggestions(remote_suggestions)
+        suggestions = self._normalize_remote_suggestions(remote_suggestions, request.code)
 
         summary = remote_payload.get("summary")
         if not isinstance(summary, str) or not summary.strip():
@@ -144,6 +1180,10 @@ class ReviewService:
         if not model_name:
             model_name = client.model_name
 
+        reviewed_lines = remote_payload.get("reviewedLines")
+        if not isinstance(reviewed_lines, int):
+            reviewed_lines = None
+
         return ReviewResponse(
             session_id=str(uuid4()),
             original_code=request.code,
@@ -153,18 +1193,40 @@ class ReviewService:
             metrics=ReviewMetrics(
                 processing_time_ms=processing_ms,
                 model=model_name,
+                reviewed_lines=reviewed_lines,
+                truncated=remote_payload.get("truncated") is True,
+                **self._usage_metrics(remote_payload.get("usage")),
             ),
         )
 
-    def _normalize_remote_suggestions(self, raw_suggestions: Any) -> List[Suggestion]:
+    @staticmethod
+    def _usage_metrics(usage: Any) -> Dict[str, int]:
+        if not isinstance(usage, dict):
+            return {}
+        return {
+            field: value
+            for field, value in usage.items()
+            if field in ReviewMetrics.model_fields and isinstance(value, int)
+        }
+
+    def _normalize_remote_suggestions(self, raw_suggestions: Any, code: str) -> List[Suggestion]:
         if not isinstance(raw_suggestions, Iterable):
             return []
 
+        lines: Optional[List[str]] = None
         suggestions: List[Suggestion] = []
         for entry in raw_suggestions:
             if not isinstance(entry, dict):
                 continue
 
+            if is_compact_suggestion(entry):
+                if lines is None:
+                    lines = code.split("\n")
+                expanded = expand_compact_suggestion(entry, lines)
+                if expanded is None:
+                    continue
+                entry = expanded
+
             normalized = dict(entry)
             normalized.setdefault("id", str(uuid4()))
             normalized.setdefault("status", "pending")
@@ -184,10 +1246,38 @@ class ReviewService:
         normalized = style.lower()
         return normalized if normalized in STYLE_PROFILES else DEFAULT_STYLE
 
-    def _prepare_code_for_model(self, code: str) -> str:
-        if len(code) <= 500:
-            return code
-        return code[:500]
+    def _select_context(
+        self,
+        code: str,
+        style: str,
+        focus_lines: FrozenSet[int] = frozenset(),
+    ) -> ContextSelection:
+        """The part of ``code`` that fits the model input budget, ranked by review value."""
+
+        if len(code) <= self._max_input_chars or self._context_selection is None:
+            return truncate_context(code, self._max_input_chars)
+        hit_lines = {
+            line
+            for suggestion in self._collect_suggestions(code, style)
+            for line in range(suggestion.range.start_line, suggestion.range.end_line + 1)
+        }
+        return select_context(
+            code,
+            max_chars=self._max_input_chars,
+            hit_lines=hit_lines,
+            changed_lines=focus_lines,
+            options=self._context_selection,
+        )
+
+    def _restore_selection(self, payload: dict, selection: ContextSelection) -> dict:
+        """Move the suggestions of a review of ``selection.text`` back onto the full input's lines."""
+
+        if selection.complete:
+            return payload
+        suggestions = selection.to_original(
+            self._normalize_remote_suggestions(payload.get("suggestions"), selection.text)
+        )
+        return {**payload, "suggestions": [suggestion.model_dump(by_alias=True) for suggestion in suggestions]}
 
     def _resolve_language(self, language: Optional[str], code: str) -> str:
         if language:
@@ -218,174 +1308,4 @@ class ReviewService:
         )
 
     def _collect_suggestions(self, code: str, style: str) -> List[Suggestion]:
-        builders: List[Iterable[Suggestion]] = []
-        if style in {"bug", "detail"}:
-            builders.append(self._find_non_strict_equality(code))
-        if style in {"bug", "refactor", "detail"}:
-            builders.append(self._find_console_logs(code))
-        if style in {"detail", "refactor"}:
-            builders.append(self._find_sparse_todos(code))
-        if style in {"test"}:
-            builders.append(self._propose_test_scaffold(code))
-
-        suggestions: List[Suggestion] = []
-        for iterable in builders:
-            suggestions.extend(iterable)
-        return suggestions
-
-    def _find_non_strict_equality(self, code: str) -> Iterable[Suggestion]:
-        suggestions: List[Suggestion] = []
-        for idx, line in enumerate(code.splitlines(), start=1):
-            if "==" not in line or "===" in line or "!==" in line:
-                continue
-            col = line.index("==") + 1
-            new_line = line.replace("==", "===", 1)
-            diff = "\n".join(
-                [
-                    "--- original",
-                    "+++ updated",
-                    f"@@ -{idx} +{idx} @@",
-                    f"-{line}",
-                    f"+{new_line}",
-                ]
-            )
-            suggestions.append(
-                Suggestion(
-                    id=str(uuid4()),
-                    title="동등 연산자 강화",
-                    rationale="JavaScript에서는 엄격한 비교(===)가 암묵적 형 변환으로 인한 버그를 예방합니다.",
-                    severity="major",
-                    tags=["bug", "best-practice"],
-                    range=SuggestionRange(
-                        start_line=idx,
-                        start_col=col,
-                        end_line=idx,
-                        end_col=col + 2,
-                    ),
-                    fix=SuggestionFix(type="unified-diff", diff=diff),
-                    fix_snippet=new_line.strip(),
-                    confidence=0.7,
-                    status="pending",
-                )
-            )
-        return suggestions
-
-    def _find_console_logs(self, code: str) -> Iterable[Suggestion]:
-        suggestions: List[Suggestion] = []
-        for idx, line in enumerate(code.splitlines(), start=1):
-            if "console.log" not in line:
-                continue
-            stripped = line.rstrip("\n")
-            indent = len(stripped) - len(stripped.lstrip(" "))
-            replacement = " " * indent + "// TODO: 필요한 경우 로깅 가드를 적용하세요."
-            diff = "\n".join(
-                [
-                    "--- original",
-                    "+++ updated",
-                    f"@@ -{idx} +{idx} @@",
-                    f"-{stripped}",
-                    f"+{replacement}",
-                ]
-            )
-            suggestions.append(
-                Suggestion(
-                    id=str(uuid4()),
-                    title="디버그 로그 정리",
-                    rationale="프로덕션 코드에서는 console.log를 제거하거나 환경에 따라 제어하는 것이 좋습니다.",
-                    severity="minor",
-                    tags=["cleanup", "refactor"],
-                    range=SuggestionRange(
-                        start_line=idx,
-                        start_col=stripped.index("console.log") + 1,
-                        end_line=idx,
-                        end_col=stripped.index("console.log") + len("console.log") + 1,
-                    ),
-                    fix=SuggestionFix(type="unified-diff", diff=diff),
-                    fix_snippet=replacement.strip(),
-                    confidence=0.6,
-                    status="pending",
-                )
-            )
-        return suggestions
-
-    def _find_sparse_todos(self, code: str) -> Iterable[Suggestion]:
-        suggestions: List[Suggestion] = []
-        for idx, line in enumerate(code.splitlines(), start=1):
-            if "TODO" not in line:
-                continue
-            if ":" in line:
-                # Already has a description.
-                continue
-            stripped = line.rstrip("\n")
-            placeholder = stripped.replace("TODO", "TODO: 세부 설명을 추가하세요")
-            diff = "\n".join(
-                [
-                    "--- original",
-                    "+++ updated",
-                    f"@@ -{idx} +{idx} @@",
-                    f"-{stripped}",
-                    f"+{placeholder}",
-                ]
-            )
-            suggestions.append(
-                Suggestion(
-                    id=str(uuid4()),
-                    title="TODO 세부 설명 추가",
-                    rationale="TODO에는 구체적인 작업 내용을 작성해야 추후 처리하기 쉽습니다.",
-                    severity="minor",
-                    tags=["documentation", "detail"],
-                    range=SuggestionRange(
-                        start_line=idx,
-                        start_col=stripped.index("TODO") + 1,
-                        end_line=idx,
-                        end_col=stripped.index("TODO") + len("TODO") + 1,
-                    ),
-                    fix=SuggestionFix(type="unified-diff", diff=diff),
-                    fix_snippet=placeholder.strip(),
-                    confidence=0.5,
-                    status="pending",
-                )
-            )
-        return suggestions
-
-    def _propose_test_scaffold(self, code: str) -> Iterable[Suggestion]:
-        lowered = code.lower()
-        has_test_keyword = any(
-            keyword in lowered for keyword in ("test(", "it(", "describe(", "expect(", "assert(")
-        )
-        if has_test_keyword:
-            return []
-
-        snippet = (
-            "describe('module', () => {\n"
-            "  it('should do something meaningful', () => {\n"
-            "    // TODO: add assertions matching the new behaviour\n"
-            "  });\n"
-            "});"
-        )
-        total_lines = code.count("\n") + 1
-        diff_lines = [
-            "--- original",
-            "+++ updated",
-            f"@@ +{total_lines + 1},{4} @@",
-        ] + [f"+{line}" for line in snippet.splitlines()]
-        diff = "\n".join(diff_lines)
-
-        suggestion = Suggestion(
-            id=str(uuid4()),
-            title="테스트 스캐폴드 추가",
-            rationale="새로운 변경 사항이 테스트로 검증되면 회귀를 예방할 수 있습니다.",
-            severity="major",
-            tags=["test", "quality"],
-            range=SuggestionRange(
-                start_line=total_lines,
-                start_col=1,
-                end_line=total_lines,
-                end_col=1,
-            ),
-            fix=SuggestionFix(type="unified-diff", diff=diff),
-            fix_snippet=snippet,
-            confidence=0.4,
-            status="pending",
-        )
-        return [suggestion]
+        return self._rules.scan(code, style)
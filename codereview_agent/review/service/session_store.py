@@ -0,0 +1,91 @@
+"""In-memory store of review sessions that can be re-reviewed incrementally."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from codereview_agent.review.schemas import ReviewResponse
+
+
+@dataclass(frozen=True)
+class ReviewSession:
+    session_id: str
+    original_code: str
+    code: str
+    language: str
+    style: str
+    response: ReviewResponse
+    revision: int = 1
+
+
+@dataclass
+class SessionStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class ReviewSessionStore:
+    """LRU of the latest code and review per session, bounded by count and idle TTL.
+
+    Sessions live in the worker process that created them, so multi-worker
+    deployments need sticky routing for ``PATCH`` calls.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max(1, max_entries)
+        self._ttl = max(0.0, ttl_seconds)
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[ReviewSession, Optional[float]]]" = OrderedDict()
+        self._stats = SessionStats()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> Optional[ReviewSession]:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            session, expires_at = entry
+            if expires_at is not None and expires_at <= self._clock():
+                del self._entries[session_id]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(session_id)
+            self._stats.hits += 1
+            return session
+
+    def put(self, session: ReviewSession) -> None:
+        # Every update restarts the idle TTL.
+        expires_at = self._clock() + self._ttl if self._ttl else None
+        with self._lock:
+            self._entries.pop(session.session_id, None)
+            self._entries[session.session_id] = (session, expires_at)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._stats.entries = len(self._entries)
+            return self._stats.as_dict()
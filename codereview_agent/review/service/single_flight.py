@@ -0,0 +1,55 @@
+"""Coalesce identical in-flight upstream calls into a single execution."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, Dict, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    leaders: int = 0
+    coalesced: int = 0
+    in_flight: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class SingleFlight(Generic[T]):
+    """Run at most one coroutine per key; concurrent callers share its outcome.
+
+    The shared call runs in its own task, so a caller that is cancelled (for
+    example because its HTTP client disconnected) does not abort the upstream
+    request for the remaining followers.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[str, "asyncio.Future[T]"] = {}
+        self._stats = SingleFlightStats()
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        task = self._in_flight.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(factory())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda finished: self._forget(key, finished))
+            self._stats.leaders += 1
+        else:
+            self._stats.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, int]:
+        self._stats.in_flight = len(self._in_flight)
+        return self._stats.as_dict()
+
+    def _forget(self, key: str, finished: "asyncio.Future[T]") -> None:
+        if self._in_flight.get(key) is finished:
+            del self._in_flight[key]
+        if not finished.cancelled():
+            # Mark the exception as retrieved when every follower went away.
+            finished.exception()
@@ -0,0 +1,99 @@
+"""Incremental extraction of suggestion objects from a streamed JSON review."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Optional
+
+
+class SuggestionStreamParser:
+    """Feed text deltas of the review document; collect each completed suggestion.
+
+    The parser tracks just enough JSON structure (container stack, strings and
+    escapes, top-level keys) to know when an element of the top-level
+    ``suggestions`` array has been closed. That element is decoded on its own,
+    so callers can forward it before the rest of the document has been generated.
+    Text before the first ``{`` (for example a Markdown fence) is ignored.
+    """
+
+    def __init__(self, array_key: str = "suggestions") -> None:
+        self._array_key = array_key
+        self._text = ""
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._last_string: Optional[str] = None
+        self._top_level_key: Optional[str] = None
+        self._expect_key = False
+        self._element_start = -1
+        self._started = False
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+
+        return self._text
+
+    def feed(self, delta: str) -> List[Dict[str, Any]]:
+        completed: List[Dict[str, Any]] = []
+        base = len(self._text)
+        self._text += delta
+
+        for offset, char in enumerate(delta):
+            position = base + offset
+            if not self._started:
+                if char != "{":
+                    continue
+                self._started = True
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._expect_key and len(self._stack) == 1:
+                        self._last_string = self._text[self._string_start + 1 : position]
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = position
+            elif char == ":" and len(self._stack) == 1 and self._expect_key:
+                self._top_level_key = self._last_string
+                self._expect_key = False
+            elif char == "," and len(self._stack) == 1:
+                self._expect_key = True
+            elif char in "{[":
+                if char == "{" and self._in_target_array():
+                    self._element_start = position
+                self._stack.append(char)
+                if len(self._stack) == 1:
+                    self._expect_key = True
+            elif char in "}]":
+                if not self._stack:
+                    continue
+                self._stack.pop()
+                if char == "}" and self._in_target_array() and self._element_start >= 0:
+                    element = self._decode(self._element_start, position + 1)
+                    self._element_start = -1
+                    if element is not None:
+                        completed.append(element)
+
+        return completed
+
+    def _in_target_array(self) -> bool:
+        return (
+            len(self._stack) == 2
+            and self._stack[1] == "["
+            and self._top_level_key == self._array_key
+        )
+
+    def _decode(self, start: int, end: int) -> Optional[Dict[str, Any]]:
+        try:
+            value = json.loads(self._text[start:end])
+        except json.JSONDecodeError:
+            return None
+        return value if isinstance(value, dict) else None
@@ -0,0 +1,128 @@
+"""Parse single-file unified diffs and apply them to a base text."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+_HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+class PatchError(ValueError):
+    """Raised when a diff cannot be read or does not match the text it is applied to."""
+
+
+@dataclass(frozen=True)
+class DiffHunk:
+    old_start: int
+    old_count: int
+    new_start: int
+    new_count: int
+    # Body lines with their `` ``/``-``/``+`` prefix kept.
+    lines: Tuple[str, ...]
+
+    def new_lines(self) -> List[Tuple[int, str, bool]]:
+        """``(new line number, text, added)`` for every line present in the new file."""
+
+        result: List[Tuple[int, str, bool]] = []
+        number = self.new_start
+        for line in self.lines:
+            if line.startswith("-"):
+                continue
+            result.append((number, line[1:], line.startswith("+")))
+            number += 1
+        return result
+
+
+def parse_unified_diff(diff: str) -> List[DiffHunk]:
+    """Read the hunks of a unified diff for one file.
+
+    File headers (``diff --git``, ``---``/``+++``, ``index``) are skipped; a
+    second ``+++`` header after hunks means the diff spans several files and
+    is rejected. ``\\ No newline at end of file`` markers are ignored.
+    """
+
+    hunks: List[DiffHunk] = []
+    lines = diff.split("\n")
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+        index += 1
+        if line.startswith("+++ ") and hunks:
+            raise PatchError("diff에는 한 파일의 변경만 포함할 수 있습니다.")
+        match = _HUNK_HEADER.match(line)
+        if match is None:
+            continue
+
+        old_start, new_start = int(match.group(1)), int(match.group(3))
+        old_count = int(match.group(2)) if match.group(2) is not None else 1
+        new_count = int(match.group(4)) if match.group(4) is not None else 1
+        if hunks and old_start < hunks[-1].old_start + hunks[-1].old_count:
+            raise PatchError("diff hunk가 겹치거나 순서가 맞지 않습니다.")
+
+        body: List[str] = []
+        old_seen = new_seen = 0
+        while (old_seen < old_count or new_seen < new_count) and index < len(lines):
+            line = lines[index]
+            index += 1
+            if line.startswith("\\"):
+                continue
+            # Some tools strip the single space of empty context lines.
+            tag = line[:1] or " "
+            if tag not in " -+":
+                raise PatchError(f"diff hunk 본문을 해석할 수 없습니다: {line[:40]!r}")
+            body.append(tag + line[1:])
+            old_seen += tag != "+"
+            new_seen += tag != "-"
+        if old_seen != old_count or new_seen != new_count:
+            raise PatchError("diff hunk의 줄 수가 헤더와 일치하지 않습니다.")
+        hunks.append(DiffHunk(old_start, old_count, new_start, new_count, tuple(body)))
+
+    if not hunks:
+        raise PatchError("diff에서 hunk(@@ ... @@)를 찾을 수 없습니다.")
+    return hunks
+
+
+def apply_unified_diff(base: str, hunks: Sequence[DiffHunk]) -> str:
+    """Return ``base`` with ``hunks`` applied; context and removed lines must match exactly."""
+
+    lines = base.split("\n")
+    result: List[str] = []
+    cursor = 0
+    for hunk in hunks:
+        # A hunk that removes nothing names the line it inserts after.
+        start = hunk.old_start - 1 if hunk.old_count else hunk.old_start
+        if start < cursor or start > len(lines):
+            raise PatchError(f"{hunk.old_start}번째 줄의 diff hunk를 적용할 수 없습니다.")
+        result.extend(lines[cursor:start])
+        cursor = start
+        for line in hunk.lines:
+            tag, text = line[:1], line[1:]
+            if tag == "+":
+                result.append(text)
+                continue
+            if cursor >= len(lines) or lines[cursor] != text:
+                raise PatchError(f"{cursor + 1}번째 줄이 diff 내용과 일치하지 않습니다.")
+            if tag == " ":
+                result.append(text)
+            cursor += 1
+    result.extend(lines[cursor:])
+    return "\n".join(result)
+
+
+def render_new_side(hunks: Sequence[DiffHunk], *, max_lines: int) -> str:
+    """New-file text known from the hunks alone; lines the diff does not show are left blank.
+
+    Keeping unknown lines as blanks preserves new-file line numbers when the
+    base file is not available. Hunks reaching past ``max_lines`` are rejected
+    before any blank line is built.
+    """
+
+    for hunk in hunks:
+        if hunk.new_start + hunk.new_count - 1 > max_lines:
+            raise PatchError(f"diff hunk가 새 파일의 최대 줄 수({max_lines}줄)를 넘습니다.")
+    known = {number: text for hunk in hunks for number, text, _ in hunk.new_lines()}
+    if not known:
+        return ""
+    return "\n".join(known.get(number, "") for number in range(1, max(known) + 1))
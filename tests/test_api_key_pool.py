@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service import ClaudeOverloadedError, ClaudeReviewError
+from codereview_agent.review.service.api_key_pool import (
+    ApiKeyPool,
+    ApiKeyPoolExhaustedError,
+    ApiKeyPoolOptions,
+    PooledApiKey,
+)
+from codereview_agent.review.service.rate_limiter import RateLimiter, RateLimitOptions
+from tests.test_claude_client import FakeClaudeServer, _client, _envelope
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_pool_prefers_key_with_most_headroom_and_round_robins_ties():
+    clock = FakeClock()
+    busy = RateLimiter(RateLimitOptions(requests_per_minute=10), clock=clock)
+    for _ in range(8):
+        busy.reserve(0)
+    idle = RateLimiter(RateLimitOptions(requests_per_minute=10), clock=clock)
+    pool = ApiKeyPool([PooledApiKey("key-busy-0001", busy), PooledApiKey("key-idle-0002", idle)], clock=clock)
+
+    assert pool.acquire().key == "key-idle-0002"
+
+    plain = ApiKeyPool([PooledApiKey("key-a"), PooledApiKey("key-b")], clock=clock)
+    assert [plain.acquire().key for _ in range(4)] == ["key-a", "key-b", "key-a", "key-b"]
+
+
+def test_rate_limited_and_unauthorized_keys_cool_down():
+    clock = FakeClock()
+    first, second = PooledApiKey("key-first-0001"), PooledApiKey("key-second-0002")
+    pool = ApiKeyPool(
+        [first, second],
+        ApiKeyPoolOptions(rate_limited_cooldown_seconds=30, unauthorized_cooldown_seconds=300),
+        clock=clock,
+    )
+
+    pool.report(first, 429, retry_after=5)
+    pool.report(second, 401)
+    with pytest.raises(ApiKeyPoolExhaustedError) as excinfo:
+        pool.acquire()
+    assert excinfo.value.retry_after == pytest.approx(5)
+
+    clock.now = 6
+    assert pool.acquire() is first
+    snapshot = pool.snapshot()["keys"]
+    assert snapshot[0]["rateLimited"] == 1
+    assert snapshot[1]["unauthorized"] == 1
+    assert snapshot[1]["key"] == "...0002"
+
+
+def test_client_rotates_to_next_key_after_429():
+    responses = [
+        (429, {"error": {"type": "rate_limit_error"}}, {"retry-after": "30"}),
+        (200, _envelope()),
+    ]
+
+    async def scenario():
+        async with FakeClaudeServer(responses) as server:
+            client = _client(server.url, api_keys=["key-one-0001", "key-two-0002"])
+            request = ReviewRequest(code="const a = 1;", style="bug")
+            payload = await client.acreate_review(request, language="javascript", style="bug")
+            await client.aclose()
+            return server, client, payload
+
+    server, client, payload = asyncio.run(scenario())
+
+    assert payload["summary"] == "Remote review summary"
+    assert [request["headers"]["x-api-key"] for request in server.requests] == ["key-one-0001", "key-two-0002"]
+    keys = client.stats()["apiKeys"]["keys"]
+    assert keys[0]["rateLimited"] == 1
+    assert keys[0]["coolingDownSeconds"] > 0
+
+
+def test_client_sheds_when_every_key_is_cooling_down():
+    async def scenario():
+        async with FakeClaudeServer([(401, {"error": {"type": "authentication_error"}})]) as server:
+            client = _client(server.url, api_key="key-only-0001")
+            request = ReviewRequest(code="const a = 1;", style="bug")
+            with pytest.raises(ClaudeReviewError) as excinfo:
+                await client.acreate_review(request, language="javascript", style="bug")
+            assert excinfo.value.status_code == 401
+            with pytest.raises(ClaudeOverloadedError):
+                await client.acreate_review(request, language="javascript", style="bug")
+            await client.aclose()
+            return server
+
+    server = asyncio.run(scenario())
+
+    assert len(server.requests) == 1
@@ -0,0 +1,92 @@
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from codereview_agent.app.main import codeReviewAgent
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service import ReviewService
+from codereview_agent.review.service.claude_client import ClaudeReviewError
+
+
+class SlowFirstClient:
+    model_name = "claude-3-haiku-20240307"
+
+    def __init__(self) -> None:
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def acreate_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+        self.calls.append(code)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.2 if code.startswith("slow") else 0.01)
+            if code.startswith("broken"):
+                raise ClaudeReviewError("네트워크 오류")
+            return {"summary": f"review of {code}", "suggestions": [], "metrics": {"model": self.model_name}}
+        finally:
+            self.in_flight -= 1
+
+
+def test_batch_dedupes_identical_files_and_bounds_concurrency():
+    client = SlowFirstClient()
+    service = ReviewService(review_client=client)
+    items = [
+        ("a", ReviewRequest(code="slow();", style="bug")),
+        ("b", ReviewRequest(code="fast();", style="bug")),
+        ("c", ReviewRequest(code="fast();", style="bug")),
+        ("d", ReviewRequest(code="other();", style="bug")),
+    ]
+
+    async def scenario():
+        return [pair async for pair in service.abatch_review(items, concurrency=2)]
+
+    results = asyncio.run(scenario())
+
+    ids = [item_id for item_id, _ in results]
+    assert ids[-1] == "a"
+    assert set(ids) == {"a", "b", "c", "d"}
+    assert sorted(client.calls) == ["fast();", "other();", "slow();"]
+    assert client.peak <= 2
+    by_id = dict(results)
+    assert by_id["b"].summary == by_id["c"].summary
+    assert by_id["b"].session_id != by_id["c"].session_id
+
+
+def test_batch_route_streams_ndjson_with_per_item_errors(monkeypatch):
+    service = ReviewService(review_client=SlowFirstClient())
+    monkeypatch.setattr("codereview_agent.review.api.review_router.review_service", service)
+
+    client = TestClient(codeReviewAgent)
+    response = client.post(
+        "/api/reviews/batch",
+        json={
+            "items": [
+                {"id": "ok.js", "code": "fast();", "style": "bug"},
+                {"id": "bad.js", "code": "broken();", "style": "bug"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = {line["id"]: line for line in map(json.loads, response.text.strip().splitlines())}
+    assert lines["ok.js"]["code"] == 200
+    assert lines["ok.js"]["data"]["summary"] == "review of fast();"
+    assert lines["bad.js"]["code"] == 503
+    assert lines["bad.js"]["status"] == "SERVICE_UNAVAILABLE"
+
+
+def test_batch_route_rejects_duplicate_ids(monkeypatch):
+    service = ReviewService(review_client=SlowFirstClient())
+    monkeypatch.setattr("codereview_agent.review.api.review_router.review_service", service)
+
+    client = TestClient(codeReviewAgent)
+    response = client.post(
+        "/api/reviews/batch",
+        json={"items": [{"id": "x", "code": "a();"}, {"id": "x", "code": "b();"}]},
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,119 @@
+import asyncio
+import threading
+
+import pytest
+
+from codereview_agent.common import CustomInternalServerException, ErrorCode
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service import ClaudeOverloadedError, ReviewService
+from codereview_agent.review.service.bulkhead import Bulkhead, BulkheadFullError, BulkheadOptions
+from tests.test_claude_client import FakeClaudeServer, _client
+
+
+def test_queue_full_sheds_immediately():
+    bulkhead = Bulkhead(BulkheadOptions(max_concurrent=1, max_queue=0, max_wait_seconds=1))
+    bulkhead.acquire()
+
+    with pytest.raises(BulkheadFullError):
+        bulkhead.acquire()
+
+    bulkhead.release()
+    bulkhead.acquire()
+    snapshot = bulkhead.snapshot()
+    assert snapshot["shedQueueFull"] == 1
+    assert snapshot["admitted"] == 2
+    assert snapshot["inFlight"] == 1
+
+
+def test_waiter_times_out_and_slot_is_handed_over_fifo():
+    bulkhead = Bulkhead(BulkheadOptions(max_concurrent=1, max_queue=4, max_wait_seconds=0.05))
+    bulkhead.acquire()
+
+    with pytest.raises(BulkheadFullError):
+        bulkhead.acquire()
+    assert bulkhead.snapshot()["queued"] == 0
+
+    order = []
+    bulkhead = Bulkhead(BulkheadOptions(max_concurrent=1, max_queue=4, max_wait_seconds=5))
+    bulkhead.acquire()
+
+    def worker(name):
+        bulkhead.acquire()
+        order.append(name)
+        bulkhead.release()
+
+    threads = []
+    for name in ("first", "second"):
+        thread = threading.Thread(target=worker, args=(name,))
+        thread.start()
+        threads.append(thread)
+        while bulkhead.snapshot()["queued"] < len(threads):
+            pass
+    bulkhead.release()
+    for thread in threads:
+        thread.join(2)
+
+    snapshot = bulkhead.snapshot()
+    assert order == ["first", "second"]
+    assert snapshot["inFlight"] == 0
+    assert snapshot["waitSeconds"]["count"] == 3
+    assert snapshot["queueDepth"]["buckets"]["1"] == 3
+
+
+def test_async_waiters_share_the_limit():
+    bulkhead = Bulkhead(BulkheadOptions(max_concurrent=2, max_queue=8, max_wait_seconds=5))
+    running = []
+    peak = []
+
+    async def call():
+        async with bulkhead.aslot():
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+
+    async def scenario():
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(scenario())
+
+    assert max(peak) == 2
+    assert bulkhead.snapshot()["admitted"] == 6
+
+
+def test_client_sheds_with_overloaded_error_without_calling_upstream():
+    bulkhead = Bulkhead(BulkheadOptions(max_concurrent=1, max_queue=0, max_wait_seconds=1))
+
+    async def scenario():
+        async with FakeClaudeServer(delay=0.1) as server:
+            client = _client(server.url, bulkhead=bulkhead)
+            request = ReviewRequest(code="const a = 1;", style="bug")
+            outcomes = await asyncio.gather(
+                client.acreate_review(request, language="javascript", style="bug"),
+                client.acreate_review(request, language="javascript", style="bug", code="const b = 2;"),
+                return_exceptions=True,
+            )
+            await client.aclose()
+            return server, client, outcomes
+
+    server, client, outcomes = asyncio.run(scenario())
+
+    assert len(server.requests) == 1
+    assert isinstance(outcomes[1], ClaudeOverloadedError)
+    assert client.stats()["bulkhead"]["shedQueueFull"] == 1
+
+
+class SheddingClient:
+    model_name = "claude-3-haiku-20240307"
+
+    async def acreate_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+        raise ClaudeOverloadedError("대기열이 가득 찼습니다.", retry_after=1)
+
+
+def test_service_reports_shed_calls_as_too_many_requests():
+    service = ReviewService(review_client=SheddingClient())
+
+    with pytest.raises(CustomInternalServerException) as excinfo:
+        asyncio.run(service.agenerate_review(ReviewRequest(code="const a = 1;", style="bug")))
+
+    assert excinfo.value.code is ErrorCode.TOO_MANY_REQUESTS
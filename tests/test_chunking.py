@@ -0,0 +1,125 @@
+import asyncio
+import time
+
+from codereview_agent.review.models import Suggestion, SuggestionFix, SuggestionRange
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service import ReviewService
+from codereview_agent.review.service.chunking import (
+    ChunkingOptions,
+    CodeChunk,
+    merge_chunk_suggestions,
+    split_into_chunks,
+)
+
+
+def _suggestion(line: int, *, title: str = "Issue", confidence: float = 0.5) -> Suggestion:
+    return Suggestion(
+        id=f"s-{line}",
+        title=title,
+        rationale="r",
+        severity="minor",
+        tags=[],
+        range=SuggestionRange(start_line=line, start_col=1, end_line=line, end_col=2),
+        fix=SuggestionFix(type="unified-diff", diff=f"@@ -{line} +{line} @@"),
+        fix_snippet="",
+        confidence=confidence,
+        status="pending",
+    )
+
+
+def _functions(count: int, body_lines: int = 8) -> str:
+    blocks = []
+    for index in range(count):
+        body = "\n".join(f"  const v{n} = {n};" for n in range(body_lines))
+        blocks.append(f"function f{index}() {{\n{body}\n}}")
+    return "\n".join(blocks) + "\n"
+
+
+def test_split_prefers_function_boundaries_and_covers_every_line():
+    code = _functions(6)
+    chunks = split_into_chunks(code, ChunkingOptions(max_chars=300, overlap_lines=0))
+
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert chunk.text.startswith("function ")
+    rebuilt = "\n".join(chunk.text for chunk in chunks)
+    assert rebuilt == code
+
+
+def test_merge_remaps_ranges_and_drops_seam_duplicates():
+    first = CodeChunk(start_line=1, text="a\nb\nc")
+    second = CodeChunk(start_line=3, text="c\nd")
+
+    merged = merge_chunk_suggestions(
+        [
+            (first, [_suggestion(3, title="Seam", confidence=0.4)]),
+            (second, [_suggestion(1, title="Seam", confidence=0.9), _suggestion(2)]),
+        ]
+    )
+
+    assert [item.range.start_line for item in merged] == [3, 4]
+    assert merged[0].confidence == 0.9
+    assert merged[1].fix.diff == "@@ -4 +4 @@"
+
+
+def test_chunked_review_runs_chunks_concurrently():
+    class SlowChunkClient:
+        model_name = "claude-3-haiku-20240307"
+
+        def __init__(self) -> None:
+            self.codes = []
+
+        async def acreate_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+            self.codes.append(code)
+            await asyncio.sleep(0.1)
+            return {
+                "summary": "chunk ok",
+                "suggestions": [_suggestion(1).model_dump(by_alias=True)],
+            }
+
+    client = SlowChunkClient()
+    service = ReviewService(
+        review_client=client,
+        chunking=ChunkingOptions(max_chars=300, concurrency=8, overlap_lines=0),
+    )
+    code = _functions(8)
+    request = ReviewRequest(code=code, style="bug")
+
+    started = time.perf_counter()
+    response = asyncio.run(service.agenerate_review(request))
+    elapsed = time.perf_counter() - started
+
+    assert len(client.codes) > 2
+    assert elapsed < 0.1 * len(client.codes)
+    assert response.original_code == code
+    starts = [suggestion.range.start_line for suggestion in response.suggestions]
+    assert starts[0] == 1 and len(starts) == len(client.codes) and starts == sorted(starts)
+
+
+def test_chunk_limit_is_reported_instead_of_claiming_a_full_review(caplog):
+    class ChunkClient:
+        model_name = "claude-3-haiku-20240307"
+
+        def create_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+            return {"summary": "chunk ok", "suggestions": []}
+
+    code = _functions(8)
+    limited = ReviewService(
+        review_client=ChunkClient(),
+        chunking=ChunkingOptions(max_chars=300, max_chunks=2, overlap_lines=0),
+    )
+    complete = ReviewService(
+        review_client=ChunkClient(),
+        chunking=ChunkingOptions(max_chars=300, overlap_lines=0),
+    )
+
+    with caplog.at_level("WARNING"):
+        truncated = limited.generate_review(ReviewRequest(code=code, style="bug"))
+    full = complete.generate_review(ReviewRequest(code=code, style="bug"))
+
+    chunks = split_into_chunks(code, ChunkingOptions(max_chars=300, max_chunks=2, overlap_lines=0))
+    assert truncated.metrics.truncated is True
+    assert truncated.metrics.reviewed_lines == chunks[-1].end_line < code.count("\n") + 1
+    assert "청크 수 제한" in caplog.text
+    assert full.metrics.truncated is False
+    assert full.metrics.reviewed_lines is None
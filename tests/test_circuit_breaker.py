@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from codereview_agent.app.main import codeReviewAgent
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service import ClaudeCircuitOpenError, ReviewService
+from codereview_agent.review.service.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakerOptions,
+)
+from tests.test_claude_client import FakeClaudeServer, _client
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock, **overrides) -> CircuitBreaker:
+    options = {"min_calls": 4, "error_rate_threshold": 0.5, "open_seconds": 10, "slow_call_seconds": 5}
+    options.update(overrides)
+    return CircuitBreaker(CircuitBreakerOptions(**options), clock=clock)
+
+
+def test_breaker_opens_on_error_rate_and_rejects_calls():
+    clock = FakeClock()
+    breaker = _breaker(clock)
+
+    for failed in (False, True, False, True):
+        assert breaker.allow()
+        (breaker.record_failure if failed else breaker.record_success)(0.1)
+
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.snapshot()["rejected"] == 1
+    assert breaker.retry_in() == pytest.approx(10)
+
+
+def test_breaker_half_open_probe_closes_or_reopens():
+    clock = FakeClock()
+    breaker = _breaker(clock, min_calls=1)
+    breaker.record_failure(0.1)
+    assert breaker.state == OPEN
+
+    clock.now = 11
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure(0.1)
+    assert breaker.state == OPEN
+
+    clock.now = 22
+    assert breaker.allow()
+    breaker.record_success(0.1)
+    assert breaker.state == CLOSED
+
+
+def test_breaker_trips_on_slow_calls_and_forgets_old_outcomes():
+    clock = FakeClock()
+    breaker = _breaker(clock, min_calls=2, window_seconds=30, slow_call_rate_threshold=1.0)
+
+    breaker.record_success(6)
+    clock.now = 40
+    breaker.record_success(6)
+    assert breaker.state == CLOSED
+
+    breaker.record_success(6)
+    assert breaker.state == OPEN
+
+
+def test_open_breaker_fails_fast_without_contacting_upstream():
+    async def scenario():
+        responses = [(503, {"error": "down"})] * 3
+        async with FakeClaudeServer(responses) as server:
+            breaker = CircuitBreaker(CircuitBreakerOptions(min_calls=2, open_seconds=60))
+            client = _client(server.url, max_attempts=3, circuit_breaker=breaker)
+            request = ReviewRequest(code="x")
+            with pytest.raises(ClaudeCircuitOpenError):
+                await client.acreate_review(request, language="javascript", style="bug")
+            return server, client.stats()
+
+    server, stats = asyncio.run(scenario())
+
+    assert len(server.requests) == 2
+    assert stats["circuitBreaker"]["state"] == OPEN
+
+
+def test_cancelled_half_open_probe_frees_its_slot():
+    clock = FakeClock()
+    breaker = _breaker(clock, min_calls=1)
+    breaker.record_failure(0.1)
+    clock.now = 11
+
+    async def scenario():
+        async with FakeClaudeServer(delay=0.5) as server:
+            client = _client(server.url, circuit_breaker=breaker)
+            request = ReviewRequest(code="x")
+            probe = asyncio.ensure_future(client.acreate_review(request, language="javascript", style="bug"))
+            await asyncio.sleep(0.1)
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+            return await client.acreate_review(request, language="javascript", style="bug")
+
+    assert asyncio.run(scenario())
+    assert breaker.state == CLOSED
+
+
+def test_health_endpoint_reports_breaker_state(monkeypatch):
+    class StatsClient:
+        model_name = "claude-3-haiku-20240307"
+
+        def stats(self):
+            return {"circuitBreaker": {"state": OPEN}, "transport": {}}
+
+    service = ReviewService(review_client=StatsClient())
+    monkeypatch.setattr("codereview_agent.review.api.review_router.review_service", service)
+
+    response = TestClient(codeReviewAgent).get("/api/health")
+
+    assert response.status_code == 200
+    body = response.json()["data"]
+    assert body["status"] == "degraded"
+    assert body["upstream"] == OPEN
+    assert "cache" in body["metrics"]
@@ -0,0 +1,348 @@
+import asyncio
+import json
+import socket
+import struct
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service.async_http import AsyncHttpError, Origin
+from codereview_agent.review.service.claude_client import ClaudeReviewClient, ClaudeReviewError
+from codereview_agent.review.service.connection_pool import AsyncConnectionPool, HttpConnectionPool
+
+
+REVIEW_JSON = {
+    "summary": "Remote review summary",
+    "suggestions": [],
+    "metrics": {"processingTimeMs": 7, "model": "claude-3-haiku-20240307"},
+}
+
+
+def _envelope(payload=None):
+    return {
+        "content": [{"type": "text", "text": json.dumps(payload or REVIEW_JSON)}],
+    }
+
+
+class FakeClaudeServer:
+    """Tiny asyncio HTTP server that replays canned Claude envelopes."""
+
+    def __init__(self, responses=None, *, delay: float = 0.0) -> None:
+        self.responses = list(responses or [])
+        self.delay = delay
+        self.requests = []
+        self.connections = 0
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def __aenter__(self) -> "FakeClaudeServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer) -> None:
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = (await reader.readline()).decode("latin-1").strip()
+                    if not line:
+                        break
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", "0")))
+                self.requests.append({"headers": headers, "body": json.loads(body or b"{}")})
+
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+
+                status, payload, extra_headers = self._next_response()
+                raw = json.dumps(payload).encode("utf-8")
+                head = [f"HTTP/1.1 {status} OK", f"Content-Length: {len(raw)}", "Content-Type: application/json"]
+                head.extend(f"{name}: {value}" for name, value in extra_headers.items())
+                keep_alive = headers.get("connection", "").lower() == "keep-alive"
+                head.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + raw)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _next_response(self):
+        if self.responses:
+            entry = self.responses.pop(0)
+        else:
+            entry = (200, _envelope())
+        status, payload = entry[0], entry[1]
+        extra_headers = entry[2] if len(entry) > 2 else {}
+        return status, payload, extra_headers
+
+
+def _client(url: str, **overrides) -> ClaudeReviewClient:
+    options = {
+        "api_key": "test-key",
+        "base_url": url,
+        "timeout": 5,
+        "max_attempts": 2,
+        "retry_delay_seconds": 0.01,
+    }
+    options.update(overrides)
+    return ClaudeReviewClient(**options)
+
+
+def test_acreate_review_parses_remote_envelope():
+    async def scenario():
+        async with FakeClaudeServer() as server:
+            client = _client(server.url)
+            request = ReviewRequest(code="const a = 1;", style="bug")
+            payload = await client.acreate_review(request, language="javascript", style="bug")
+            return server, payload
+
+    server, payload = asyncio.run(scenario())
+
+    assert payload["summary"] == "Remote review summary"
+    assert server.requests[0]["headers"]["x-api-key"] == "test-key"
+    assert server.requests[0]["body"]["model"] == "claude-3-haiku-20240307"
+
+
+def test_acreate_review_retries_then_raises_http_error():
+    async def scenario():
+        responses = [(500, {"error": "boom"}), (500, {"error": "boom"})]
+        async with FakeClaudeServer(responses) as server:
+            client = _client(server.url)
+            request = ReviewRequest(code="const a = 1;")
+            with pytest.raises(ClaudeReviewError) as exc_info:
+                await client.acreate_review(request, language="javascript", style="detail")
+            return server, exc_info.value
+
+    server, error = asyncio.run(scenario())
+
+    assert error.status_code == 500
+    assert len(server.requests) == 2
+
+
+def test_acreate_review_runs_concurrently():
+    async def scenario():
+        async with FakeClaudeServer(delay=0.2) as server:
+            client = _client(server.url)
+            request = ReviewRequest(code="const a = 1;")
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            await asyncio.gather(
+                *(client.acreate_review(request, language="javascript", style="detail") for _ in range(10))
+            )
+            return loop.time() - started
+
+    elapsed = asyncio.run(scenario())
+
+    assert elapsed < 1.0
+
+
+def test_async_pool_reuses_keep_alive_connections():
+    async def scenario():
+        async with FakeClaudeServer() as server:
+            client = _client(server.url)
+            request = ReviewRequest(code="const a = 1;")
+            for _ in range(3):
+                await client.acreate_review(request, language="javascript", style="detail")
+            await client.aclose()
+            return server, client.transport_stats()["async"]
+
+    server, stats = asyncio.run(scenario())
+
+    assert server.connections == 1
+    assert stats["connects"] == 1
+    assert stats["reuses"] == 2
+
+
+def test_sync_pool_reuses_keep_alive_connections():
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):  # noqa: N802 - http.server naming
+            self.rfile.read(int(self.headers["Content-Length"]))
+            raw = json.dumps(_envelope()).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(raw)))
+            self.end_headers()
+            self.wfile.write(raw)
+
+        def log_message(self, *args):  # pragma: no cover - silence test output
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = _client(f"http://127.0.0.1:{server.server_address[1]}")
+        request = ReviewRequest(code="const a = 1;")
+        for _ in range(3):
+            client.create_review(request, language="javascript", style="detail")
+        client.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    stats = client.transport_stats()["sync"]
+    assert stats["connects"] == 1
+    assert stats["reuses"] == 2
+
+
+class FlakyKeepAliveServer:
+    """Answers the first request on each socket, then misbehaves per ``mode``.
+
+    ``"drop"`` closes the socket right after the first answer; ``"truncate"``
+    starts answering the second request and cuts its body short; ``"reset"``
+    does the same but ends with a TCP reset instead of a clean close.
+    """
+
+    def __init__(self, mode: str) -> None:
+        self.mode = mode
+        self.requests = 0
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def __aenter__(self) -> "FlakyKeepAliveServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer) -> None:
+        served = 0
+        try:
+            while await reader.readline():
+                length = 0
+                while True:
+                    line = (await reader.readline()).decode("latin-1").strip()
+                    if not line:
+                        break
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                await reader.readexactly(length)
+                self.requests += 1
+                served += 1
+                if served == 2 and self.mode in ("truncate", "reset"):
+                    writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 50\r\n\r\npart")
+                    await writer.drain()
+                    if self.mode == "reset":
+                        await asyncio.sleep(0.1)
+                        sock = writer.get_extra_info("socket")
+                        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+                    break
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: keep-alive\r\n\r\nok")
+                await writer.drain()
+                if self.mode == "drop":
+                    break
+        finally:
+            writer.close()
+
+
+def _pool(url: str) -> AsyncConnectionPool:
+    return AsyncConnectionPool(Origin.from_url(url), timeout=5, max_size=4, idle_timeout=0, max_lifetime=0)
+
+
+def test_async_pool_replays_only_requests_that_got_no_response():
+    async def scenario(mode: str):
+        async with FlakyKeepAliveServer(mode) as server:
+            pool = _pool(server.url)
+            first = await pool.request("POST", "/", headers={}, body=b"{}")
+            await asyncio.sleep(0.05)
+            try:
+                second = await pool.request("POST", "/", headers={}, body=b"{}")
+            except AsyncHttpError as exc:
+                second = exc
+            await pool.close()
+            return server.requests, first, second
+
+    dropped = asyncio.run(scenario("drop"))
+    truncated = asyncio.run(scenario("truncate"))
+
+    # A dropped idle socket never saw the request, so it is retried on a fresh connection.
+    assert dropped[0] == 2 and dropped[2].body == b"ok"
+    # A response that started and broke off is not replayed.
+    assert truncated[0] == 2
+    assert isinstance(truncated[2], AsyncHttpError)
+
+
+def test_sync_pool_does_not_replay_a_request_whose_body_read_failed():
+    def calls(url: str):
+        pool = HttpConnectionPool(Origin.from_url(url), timeout=5, max_size=4, idle_timeout=0, max_lifetime=0)
+        first = pool.request("POST", "/", headers={}, body=b"{}")
+        try:
+            second = pool.request("POST", "/", headers={}, body=b"{}")
+        except OSError as exc:
+            second = exc
+        pool.close()
+        return first, second
+
+    async def scenario():
+        async with FlakyKeepAliveServer("reset") as server:
+            first, second = await asyncio.to_thread(calls, server.url)
+            return server.requests, first, second
+
+    requests, first, second = asyncio.run(scenario())
+
+    assert first.body == b"ok"
+    assert isinstance(second, ConnectionResetError)
+    assert requests == 2
+
+
+def test_async_pool_discards_connections_from_a_previous_loop():
+    async def first_loop(url: str) -> AsyncConnectionPool:
+        pool = _pool(url)
+        await pool.request("POST", "/", headers={}, body=b"{}")
+        return pool
+
+    async def scenario():
+        async with FakeClaudeServer([(200, {}, {})] * 2) as server:
+            loop = asyncio.get_running_loop()
+            pool = await loop.run_in_executor(None, asyncio.run, first_loop(server.url))
+            await pool.request("POST", "/", headers={}, body=b"{}")
+            await pool.close()
+            return pool.stats
+
+    stats = asyncio.run(scenario())
+
+    assert stats.connects == 2
+    assert stats.discarded == 1
+
+
+def test_pool_expires_idle_connections():
+    async def scenario():
+        async with FakeClaudeServer() as server:
+            client = _client(server.url, pool_idle_timeout_seconds=0.05)
+            request = ReviewRequest(code="const a = 1;")
+            await client.acreate_review(request, language="javascript", style="detail")
+            await asyncio.sleep(0.1)
+            await client.acreate_review(request, language="javascript", style="detail")
+            await client.aclose()
+            return client.transport_stats()["async"]
+
+    stats = asyncio.run(scenario())
+
+    assert stats["connects"] == 2
+    assert stats["idle_expired"] == 1
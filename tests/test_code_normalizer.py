@@ -0,0 +1,133 @@
+import asyncio
+
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service import NormalizationOptions, ReviewService
+from codereview_agent.review.service.code_normalizer import normalize_code
+from codereview_agent.review.service.review_cache import ReviewCache
+
+CODE = "const a = 1;\nconsole.log(a);\n"
+
+
+class LineClient:
+    """Flags every ``console.log`` line of the code it is given."""
+
+    model_name = "claude-3-haiku-20240307"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def _review(self, code: str) -> dict:
+        self.calls += 1
+        suggestions = [
+            {
+                "title": "console.log 제거",
+                "rationale": "디버그 출력",
+                "severity": "low",
+                "tags": [],
+                "range": {"startLine": number, "startCol": 1, "endLine": number, "endCol": 16},
+                "fix": {"type": "unified-diff", "diff": f"@@ -{number} +{number} @@\n-console.log(a);"},
+                "fixSnippet": "",
+                "confidence": 0.9,
+            }
+            for number, line in enumerate(code.splitlines(), start=1)
+            if line.startswith("console.log")
+        ]
+        return {"summary": f"review #{self.calls}", "suggestions": suggestions}
+
+    def create_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+        return self._review(request.code)
+
+    async def acreate_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+        await asyncio.sleep(0.01)
+        return self._review(request.code)
+
+
+def _service(client, **options) -> ReviewService:
+    return ReviewService(review_client=client, cache=ReviewCache(), normalization=NormalizationOptions(**options))
+
+
+def test_normalization_drops_cosmetic_differences_and_keeps_line_map():
+    normalized = normalize_code("a = 1;  \r\n\r\n\tb = 2;\r\n\n", "javascript")
+
+    assert normalized.text == "a = 1;\n\tb = 2;"
+    assert normalized.line_map == (1, 3)
+    assert normalized.canonical_line(3) == 2
+    assert normalized.canonical_line(2) is None
+    assert normalized.canonical_line(2, floor=True) == 1
+
+
+def test_comment_stripping_respects_strings_and_language():
+    js = normalize_code(
+        'const url = "http://x"; // trailing\n/* block\n still */ let b = `a // b`;\n',
+        "javascript",
+        strip_comments=True,
+    )
+    python = normalize_code('x = 1  # comment\n# only comment\n"# not a comment"\n', "python", strip_comments=True)
+    unknown = normalize_code("// kept\n", "cobol", strip_comments=True)
+
+    # Only comment-only lines go; a line with code keeps its comment.
+    assert js.text == 'const url = "http://x"; // trailing\n still */ let b = `a // b`;'
+    assert js.line_map == (1, 3)
+    assert python.text == 'x = 1  # comment\n"# not a comment"'
+    assert python.line_map == (1, 3)
+    assert unknown.text == "// kept"
+
+
+def test_near_duplicate_input_hits_cache_with_remapped_ranges():
+    client = LineClient()
+    service = _service(client, strip_comments=True)
+    first = service.generate_review(ReviewRequest(code=CODE, style="bug"))
+
+    variant = "// header comment\r\n\r\nconst a = 1;   \r\n\r\nconsole.log(a);\r\n"
+    second = service.generate_review(ReviewRequest(code=variant, style="bug"))
+
+    assert client.calls == 1
+    assert second.metrics.cached is True
+    assert second.original_code == variant
+    assert first.suggestions[0].range.start_line == 2
+    assert second.suggestions[0].range.start_line == 5
+    assert second.suggestions[0].fix.diff.startswith("@@ -5 +5 @@")
+
+
+def test_normalization_is_off_without_options():
+    client = LineClient()
+    service = ReviewService(review_client=client, cache=ReviewCache())
+
+    service.generate_review(ReviewRequest(code=CODE, style="bug"))
+    service.generate_review(ReviewRequest(code=CODE.replace("\n", "\r\n"), style="bug"))
+
+    assert client.calls == 2
+
+
+def test_concurrent_near_duplicates_share_one_call_in_their_own_coordinates():
+    client = LineClient()
+    service = _service(client)
+    shifted = "\n\n" + CODE
+
+    async def scenario():
+        return await asyncio.gather(
+            service.agenerate_review(ReviewRequest(code=CODE, style="bug")),
+            service.agenerate_review(ReviewRequest(code=shifted, style="bug")),
+        )
+
+    plain, moved = asyncio.run(scenario())
+
+    assert client.calls == 1
+    assert plain.suggestions[0].range.start_line == 2
+    assert moved.suggestions[0].range.start_line == 4
+    assert moved.original_code == shifted
+
+
+def test_inputs_differing_in_a_trailing_comment_do_not_share_fixes():
+    client = LineClient()
+    service = _service(client, strip_comments=True)
+
+    first = service.generate_review(ReviewRequest(code="console.log(a); // old\n", style="bug"))
+    second = service.generate_review(ReviewRequest(code="// note\nconsole.log(a); // new\n", style="bug"))
+    third = service.generate_review(ReviewRequest(code="\n// moved\nconsole.log(a); // new\n", style="bug"))
+
+    # The cached fix quotes the first input's line, so the second one is reviewed on its own.
+    assert client.calls == 2
+    assert first.metrics.cached is not True and second.metrics.cached is not True
+    assert third.metrics.cached is True
+    assert third.suggestions[0].range.start_line == 3
@@ -0,0 +1,97 @@
+import asyncio
+
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service import ReviewService
+from codereview_agent.review.service.claude_client import COMPACT_REVIEW_PROMPT_INSTRUCTIONS
+from codereview_agent.review.service.compact_schema import (
+    build_replacement_diff,
+    expand_compact_suggestion,
+)
+from tests.test_claude_client import FakeClaudeServer, _client
+
+CODE = "function compare(a, b) {\n  return a == b;\n}"
+
+
+class CompactClient:
+    model_name = "claude-3-haiku-20240307"
+    prompt_version = "v2"
+
+    def create_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+        return {
+            "summary": "compact",
+            "suggestions": [
+                {
+                    "title": "엄격한 비교",
+                    "rationale": "=== 사용",
+                    "severity": "major",
+                    "tags": ["bug"],
+                    "range": [2, 12, 2, 14],
+                    "replacement": "  return a === b;",
+                    "confidence": 0.9,
+                }
+            ],
+        }
+
+
+def test_expand_compact_suggestion_builds_ids_diff_and_status():
+    expanded = expand_compact_suggestion(
+        {"title": "t", "rationale": "r", "severity": "minor", "range": [2, 3, 2, 5], "replacement": "  return a === b;"},
+        CODE.split("\n"),
+    )
+
+    assert expanded["id"]
+    assert expanded["status"] == "pending"
+    assert expanded["range"] == {"startLine": 2, "startCol": 3, "endLine": 2, "endCol": 5}
+    assert expanded["fix"]["diff"].splitlines() == [
+        "--- original",
+        "+++ updated",
+        "@@ -2,1 +2,1 @@",
+        "-  return a == b;",
+        "+  return a === b;",
+    ]
+    assert expanded["fixSnippet"] == "return a === b;"
+
+
+def test_expand_compact_suggestion_clamps_range_and_rejects_garbage():
+    lines = CODE.split("\n")
+
+    clamped = expand_compact_suggestion({"range": [9, 1, 12, 1], "replacement": ""}, lines)
+    assert clamped["range"]["startLine"] == 3
+    assert clamped["fix"]["diff"].endswith("-}")
+
+    assert expand_compact_suggestion({"range": "2-3"}, lines) is None
+    assert build_replacement_diff(lines, 2, 2, "  return a == b;") == ""
+
+
+def test_service_expands_compact_payload_against_request_code():
+    service = ReviewService(review_client=CompactClient())
+
+    response = service.generate_review(ReviewRequest(code=CODE, style="bug"))
+
+    suggestion = response.suggestions[0]
+    assert suggestion.status == "pending"
+    assert suggestion.range.start_line == 2
+    assert "+  return a === b;" in suggestion.fix.diff
+    assert response.original_code == CODE
+
+
+def test_client_sends_compact_instructions_for_v2():
+    async def scenario():
+        async with FakeClaudeServer() as server:
+            client = _client(server.url, prompt_version="v2")
+            await client.acreate_review(ReviewRequest(code=CODE, style="bug"), language="javascript", style="bug")
+            return client, server
+
+    client, server = asyncio.run(scenario())
+
+    body = server.requests[0]["body"]
+    prompt = "".join(block["text"] for block in body["system"] + body["messages"][0]["content"])
+    assert client.prompt_version == "v2"
+    assert COMPACT_REVIEW_PROMPT_INSTRUCTIONS in prompt
+    assert "originalCode" not in prompt
+
+
+def test_unknown_prompt_version_falls_back_to_default():
+    client = _client("http://127.0.0.1:1", prompt_version="v9")
+
+    assert client.prompt_version == "v1"
@@ -0,0 +1,103 @@
+import asyncio
+
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service import ReviewService, context_selector
+from codereview_agent.review.service.context_selector import select_context, truncate_context
+from codereview_agent.review.service.review_cache import ReviewCache
+
+HEADER = "\n".join(f"// Copyright notice line {index}, all rights reserved." for index in range(1, 9))
+IMPORTS = "\n".join(f"import {{ helper{index} }} from './helper{index}';" for index in range(1, 7))
+FILLER = "\n".join(f"const value{index} = {index};" for index in range(1, 25))
+HANDLER = "function handle(user) {\n  console.log(user);\n  return user.id;\n}"
+CODE = "\n\n".join([HEADER, IMPORTS, FILLER, HANDLER])
+HIT_LINE = CODE.split("\n").index("  console.log(user);") + 1
+
+
+class ExcerptClient:
+    """Flags ``console.log`` lines of the exact code it receives and records it."""
+
+    model_name = "claude-3-haiku-20240307"
+
+    def __init__(self) -> None:
+        self.codes = []
+
+    def _review(self, code: str) -> dict:
+        self.codes.append(code)
+        suggestions = [
+            {
+                "title": "console.log 제거",
+                "rationale": "디버그 출력",
+                "severity": "low",
+                "tags": [],
+                "range": {"startLine": number, "startCol": 3, "endLine": number, "endCol": len(line) + 1},
+                "fix": {"type": "unified-diff", "diff": f"@@ -{number} +{number} @@\n-{line}"},
+                "fixSnippet": "",
+                "confidence": 0.9,
+            }
+            for number, line in enumerate(code.split("\n"), start=1)
+            if "console.log" in line or "omitted" in line
+        ]
+        return {"summary": "excerpt review", "suggestions": suggestions}
+
+    def create_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+        return self._review(code)
+
+    async def acreate_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+        return self._review(code)
+
+
+def test_selection_prefers_heuristic_hits_and_maps_lines_back():
+    selection = select_context(CODE, max_chars=300, hit_lines={HIT_LINE})
+    excerpt = selection.text.split("\n")
+
+    assert len(selection.text) <= 300
+    assert "  console.log(user);" in excerpt
+    assert "Copyright" not in selection.text
+    assert any("lines omitted" in line for line in excerpt)
+    for number, line in enumerate(excerpt, start=1):
+        original = selection.original_line(number)
+        if original is None:
+            assert "lines omitted" in line
+        else:
+            assert CODE.split("\n")[original - 1] == line
+
+
+def test_changed_lines_steer_selection_and_small_inputs_pass_through():
+    changed = CODE.split("\n").index("const value20 = 20;") + 1
+
+    selection = select_context(CODE, max_chars=400, changed_lines={changed})
+
+    assert "const value20 = 20;" in selection.text.split("\n")
+    assert select_context("a();", max_chars=200).complete
+    assert truncate_context(CODE, 200).text == CODE[:200]
+    assert truncate_context(CODE, 200).original_line(3) == 3
+
+
+def test_service_sends_ranked_excerpt_and_reports_original_lines():
+    client = ExcerptClient()
+    service = ReviewService(review_client=client, cache=ReviewCache())
+    request = ReviewRequest(code=CODE, language="javascript", style="bug")
+
+    sync = service.generate_review(request)
+    service.cache.clear()
+    async_ = asyncio.run(service.agenerate_review(request))
+
+    assert all(len(code) <= 500 for code in client.codes)
+    assert "console.log(user);" in client.codes[0]
+    for response in (sync, async_):
+        # The suggestion the client raised on the gap marker is dropped.
+        assert [suggestion.range.start_line for suggestion in response.suggestions] == [HIT_LINE]
+        assert response.suggestions[0].fix.diff.startswith(f"@@ -{HIT_LINE} +{HIT_LINE} @@")
+
+
+def test_large_inputs_are_sized_incrementally_and_rendered_once(monkeypatch):
+    code = "\n\n".join(f"function f{index}(x) {{\n  return x + {index};\n}}" for index in range(3000))
+    renders = []
+    render = context_selector._render
+    monkeypatch.setattr(context_selector, "_render", lambda *args: renders.append(args) or render(*args))
+
+    selection = select_context(code, max_chars=2000, hit_lines={4000})
+
+    assert len(renders) == 1
+    assert 1900 < len(selection.text) <= 2000
+    assert "  return x + 999;" in selection.text.split("\n")
@@ -0,0 +1,82 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from codereview_agent.app.main import codeReviewAgent
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service import ReviewService
+from codereview_agent.review.service.claude_client import ClaudeReviewError
+
+JS_CODE = "function compare(a, b) {\n  if (a == b) {\n    console.log('equal');\n  }\n}\n"
+
+
+class DelayedClient:
+    model_name = "claude-3-haiku-20240307"
+
+    def __init__(self, delay: float, *, fail: bool = False) -> None:
+        self.delay = delay
+        self.fail = fail
+
+    async def acreate_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ClaudeReviewError("네트워크 오류")
+        return {"summary": "remote", "suggestions": [], "metrics": {"model": self.model_name}}
+
+
+def test_deadline_miss_returns_degraded_heuristics_and_warms_cache():
+    service = ReviewService(review_client=DelayedClient(0.2))
+    request = ReviewRequest(code=JS_CODE, style="bug")
+
+    async def scenario():
+        degraded = await service.agenerate_review(request, deadline_ms=50)
+        await asyncio.sleep(0.3)
+        warmed = await service.agenerate_review(request, deadline_ms=50)
+        return degraded, warmed
+
+    degraded, warmed = asyncio.run(scenario())
+
+    assert degraded.metrics.degraded is True
+    assert degraded.metrics.model == "codex-heuristic-v1"
+    assert {suggestion.title for suggestion in degraded.suggestions} >= {"동등 연산자 강화", "디버그 로그 정리"}
+    assert warmed.summary == "remote"
+    assert warmed.metrics.cached is True
+
+
+def test_upstream_within_deadline_returns_remote_result():
+    service = ReviewService(review_client=DelayedClient(0.0))
+    request = ReviewRequest(code=JS_CODE, style="bug")
+
+    response = asyncio.run(service.agenerate_review(request, deadline_ms=1000))
+
+    assert response.summary == "remote"
+    assert response.metrics.degraded is False
+
+
+def test_api_deadline_header_turns_upstream_error_into_degraded_200(monkeypatch):
+    service = ReviewService(review_client=DelayedClient(0.0, fail=True))
+    monkeypatch.setattr("codereview_agent.review.api.review_router.review_service", service)
+
+    client = TestClient(codeReviewAgent)
+    response = client.post(
+        "/api/reviews",
+        json={"code": JS_CODE, "language": "javascript", "style": "bug"},
+        headers={"X-Review-Deadline-Ms": "500"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["data"]["metrics"]["degraded"] is True
+
+
+def test_api_rejects_invalid_deadline_header(monkeypatch):
+    service = ReviewService(review_client=DelayedClient(0.0))
+    monkeypatch.setattr("codereview_agent.review.api.review_router.review_service", service)
+
+    client = TestClient(codeReviewAgent)
+    response = client.post(
+        "/api/reviews",
+        json={"code": JS_CODE},
+        headers={"X-Review-Deadline-Ms": "soon"},
+    )
+
+    assert response.status_code == 400
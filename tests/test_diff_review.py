@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from codereview_agent.app.main import codeReviewAgent
+from codereview_agent.common import CustomInternalServerException
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service import ReviewService
+from codereview_agent.review.service.review_cache import ReviewCache
+from tests.test_deadline import DelayedClient
+
+BASE = "\n".join(f"const v{index} = {index};" for index in range(1, 41))
+BASE = BASE.replace("const v20 = 20;", "console.log(v20);")
+DIFF = "@@ -22,3 +22,3 @@\n const v22 = 22;\n-const v23 = 23;\n+console.log(v23);\n const v24 = 24;"
+
+
+class WindowClient:
+    """Flags ``console.log`` lines of the exact code it receives and records every call."""
+
+    model_name = "claude-3-haiku-20240307"
+
+    def __init__(self) -> None:
+        self.codes = []
+
+    def _review(self, code: str) -> dict:
+        self.codes.append(code)
+        suggestions = [
+            {
+                "title": "console.log 제거",
+                "rationale": "디버그 출력",
+                "severity": "low",
+                "tags": [],
+                "range": {"startLine": number, "startCol": 1, "endLine": number, "endCol": len(line) + 1},
+                "fix": {"type": "unified-diff", "diff": f"@@ -{number} +{number} @@\n-{line}"},
+                "fixSnippet": "",
+                "confidence": 0.9,
+            }
+            for number, line in enumerate(code.split("\n"), start=1)
+            if "console.log" in line
+        ]
+        return {"summary": "diff review", "suggestions": suggestions}
+
+    def create_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+        return self._review(code)
+
+    async def acreate_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+        return self._review(code)
+
+
+def test_request_builds_new_file_from_base_or_from_hunks_alone():
+    with_base = ReviewRequest(diff=DIFF, baseCode=BASE)
+    hunks_only = ReviewRequest(diff=DIFF)
+
+    assert with_base.code.split("\n")[22] == "console.log(v23);"
+    assert len(with_base.code.split("\n")) == 40
+    assert hunks_only.code.split("\n")[21:24] == ["const v22 = 22;", "console.log(v23);", "const v24 = 24;"]
+    assert hunks_only.code.split("\n")[:21] == [""] * 21
+
+    with pytest.raises(ValidationError):
+        ReviewRequest(diff=DIFF, baseCode="unrelated")
+    with pytest.raises(ValidationError):
+        ReviewRequest(language="python")
+    # A far-off hunk must not be padded out with millions of blank lines.
+    with pytest.raises(ValidationError, match="최대 줄 수"):
+        ReviewRequest(diff="@@ -0,0 +20000000,1 @@\n+x==y")
+
+
+def test_only_changed_lines_are_sent_and_reported_in_new_file_coordinates():
+    client = WindowClient()
+    service = ReviewService(review_client=client, cache=ReviewCache())
+    request = ReviewRequest(diff=DIFF, baseCode=BASE, language="javascript", style="bug")
+
+    response = asyncio.run(service.agenerate_review(request))
+
+    # Line 20 is only context, so its console.log is not reported.
+    assert client.codes == ["\n".join(BASE.split("\n")[19:26]).replace("const v23 = 23;", "console.log(v23);")]
+    assert [suggestion.range.start_line for suggestion in response.suggestions] == [23]
+    assert response.suggestions[0].fix.diff.startswith("@@ -23 +23 @@")
+
+
+def test_sync_path_and_pure_deletions():
+    client = WindowClient()
+    service = ReviewService(review_client=client, cache=ReviewCache())
+
+    reviewed = service.generate_review(ReviewRequest(diff=DIFF, style="bug"))
+    deleted = service.generate_review(
+        ReviewRequest(diff="@@ -2,2 +2,1 @@\n const v2 = 2;\n-const v3 = 3;", baseCode=BASE)
+    )
+
+    assert [suggestion.range.start_line for suggestion in reviewed.suggestions] == [23]
+    assert len(client.codes) == 1
+    assert deleted.suggestions == []
+
+
+def test_api_accepts_diff_requests(monkeypatch):
+    service = ReviewService(review_client=WindowClient(), cache=ReviewCache())
+    monkeypatch.setattr("codereview_agent.review.api.review_router.review_service", service)
+    client = TestClient(codeReviewAgent)
+
+    ok = client.post("/api/reviews", json={"diff": DIFF, "baseCode": BASE, "style": "bug"})
+    bad = client.post("/api/reviews", json={"diff": "no hunks here", "style": "bug"})
+
+    assert ok.status_code == 200
+    assert ok.json()["data"]["suggestions"][0]["range"]["startLine"] == 23
+    assert bad.status_code in (400, 422)
+
+
+def test_heuristic_fallbacks_keep_only_changed_lines():
+    request = ReviewRequest(diff=DIFF, baseCode=BASE, language="javascript", style="bug")
+
+    slow = ReviewService(review_client=DelayedClient(0.5), cache=ReviewCache())
+    degraded = asyncio.run(slow.agenerate_review(request, deadline_ms=20))
+    failing = ReviewService(review_client=DelayedClient(0, fail=True), cache=ReviewCache())
+    with pytest.raises(CustomInternalServerException):
+        asyncio.run(failing.agenerate_review(request))
+
+    # The console.log on context line 20 is left out of both fallbacks.
+    assert degraded.metrics.degraded is True
+    assert [suggestion.range.start_line for suggestion in degraded.suggestions] == [23]
+    assert [suggestion.range.start_line for suggestion in failing._fallback_suggestions(request, "bug")] == [23]
@@ -0,0 +1,78 @@
+from typing import Optional
+
+import pytest
+
+from codereview_agent.review.models import Suggestion
+from codereview_agent.review.service.heuristic_rules import (
+    HeuristicRule,
+    LineMatch,
+    RuleRegistry,
+    build_default_registry,
+)
+
+JS_CODE = (
+    "function compare(a, b) {\n"
+    "  if (a == b) {\n"
+    "    console.log('equal');\n"
+    "  }\n"
+    "  return a === b; // TODO\n"
+    "}\n"
+)
+
+
+def test_default_rules_are_selected_per_style():
+    registry = build_default_registry()
+
+    bug_titles = [suggestion.title for suggestion in registry.scan(JS_CODE, "bug")]
+    detail_titles = [suggestion.title for suggestion in registry.scan(JS_CODE, "detail")]
+
+    assert bug_titles == ["동등 연산자 강화", "디버그 로그 정리"]
+    assert detail_titles == ["동등 연산자 강화", "디버그 로그 정리", "TODO 세부 설명 추가"]
+
+
+def test_scanner_reports_original_line_numbers_and_columns():
+    registry = build_default_registry()
+
+    equality, console = registry.scan(JS_CODE, "bug")
+
+    assert (equality.range.start_line, equality.range.start_col) == (2, 9)
+    assert (console.range.start_line, console.range.start_col) == (3, 5)
+
+
+def test_overlapping_tokens_still_trigger_shorter_rules():
+    registry = build_default_registry()
+
+    assert registry.scan("x === y\n", "bug") == []
+    assert [s.range.start_line for s in registry.scan("ok\nx == y\n", "bug")] == [2]
+
+
+def test_test_scaffold_rule_is_case_insensitive_and_document_scoped():
+    registry = build_default_registry()
+
+    assert registry.scan("Describe('x', () => {})\n", "test") == []
+    scaffold = registry.scan("const a = 1;\nconst b = 2;", "test")
+    assert len(scaffold) == 1
+    assert scaffold[0].range.start_line == 2
+
+
+def test_registry_accepts_custom_rules_and_rejects_duplicates():
+    class DebuggerRule(HeuristicRule):
+        key = "debugger"
+        styles = frozenset({"bug"})
+        tokens = ("debugger",)
+
+        def __init__(self) -> None:
+            self.lines = []
+
+        def match_line(self, match: LineMatch) -> Optional[Suggestion]:
+            self.lines.append(match.line_no)
+            return None
+
+    rule = DebuggerRule()
+    registry = RuleRegistry([rule])
+    registry.scan("a\ndebugger; debugger;\nb\ndebugger", "bug")
+    registry.scan("debugger", "detail")
+
+    assert rule.lines == [2, 4]
+    with pytest.raises(ValueError):
+        registry.register(DebuggerRule())
@@ -0,0 +1,138 @@
+import json
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from codereview_agent.common import CustomInternalServerException
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service import ReviewBatchEntry, ReviewService
+from codereview_agent.review.service.claude_client import ClaudeReviewError
+from tests.test_claude_client import _client, _envelope
+
+
+class FakeBatchApi:
+    """In-memory Message Batches API: batches end after ``polls_until_done`` GETs."""
+
+    def __init__(self, *, polls_until_done: int = 2, fail_ids=()) -> None:
+        self.polls_until_done = polls_until_done
+        self.fail_ids = set(fail_ids)
+        self.submissions = []
+        self.polls = 0
+
+    def handle(self, method, path, body):
+        if method == "POST" and path == "/v1/messages/batches":
+            self.submissions.append(body["requests"])
+            return 200, {"id": "msgbatch_1", "processing_status": "in_progress"}
+        if method == "GET" and path == "/v1/messages/batches/msgbatch_1":
+            self.polls += 1
+            if self.polls < self.polls_until_done:
+                return 200, {"id": "msgbatch_1", "processing_status": "in_progress"}
+            return 200, {
+                "id": "msgbatch_1",
+                "processing_status": "ended",
+                "results_url": "/v1/messages/batches/msgbatch_1/results",
+            }
+        if method == "GET" and path == "/v1/messages/batches/msgbatch_1/results":
+            lines = [json.dumps(self._result(request)) for request in self.submissions[-1]]
+            return 200, "\n".join(lines)
+        return 404, {"error": {"type": "not_found_error"}}
+
+    def _result(self, request):
+        custom_id = request["custom_id"]
+        if custom_id in self.fail_ids:
+            return {"custom_id": custom_id, "result": {"type": "errored", "error": {"type": "invalid_request"}}}
+        prompt = request["params"]["messages"][0]["content"][0]["text"]
+        payload = {"summary": f"batch {custom_id} {len(prompt)}", "suggestions": []}
+        message = {**_envelope(payload), "usage": {"input_tokens": 10, "output_tokens": 5}}
+        return {"custom_id": custom_id, "result": {"type": "succeeded", "message": message}}
+
+
+@contextmanager
+def serve(api: FakeBatchApi):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):  # noqa: N802 - http.server naming
+            self._reply("POST")
+
+        def do_GET(self):  # noqa: N802 - http.server naming
+            self._reply("GET")
+
+        def _reply(self, method):
+            length = int(self.headers.get("Content-Length") or 0)
+            raw_body = self.rfile.read(length) if length else b""
+            status, payload = api.handle(method, self.path, json.loads(raw_body) if raw_body else None)
+            raw = (payload if isinstance(payload, str) else json.dumps(payload)).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(raw)))
+            self.end_headers()
+            self.wfile.write(raw)
+
+        def log_message(self, *args):  # pragma: no cover - silence test output
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_client_runs_batch_and_maps_results_per_custom_id():
+    api = FakeBatchApi(fail_ids={"b"})
+    with serve(api) as url:
+        client = _client(url)
+        request = ReviewRequest(code="const a = 1;", style="bug")
+        results = client.run_review_batch(
+            [
+                ReviewBatchEntry(custom_id="a", request=request, language="javascript", style="bug"),
+                ReviewBatchEntry(custom_id="b", request=request, language="javascript", style="bug"),
+            ],
+            poll_interval=0.01,
+        )
+        client.close()
+
+    assert api.polls == 2
+    assert results["a"]["summary"].startswith("batch a")
+    assert results["a"]["usage"] == {"input_tokens": 10, "output_tokens": 5}
+    assert isinstance(results["b"], ClaudeReviewError)
+    assert api.submissions[0][0]["params"]["model"] == "claude-3-haiku-20240307"
+
+
+def test_batch_times_out_when_never_ended():
+    api = FakeBatchApi(polls_until_done=10_000)
+    with serve(api) as url:
+        client = _client(url)
+        entry = ReviewBatchEntry(custom_id="a", request=ReviewRequest(code="x"), language="text", style="bug")
+        try:
+            client.run_review_batch([entry], poll_interval=0.01, timeout=0.05)
+        except ClaudeReviewError as exc:
+            assert "제한 시간" in exc.message
+        else:  # pragma: no cover - defensive
+            raise AssertionError("expected a timeout")
+        finally:
+            client.close()
+
+
+def test_service_batch_dedupes_caches_and_reports_failures():
+    api = FakeBatchApi(fail_ids={"review-1-0"})
+    with serve(api) as url:
+        service = ReviewService(review_client=_client(url))
+        items = [
+            ("one", ReviewRequest(code="const a = 1;", style="bug")),
+            ("dup", ReviewRequest(code="const a = 1;", style="bug")),
+            ("bad", ReviewRequest(code="const b = 2;", style="bug")),
+        ]
+        results = service.generate_reviews_in_batch(items, poll_interval=0.01)
+        cached = service.generate_reviews_in_batch(items[:1], poll_interval=0.01)
+
+    assert len(api.submissions) == 1
+    assert [request["custom_id"] for request in api.submissions[0]] == ["review-0-0", "review-1-0"]
+    assert results["one"].summary == results["dup"].summary
+    assert results["one"].session_id != results["dup"].session_id
+    assert results["one"].metrics.input_tokens == 10
+    assert isinstance(results["bad"], CustomInternalServerException)
+    assert cached["one"].metrics.cached is True
@@ -0,0 +1,122 @@
+import asyncio
+
+from codereview_agent.common import CustomInternalServerException
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service import MicroBatchOptions, ReviewBatchEntry, ReviewService
+from codereview_agent.review.service.claude_client import MULTI_ITEM_INSTRUCTIONS, ClaudeReviewError
+from codereview_agent.review.service.micro_batcher import MicroBatcher
+from tests.test_claude_client import FakeClaudeServer, _client, _envelope
+
+
+class ManyClient:
+    model_name = "claude-3-haiku-20240307"
+
+    def __init__(self, *, drop=()) -> None:
+        self.drop = set(drop)
+        self.calls = []
+        self.single_calls = 0
+
+    async def acreate_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+        self.single_calls += 1
+        return {"summary": f"single {code}", "suggestions": []}
+
+    async def acreate_review_many(self, entries):
+        self.calls.append([entry.code for entry in entries])
+        return [
+            ClaudeReviewError("missing")
+            if entry.code in self.drop
+            else {"summary": f"many {entry.code}", "suggestions": []}
+            for entry in entries
+        ]
+
+
+def test_batcher_flushes_on_size_and_window_and_isolates_errors():
+    batches = []
+
+    async def runner(items):
+        batches.append(list(items))
+        return [ValueError(item) if item == "bad" else item.upper() for item in items]
+
+    batcher = MicroBatcher(runner, MicroBatchOptions(window_ms=10, max_batch_size=3))
+
+    async def scenario():
+        return await asyncio.gather(
+            *(batcher.submit(item) for item in ["a", "bad", "c", "d"]),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(scenario())
+
+    assert batches == [["a", "bad", "c"], ["d"]]
+    assert results[0] == "A" and results[2] == "C" and results[3] == "D"
+    assert isinstance(results[1], ValueError)
+    stats = batcher.stats()
+    assert stats["sizeFlushes"] == 1 and stats["windowFlushes"] == 1
+    assert stats["fillHistogram"] == {"1": 1, "3": 1}
+
+
+def test_service_packs_small_requests_into_one_call():
+    client = ManyClient(drop={"const b = 2;"})
+    service = ReviewService(
+        review_client=client,
+        cache=None,
+        micro_batching=MicroBatchOptions(window_ms=20, max_batch_size=8),
+    )
+    codes = ["const a = 1;", "const b = 2;", "const c = 3;"]
+
+    async def scenario():
+        return await asyncio.gather(
+            *(service.agenerate_review(ReviewRequest(code=code, style="bug")) for code in codes),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(scenario())
+
+    assert client.calls == [codes]
+    assert results[0].summary == "many const a = 1;"
+    assert results[2].summary == "many const c = 3;"
+    # The dropped item fails on its own instead of failing its neighbours.
+    assert isinstance(results[1], CustomInternalServerException)
+    assert service.stats()["microBatch"]["items"] == 3
+
+
+def test_single_item_batch_uses_regular_call():
+    client = ManyClient()
+    service = ReviewService(review_client=client, micro_batching=MicroBatchOptions(window_ms=1))
+
+    response = asyncio.run(service.agenerate_review(ReviewRequest(code="const a = 1;", style="bug")))
+
+    assert client.calls == []
+    assert client.single_calls == 1
+    assert response.summary == "single const a = 1;"
+
+
+def test_client_splits_multi_item_answer_by_id():
+    answer = {
+        "reviews": [
+            {"id": "item-1", "summary": "second", "suggestions": []},
+            {"id": "item-0", "summary": "first", "suggestions": []},
+        ]
+    }
+
+    async def scenario():
+        async with FakeClaudeServer([(200, _envelope(answer))]) as server:
+            client = _client(server.url)
+            request = ReviewRequest(code="x", style="bug")
+            entries = [
+                ReviewBatchEntry(custom_id=f"item-{index}", request=request, language="javascript", style="bug", code=code)
+                for index, code in enumerate(["a = 1", "b = 2", "c = 3"])
+            ]
+            results = await client.acreate_review_many(entries)
+            await client.aclose()
+            return server, results
+
+    server, results = asyncio.run(scenario())
+
+    body = server.requests[0]["body"]
+    assert len(server.requests) == 1
+    assert MULTI_ITEM_INSTRUCTIONS in "".join(block["text"] for block in body["system"])
+    assert '<item id="item-2" language="javascript" style="bug">\nc = 3\n</item>' in body["messages"][0]["content"][0]["text"]
+    assert results[0]["summary"] == "first"
+    assert results[1]["summary"] == "second"
+    assert isinstance(results[2], ClaudeReviewError)
@@ -0,0 +1,172 @@
+import asyncio
+import threading
+
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service import ReviewService
+from codereview_agent.review.service.persistent_cache import PersistentReviewCache, TieredReviewCache
+from codereview_agent.review.service.review_cache import ReviewCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingClient:
+    model_name = "claude-3-haiku-20240307"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def acreate_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+        self.calls += 1
+        return {"summary": f"review #{self.calls}", "suggestions": []}
+
+    def create_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+        self.calls += 1
+        return {"summary": f"review #{self.calls}", "suggestions": []}
+
+
+def _response(summary: str = "cached summary"):
+    service = ReviewService(review_client=CountingClient(), cache=ReviewCache())
+    response = service.generate_review(ReviewRequest(code="const a = 1;", style="bug"))
+    return response.model_copy(update={"summary": summary})
+
+
+def test_entries_survive_reopen_and_are_shared_between_connections(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    writer = PersistentReviewCache(path, compress_min_bytes=0)
+    reader = PersistentReviewCache(path)
+
+    writer.put("k", _response())
+
+    assert reader.get("k").summary == "cached summary"
+    writer.close()
+    reader.close()
+
+    reopened = PersistentReviewCache(path)
+    assert reopened.get("k").summary == "cached summary"
+    assert reopened.stats()["entries"] == 1
+    reopened.close()
+
+
+def test_evicts_least_recently_read_entries_over_size_limit(tmp_path):
+    clock = FakeClock()
+    response = _response("x" * 400)
+    size = len(response.model_dump_json(by_alias=True))
+    cache = PersistentReviewCache(
+        str(tmp_path / "cache.sqlite3"), max_bytes=size * 2, compress=False, clock=clock
+    )
+
+    cache.put("old", response)
+    clock.now += 1
+    cache.put("newer", response)
+    clock.now += 1
+    cache.get("old")
+    clock.now += 1
+    cache.put("newest", response)
+
+    assert cache.get("newer") is None
+    assert cache.get("old") is not None
+    assert cache.get("newest") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_compression_shrinks_stored_blobs(tmp_path):
+    plain = PersistentReviewCache(str(tmp_path / "plain.sqlite3"), compress=False)
+    packed = PersistentReviewCache(str(tmp_path / "packed.sqlite3"), compress_min_bytes=0)
+    response = _response("repeated " * 200)
+
+    plain.put("k", response)
+    packed.put("k", response)
+
+    assert packed.stats()["bytes"] < plain.stats()["bytes"] / 4
+    assert packed.get("k").summary == response.summary
+
+
+def test_stale_entries_are_served_then_revalidated(tmp_path):
+    clock = FakeClock()
+    persistent = PersistentReviewCache(
+        str(tmp_path / "cache.sqlite3"), ttl_seconds=60, stale_seconds=600, clock=clock
+    )
+    client = CountingClient()
+    service = ReviewService(review_client=client, cache=TieredReviewCache(None, persistent))
+    request = ReviewRequest(code="const a = 1;", style="bug")
+
+    async def scenario():
+        first = await service.agenerate_review(request)
+        clock.now += 120
+        stale = await service.agenerate_review(request)
+        await asyncio.sleep(0.05)
+        fresh = await service.agenerate_review(request)
+        return first, stale, fresh
+
+    first, stale, fresh = asyncio.run(scenario())
+
+    assert first.summary == "review #1"
+    assert stale.summary == "review #1"
+    assert stale.metrics.stale is True
+    assert fresh.summary == "review #2"
+    assert fresh.metrics.cached is True and fresh.metrics.stale is False
+    assert client.calls == 2
+    assert persistent.stats()["stale_hits"] == 1
+
+
+def test_sync_path_treats_stale_entries_as_misses(tmp_path):
+    clock = FakeClock()
+    persistent = PersistentReviewCache(
+        str(tmp_path / "cache.sqlite3"), ttl_seconds=60, stale_seconds=600, clock=clock
+    )
+    client = CountingClient()
+    service = ReviewService(review_client=client, cache=TieredReviewCache(None, persistent))
+    request = ReviewRequest(code="const a = 1;", style="bug")
+
+    service.generate_review(request)
+    assert service.generate_review(request).metrics.cached is True
+    clock.now += 120
+
+    assert service.generate_review(request).summary == "review #2"
+    assert client.calls == 2
+
+
+def test_stored_byte_total_follows_overwrites_deletes_and_other_connections(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    first = PersistentReviewCache(path, compress=False)
+    second = PersistentReviewCache(path, compress=False)
+    short, long = _response("a"), _response("b" * 300)
+
+    first.put("k", long)
+    first.put("k", short)
+    second.put("other", long)
+    first._delete("other")
+
+    (actual,) = first._conn.execute("SELECT SUM(size) FROM review_cache").fetchone()
+    assert first.stats()["bytes"] == second.stats()["bytes"] == actual == len(short.model_dump_json(by_alias=True))
+    first.close()
+    second.close()
+
+
+def test_async_path_keeps_sqlite_off_the_event_loop_thread(tmp_path):
+    persistent = PersistentReviewCache(str(tmp_path / "cache.sqlite3"))
+    threads = []
+    for name in ("lookup", "put"):
+        original = getattr(persistent, name)
+
+        def record(*args, _original=original):
+            threads.append(threading.get_ident())
+            return _original(*args)
+
+        setattr(persistent, name, record)
+    service = ReviewService(review_client=CountingClient(), cache=TieredReviewCache(None, persistent))
+
+    async def scenario():
+        await service.agenerate_review(ReviewRequest(code="const a = 1;", style="bug"))
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(scenario())
+
+    assert len(threads) == 2
+    assert loop_thread not in threads
@@ -0,0 +1,60 @@
+import asyncio
+
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service.prompt_builder import PromptBuilder, estimate_tokens
+from tests.test_claude_client import FakeClaudeServer, _client
+
+CODE = "\n".join(f"const value{index} = compute({index});" for index in range(200))
+
+
+def _builder(**overrides):
+    options = {
+        "system_prompt": "system",
+        "instructions": "Return JSON.",
+        "max_output_tokens": 2048,
+    }
+    options.update(overrides)
+    return PromptBuilder(**options)
+
+
+def test_estimate_tokens_counts_words_and_symbols():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("a == b;") == 5
+    assert estimate_tokens("리뷰") == 2
+    assert estimate_tokens(CODE) > len(CODE) // 6
+
+
+def test_build_without_budget_keeps_code_and_max_tokens():
+    prompt = _builder().build(language="javascript", style="bug", code=CODE)
+
+    assert prompt.body.count(CODE) == 1
+    assert prompt.truncated_lines == 0
+    assert prompt.max_tokens == 2048
+    assert prompt.system_blocks()[1] == {"type": "text", "text": "Return JSON."}
+
+
+def test_build_trims_code_and_max_tokens_to_budget():
+    builder = _builder(token_budget=1500, min_output_tokens=300)
+
+    prompt = builder.build(language="javascript", style="bug", code=CODE)
+
+    assert 0 < prompt.truncated_lines < 200
+    assert "code truncated after line" in prompt.body
+    assert prompt.input_tokens <= 1500 - 300
+    assert prompt.max_tokens == 1500 - prompt.input_tokens
+
+
+def test_client_payload_includes_code_once():
+    async def scenario():
+        async with FakeClaudeServer() as server:
+            client = _client(server.url, token_budget=0)
+            request = ReviewRequest(code="let marker = 42;", style="bug")
+            await client.acreate_review(request, language="javascript", style="bug")
+            return server
+
+    server = asyncio.run(scenario())
+
+    body = server.requests[0]["body"]
+    prompt = "".join(block["text"] for block in body["messages"][0]["content"])
+    assert prompt.count("let marker = 42;") == 1
+    assert "Style: bug" in prompt
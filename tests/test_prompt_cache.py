@@ -0,0 +1,80 @@
+import asyncio
+import logging
+
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service import ReviewService
+from tests.test_claude_client import REVIEW_JSON, FakeClaudeServer, _client, _envelope
+
+USAGE = {
+    "input_tokens": 120,
+    "output_tokens": 80,
+    "cache_read_input_tokens": 900,
+    "cache_creation_input_tokens": 0,
+}
+
+
+def test_static_prefix_is_marked_cacheable_and_usage_reaches_metrics(monkeypatch):
+    monkeypatch.setattr("codereview_agent.review.service.claude_client.min_cacheable_tokens", lambda model: 0)
+
+    async def scenario():
+        async with FakeClaudeServer([(200, {**_envelope(REVIEW_JSON), "usage": USAGE})]) as server:
+            client = _client(server.url)
+            service = ReviewService(review_client=client)
+            response = await service.agenerate_review(ReviewRequest(code="const a = 1;", style="bug"))
+            return server, response
+
+    server, response = asyncio.run(scenario())
+
+    system = server.requests[0]["body"]["system"]
+    assert system[-1]["cache_control"] == {"type": "ephemeral"}
+    assert "const a = 1;" not in "".join(block["text"] for block in system)
+    assert response.metrics.cache_read_input_tokens == 900
+    assert response.metrics.cache_creation_input_tokens == 0
+    assert response.metrics.input_tokens == 120
+    dumped = response.metrics.model_dump(by_alias=True)
+    assert dumped["cacheReadInputTokens"] == 900
+
+
+def test_prompt_cache_can_be_disabled():
+    async def scenario():
+        async with FakeClaudeServer() as server:
+            client = _client(server.url, prompt_cache_enabled=False)
+            await client.acreate_review(ReviewRequest(code="x", style="bug"), language="text", style="bug")
+            return server
+
+    server = asyncio.run(scenario())
+
+    assert all("cache_control" not in block for block in server.requests[0]["body"]["system"])
+
+
+def test_prefix_below_the_model_minimum_is_sent_without_marker(monkeypatch, caplog):
+    monkeypatch.setattr("codereview_agent.review.service.claude_client._UNCACHEABLE_PREFIXES_LOGGED", set())
+
+    async def scenario():
+        async with FakeClaudeServer() as server:
+            for _ in range(2):
+                client = _client(server.url, model="claude-3-haiku-20240307")
+                await client.acreate_review(ReviewRequest(code="x", style="bug"), language="text", style="bug")
+            return server
+
+    with caplog.at_level(logging.INFO, logger="codereview_agent.review.service.claude_client"):
+        server = asyncio.run(scenario())
+
+    for request in server.requests:
+        assert all("cache_control" not in block for block in request["body"]["system"])
+    skipped = [record for record in caplog.records if "cache_control을 생략" in record.getMessage()]
+    # One notice per prompt builder (single and multi-item), not one per client.
+    assert len(skipped) == 2
+    assert "2048" in skipped[0].getMessage()
+
+
+def test_missing_usage_leaves_token_metrics_empty():
+    async def scenario():
+        async with FakeClaudeServer() as server:
+            service = ReviewService(review_client=_client(server.url))
+            return await service.agenerate_review(ReviewRequest(code="const b = 2;", style="bug"))
+
+    response = asyncio.run(scenario())
+
+    assert response.metrics.cache_read_input_tokens is None
+    assert response.metrics.output_tokens is None
@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service import ClaudeOverloadedError, ClaudeReviewError
+from codereview_agent.review.service.rate_limiter import (
+    RateLimiter,
+    RateLimitExceededError,
+    RateLimitOptions,
+)
+from tests.test_claude_client import REVIEW_JSON, FakeClaudeServer, _client, _envelope
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_requests_are_paced_in_reservation_order():
+    clock = FakeClock()
+    limiter = RateLimiter(RateLimitOptions(requests_per_minute=60), clock=clock)
+
+    for _ in range(60):
+        assert limiter.reserve(0) == 0.0
+
+    assert limiter.reserve(0) == pytest.approx(1.0)
+    assert limiter.reserve(0) == pytest.approx(2.0)
+    clock.now = 2.0
+    assert limiter.reserve(0) == pytest.approx(1.0)
+    assert limiter.snapshot()["paced"] == 3
+
+
+def test_token_reservation_is_settled_with_real_usage():
+    clock = FakeClock()
+    limiter = RateLimiter(RateLimitOptions(tokens_per_minute=1000), clock=clock)
+
+    limiter.reserve(900)
+    limiter.settle(900, 100)
+
+    assert limiter.reserve(800) == 0.0
+    assert limiter.snapshot()["tokensAvailable"] == pytest.approx(100)
+
+
+def test_wait_beyond_limit_is_shed_without_consuming_capacity():
+    clock = FakeClock()
+    limiter = RateLimiter(RateLimitOptions(requests_per_minute=1, max_wait_seconds=5), clock=clock)
+    limiter.reserve(0)
+
+    with pytest.raises(RateLimitExceededError):
+        limiter.reserve(0)
+
+    clock.now = 60.0
+    assert limiter.reserve(0) == 0.0
+    assert limiter.snapshot()["shed"] == 1
+
+
+def test_headers_set_limits_and_lower_remaining_capacity():
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+    assert limiter.reserve(10_000) == 0.0
+
+    limiter.update_from_headers(
+        {
+            "anthropic-ratelimit-requests-limit": "50",
+            "anthropic-ratelimit-requests-remaining": "0",
+            "anthropic-ratelimit-tokens-limit": "40000",
+            "anthropic-ratelimit-tokens-remaining": "39000",
+        }
+    )
+
+    snapshot = limiter.snapshot()
+    assert snapshot["requestsPerMinute"] == 50
+    assert snapshot["tokensPerMinute"] == 40000
+    assert snapshot["tokensAvailable"] == pytest.approx(39000)
+    assert limiter.reserve(100) == pytest.approx(60 / 50)
+
+
+def test_client_learns_limits_from_response_headers():
+    limiter = RateLimiter(RateLimitOptions(max_wait_seconds=0.15))
+    headers = {
+        "anthropic-ratelimit-requests-limit": "600",
+        "anthropic-ratelimit-requests-remaining": "0",
+    }
+    responses = [(200, {**_envelope(REVIEW_JSON), "usage": {"input_tokens": 5, "output_tokens": 5}}, headers)]
+
+    async def scenario():
+        async with FakeClaudeServer(responses) as server:
+            client = _client(server.url, rate_limiter=limiter)
+            request = ReviewRequest(code="const a = 1;", style="bug")
+            await client.acreate_review(request, language="javascript", style="bug")
+            # Limit learned: 600 RPM with nothing left, so the next call waits 0.1s
+            # and the one queued behind it would need 0.2s, beyond max_wait_seconds.
+            outcomes = await asyncio.gather(
+                client.acreate_review(request, language="javascript", style="bug"),
+                client.acreate_review(request, language="javascript", style="bug"),
+                return_exceptions=True,
+            )
+            await client.aclose()
+            return server, client, outcomes
+
+    server, client, outcomes = asyncio.run(scenario())
+
+    assert isinstance(outcomes[0], dict)
+    assert isinstance(outcomes[1], ClaudeOverloadedError)
+    assert len(server.requests) == 2
+    stats = client.stats()["apiKeys"]["keys"][0]["rateLimit"]
+    assert stats["requestsPerMinute"] == 600
+    assert stats["paced"] == 1
+    assert stats["shed"] == 1
+
+
+def test_failed_calls_release_their_output_reservation():
+    clock = FakeClock()
+    limiter = RateLimiter(RateLimitOptions(tokens_per_minute=100000), clock=clock)
+    responses = [(529, {"error": {"type": "overloaded_error"}}, {})] * 2
+
+    async def scenario():
+        async with FakeClaudeServer(responses) as server:
+            client = _client(server.url, rate_limiter=limiter)
+            request = ReviewRequest(code="const a = 1;", style="bug")
+            with pytest.raises(ClaudeReviewError):
+                await client.acreate_review(request, language="javascript", style="bug")
+            await client.aclose()
+            return server
+
+    server = asyncio.run(scenario())
+
+    # Both attempts reached the API and keep only their input estimate, not max_tokens.
+    assert len(server.requests) == 2
+    spent = 100000 - limiter.snapshot()["tokensAvailable"]
+    assert 0 < spent < server.requests[0]["body"]["max_tokens"]
+
+
+def test_unanswered_calls_are_refunded_in_full():
+    clock = FakeClock()
+    limiter = RateLimiter(RateLimitOptions(tokens_per_minute=100000), clock=clock)
+
+    async def closed_url() -> str:
+        async with FakeClaudeServer() as server:
+            return server.url
+
+    client = _client(asyncio.run(closed_url()), rate_limiter=limiter)
+    request = ReviewRequest(code="const a = 1;", style="bug")
+    with pytest.raises(ClaudeReviewError):
+        client.create_review(request, language="javascript", style="bug")
+    client.close()
+
+    assert limiter.snapshot()["tokensAvailable"] == pytest.approx(100000)
@@ -0,0 +1,90 @@
+import asyncio
+import random
+from email.utils import formatdate
+
+import pytest
+
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service.claude_client import ClaudeReviewError
+from codereview_agent.review.service.retry_policy import RetryPolicy, parse_retry_after
+from tests.test_claude_client import FakeClaudeServer, _client
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("garbage") is None
+    assert parse_retry_after(formatdate(1_000_010, usegmt=True), now=1_000_000) == pytest.approx(10.0)
+
+
+def test_policy_classifies_errors():
+    policy = RetryPolicy()
+
+    assert policy.is_retryable(ClaudeReviewError("overloaded", status_code=529))
+    assert policy.is_retryable(ClaudeReviewError("network"))
+    assert not policy.is_retryable(ClaudeReviewError("bad request", status_code=400))
+    assert not policy.is_retryable(ClaudeReviewError("no key", retryable=False))
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, rng=random.Random(7))
+    delays = []
+    previous = 1.0
+    for _ in range(20):
+        delay = policy.backoff(previous)
+        assert 1.0 <= delay <= 5.0
+        assert delay <= max(1.0, previous * 3)
+        delays.append(delay)
+        previous = delay
+    assert len(set(delays)) > 1
+
+
+def test_schedule_honors_retry_after_and_budget():
+    clock = FakeClock()
+    policy = RetryPolicy(max_attempts=5, base_delay=0.1, max_delay=1.0, budget_seconds=10)
+    schedule = policy.start(clock=clock)
+
+    delay = schedule.next_delay(ClaudeReviewError("rate limited", status_code=429, retry_after=4))
+    assert delay == 4
+
+    clock.now = 8
+    assert schedule.next_delay(ClaudeReviewError("rate limited", status_code=429, retry_after=4)) is None
+
+
+def test_client_does_not_retry_client_errors():
+    async def scenario():
+        async with FakeClaudeServer([(400, {"error": "invalid"})]) as server:
+            client = _client(server.url, max_attempts=3)
+            with pytest.raises(ClaudeReviewError) as exc_info:
+                await client.acreate_review(ReviewRequest(code="x"), language="javascript", style="bug")
+            return server, exc_info.value
+
+    server, error = asyncio.run(scenario())
+
+    assert error.status_code == 400
+    assert len(server.requests) == 1
+
+
+def test_client_reads_retry_after_header_on_overload():
+    async def scenario():
+        responses = [(529, {"error": "overloaded"}, {"retry-after": "0.2"})]
+        async with FakeClaudeServer(responses) as server:
+            client = _client(server.url, max_attempts=2)
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            payload = await client.acreate_review(ReviewRequest(code="x"), language="javascript", style="bug")
+            return server, payload, loop.time() - started
+
+    server, payload, elapsed = asyncio.run(scenario())
+
+    assert payload["summary"] == "Remote review summary"
+    assert len(server.requests) == 2
+    assert elapsed >= 0.2
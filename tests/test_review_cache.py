@@ -0,0 +1,92 @@
+from codereview_agent.review.models import ReviewMetrics
+from codereview_agent.review.schemas import ReviewRequest, ReviewResponse
+from codereview_agent.review.service import ReviewService
+from codereview_agent.review.service.review_cache import ReviewCache, build_cache_key
+
+
+class CountingClient:
+    model_name = "claude-3-haiku-20240307"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def create_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+        self.calls += 1
+        return {"summary": "ok", "suggestions": [], "metrics": {"model": self.model_name}}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _response(code: str = "x") -> ReviewResponse:
+    return ReviewResponse(
+        session_id="s",
+        original_code=code,
+        current_code=code,
+        summary="ok",
+        suggestions=[],
+        metrics=ReviewMetrics(processing_time_ms=1, model="m"),
+    )
+
+
+def _key(code: str, **overrides) -> str:
+    fields = {"code": code, "language": "javascript", "style": "bug", "model": "m", "prompt_version": "v1"}
+    fields.update(overrides)
+    return build_cache_key(**fields)
+
+
+def test_cache_key_changes_with_every_component():
+    base = _key("a")
+    assert base == _key("a")
+    assert base != _key("b")
+    assert base != _key("a", language="python")
+    assert base != _key("a", style="detail")
+    assert base != _key("a", model="other")
+    assert base != _key("a", prompt_version="v2")
+
+
+def test_cache_evicts_least_recently_used_entry():
+    cache = ReviewCache(max_entries=2)
+    cache.put("a", _response("a"))
+    cache.put("b", _response("b"))
+    assert cache.get("a") is not None
+    cache.put("c", _response("c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_enforces_byte_budget_and_ttl():
+    clock = FakeClock()
+    entry_size = len(_response("a").model_dump_json())
+    cache = ReviewCache(max_entries=10, max_bytes=entry_size * 2, ttl_seconds=5, clock=clock)
+    for key in ("a", "b", "c"):
+        cache.put(key, _response(key))
+    assert cache.stats()["entries"] == 2
+
+    clock.now = 6
+    assert cache.get("c") is None
+    stats = cache.stats()
+    assert stats["expirations"] == 1
+    assert stats["misses"] == 1
+
+
+def test_service_serves_repeated_requests_from_cache():
+    client = CountingClient()
+    service = ReviewService(review_client=client, cache=ReviewCache())
+    request = ReviewRequest(code="const a = 1;", style="bug")
+
+    first = service.generate_review(request)
+    second = service.generate_review(request)
+
+    assert client.calls == 1
+    assert second.session_id != first.session_id
+    assert second.metrics.cached is True
+    assert first.metrics.cached is False
+    assert service.cache.stats()["hits"] == 1
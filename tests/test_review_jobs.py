@@ -0,0 +1,198 @@
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from codereview_agent.app.main import codeReviewAgent
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service import ReviewService
+from codereview_agent.review.service.claude_client import ClaudeReviewError
+from codereview_agent.review.service.job_queue import (
+    CANCELLED,
+    FAILED,
+    JobStore,
+    ReviewJobQueue,
+    ReviewJobWorkerPool,
+    SUCCEEDED,
+)
+
+
+class GatedClient:
+    model_name = "claude-3-haiku-20240307"
+
+    def __init__(self) -> None:
+        self.gate = threading.Event()
+        self.gate.set()
+        self.seen = []
+
+    def create_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+        self.gate.wait(5)
+        self.seen.append(code)
+        if code.startswith("broken"):
+            raise ClaudeReviewError("네트워크 오류")
+        return {"summary": f"review of {code}", "suggestions": [], "metrics": {"model": self.model_name}}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_store_claims_by_priority_then_age_and_survives_reopen(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    clock = FakeClock()
+    store = JobStore(path, clock=clock, lease_seconds=30)
+    low = store.enqueue({"code": "low"}, priority=0)
+    high = store.enqueue({"code": "high"}, priority=5)
+    older = store.enqueue({"code": "older"}, priority=5)
+
+    assert store.claim_next("worker-a").id == high.id
+    store.close()
+
+    reopened = JobStore(path, clock=clock, lease_seconds=30)
+    clock.now += 31
+    assert reopened.requeue_expired() == 1
+    assert [reopened.claim_next().id for _ in range(3)] == [high.id, older.id, low.id]
+    assert reopened.claim_next() is None
+
+
+def test_live_leases_are_not_requeued_and_stale_owners_cannot_finish(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    clock = FakeClock()
+    first = JobStore(path, clock=clock, lease_seconds=30)
+    second = JobStore(path, clock=clock, lease_seconds=30)
+    job = first.enqueue({"code": "x"})
+    first.claim_next("worker-a")
+
+    clock.now += 20
+    assert second.requeue_expired() == 0
+    assert first.renew_lease(job.id, "worker-a") is True
+    clock.now += 20
+    assert second.requeue_expired() == 0
+
+    clock.now += 31
+    assert second.requeue_expired() == 1
+    assert second.claim_next("worker-b").id == job.id
+    assert first.renew_lease(job.id, "worker-a") is False
+    assert first.complete(job.id, {"summary": "stale"}, owner="worker-a") is False
+    assert second.complete(job.id, {"summary": "fresh"}, owner="worker-b") is True
+    assert first.get(job.id).result == {"summary": "fresh"}
+
+
+def test_pool_start_keeps_jobs_running_elsewhere(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    store = JobStore(path)
+    job = store.enqueue(ReviewRequest(code="fine();", style="bug").model_dump())
+    store.claim_next("other-process")
+    client_stub = GatedClient()
+    pool = ReviewJobWorkerPool(ReviewService(review_client=client_stub), JobStore(path), poll_interval=0.05)
+
+    pool.start()
+    try:
+        assert pool.run_once() is False
+    finally:
+        pool.stop(timeout=5)
+
+    assert store.get(job.id).status == "running"
+    assert client_stub.seen == []
+
+
+def test_heartbeat_keeps_a_slow_job_leased(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    client_stub = GatedClient()
+    client_stub.gate.clear()
+    pool = ReviewJobWorkerPool(ReviewService(review_client=client_stub), JobStore(path, lease_seconds=1))
+    other = JobStore(path, lease_seconds=1)
+    job = other.enqueue(ReviewRequest(code="slow();", style="bug").model_dump())
+
+    worker = threading.Thread(target=pool.run_once)
+    worker.start()
+    try:
+        time.sleep(1.5)
+        assert other.requeue_expired() == 0
+    finally:
+        client_stub.gate.set()
+        worker.join(5)
+
+    assert other.get(job.id).status == SUCCEEDED
+
+
+def test_job_cancelled_after_claim_skips_upstream(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    client_stub = GatedClient()
+    pool = ReviewJobWorkerPool(ReviewService(review_client=client_stub), store)
+    job = store.enqueue(ReviewRequest(code="fine();", style="bug").model_dump())
+    claim = store.claim_next
+
+    def claim_then_cancel(owner: str = ""):
+        claimed = claim(owner)
+        store.cancel(claimed.id)
+        return claimed
+
+    store.claim_next = claim_then_cancel
+
+    assert pool.run_once() is True
+    assert client_stub.seen == []
+    assert store.get(job.id).status == CANCELLED
+
+
+def test_cancelled_job_discards_late_result(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    job = store.enqueue({"code": "x"})
+    store.claim_next()
+
+    assert store.cancel(job.id) is True
+    assert store.complete(job.id, {"summary": "late"}) is False
+    assert store.get(job.id).status == CANCELLED
+
+
+def test_worker_pool_records_success_and_failure(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    pool = ReviewJobWorkerPool(ReviewService(review_client=GatedClient()), store)
+    ok = store.enqueue(ReviewRequest(code="fine();", style="bug").model_dump())
+    bad = store.enqueue(ReviewRequest(code="broken();", style="bug").model_dump())
+
+    while pool.run_once():
+        pass
+
+    assert store.get(ok.id).status == SUCCEEDED
+    assert store.get(ok.id).result["summary"] == "review of fine();"
+    failed = store.get(bad.id)
+    assert failed.status == FAILED
+    assert failed.error["code"] == 503
+
+
+def test_job_api_submit_long_poll_and_cancel(monkeypatch, tmp_path):
+    client_stub = GatedClient()
+    service = ReviewService(review_client=client_stub)
+    jobs = ReviewJobQueue(service, path=str(tmp_path / "jobs.sqlite3"), workers=1, poll_interval=0.05)
+    monkeypatch.setattr("codereview_agent.review.api.review_router.review_jobs", jobs)
+
+    client = TestClient(codeReviewAgent)
+    try:
+        submitted = client.post("/api/review-jobs", json={"code": "fine();", "style": "bug", "priority": 3})
+        assert submitted.status_code == 202
+        job_id = submitted.json()["data"]["jobId"]
+
+        finished = client.get(f"/api/review-jobs/{job_id}", params={"wait": 5}).json()["data"]
+        assert finished["status"] == SUCCEEDED
+        assert finished["priority"] == 3
+        assert finished["result"]["summary"] == "review of fine();"
+
+        client_stub.gate.clear()
+        blocker = client.post("/api/review-jobs", json={"code": "slow();"}).json()["data"]["jobId"]
+        queued = client.post("/api/review-jobs", json={"code": "queued();"}).json()["data"]["jobId"]
+        cancelled = client.delete(f"/api/review-jobs/{queued}")
+        assert cancelled.json()["data"]["status"] == CANCELLED
+        assert client.delete(f"/api/review-jobs/{queued}").status_code == 400
+        client_stub.gate.set()
+
+        assert client.get(f"/api/review-jobs/{blocker}", params={"wait": 5}).json()["data"]["status"] == SUCCEEDED
+        assert "queued();" not in client_stub.seen
+        assert client.get("/api/review-jobs/missing").status_code == 404
+    finally:
+        client_stub.gate.set()
+        jobs.close()
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -130,8 +132,10 @@ def test_generate_review_truncates_code_for_remote_payload():
 
     service.generate_review(request)
 
-    assert len(service._review_client.last_code) == 500
-    assert service._review_client.last_code == long_code[:500]
+    sent = service._review_client.last_code
+    assert len(sent) <= 500
+    assert sent.startswith("function main() {\nconst value = 1;\n")
+    assert "lines omitted) ..." in sent
 
 
 def test_api_route_accepts_multiline_code_payload(monkeypatch):
@@ -324,3 +328,29 @@ def test_review_request_normalizes_style_and_language():
 
     assert request.style == "bug"
     assert request.language == "Python"
+
+
+def test_agenerate_review_falls_back_to_thread_for_sync_clients():
+    client = RecordingClaudeClient()
+    service = ReviewService(review_client=client)
+    request = ReviewRequest(code="function sum(a, b) {\n  return a + b;\n}\n", style="bug")
+
+    data = asyncio.run(service.agenerate_review(request))
+
+    assert data.summary == "Remote review summary"
+    assert client.calls[0]["style"] == "bug"
+
+
+def test_agenerate_review_failure_raises_service_unavailable():
+    class AsyncFailingClient:
+        model_name = "claude-3-haiku-20240307"
+
+        async def acreate_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+            raise ClaudeReviewError("네트워크 오류")
+
+    service = ReviewService(review_client=AsyncFailingClient())
+    request = ReviewRequest(code="if (a == b) {}", style="bug")
+
+    with pytest.raises(CustomInternalServerException) as exc_info:
+        asyncio.run(service.agenerate_review(request))
+    assert exc_info.value.code is ErrorCode.SERVICE_UNAVAILABLE
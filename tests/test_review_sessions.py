@@ -0,0 +1,163 @@
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from codereview_agent.app.main import codeReviewAgent
+from codereview_agent.common import CustomInternalServerException, ErrorCode
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service import ReviewService, ReviewSessionStore
+from codereview_agent.review.service.incremental_review import plan_incremental_review
+from codereview_agent.review.service.review_cache import ReviewCache
+from codereview_agent.review.service.unified_diff import PatchError, apply_unified_diff, parse_unified_diff
+
+BASE = "\n".join(f"const v{index} = {index};" for index in range(1, 21)) + "\nconsole.log(v1);"
+
+
+class WindowClient:
+    """Flags ``console.log`` lines of the exact code it receives and records every call."""
+
+    model_name = "claude-3-haiku-20240307"
+
+    def __init__(self) -> None:
+        self.codes = []
+
+    async def acreate_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+        self.codes.append(code)
+        suggestions = [
+            {
+                "title": "console.log 제거",
+                "rationale": "디버그 출력",
+                "severity": "low",
+                "tags": [],
+                "range": {"startLine": number, "startCol": 1, "endLine": number, "endCol": len(line) + 1},
+                "fix": {"type": "unified-diff", "diff": f"@@ -{number} +{number} @@\n-{line}"},
+                "fixSnippet": "",
+                "confidence": 0.9,
+            }
+            for number, line in enumerate(code.split("\n"), start=1)
+            if "console.log" in line
+        ]
+        return {"summary": f"review #{len(self.codes)}", "suggestions": suggestions}
+
+    def create_review(self, request, *, language: str, style: str, code: str):
+        return asyncio.run(self.acreate_review(request, language=language, style=style, code=code))
+
+
+def _service(client) -> ReviewService:
+    return ReviewService(review_client=client, cache=ReviewCache(), sessions=ReviewSessionStore())
+
+
+def test_parse_and_apply_unified_diff():
+    diff = "--- a/x.js\n+++ b/x.js\n@@ -1,3 +1,3 @@\n a\n-b\n+B\n c\n@@ -5,0 +6,1 @@\n+f\n"
+    hunks = parse_unified_diff(diff)
+
+    assert [(hunk.old_start, hunk.new_start) for hunk in hunks] == [(1, 1), (5, 6)]
+    assert apply_unified_diff("a\nb\nc\nd\ne", hunks) == "a\nB\nc\nd\ne\nf"
+    assert hunks[0].new_lines() == [(1, "a", False), (2, "B", True), (3, "c", False)]
+    with pytest.raises(PatchError):
+        apply_unified_diff("a\nx\nc", hunks)
+    with pytest.raises(PatchError):
+        parse_unified_diff("not a diff")
+
+
+def test_plan_widens_changed_lines_into_merged_windows():
+    old = "\n".join(f"line {index}" for index in range(1, 31))
+    new = old.replace("line 10", "line ten").replace("line 2\n", "line 2\ninserted\n")
+    plan = plan_incremental_review(old, new, context_lines=1)
+
+    assert [(window.start_line, window.end_line) for window in plan.windows] == [(2, 4), (10, 12)]
+    assert plan.line_map[25] == 26
+    assert 10 not in plan.line_map
+    assert plan.changed_lines == 2
+
+
+def test_update_reviews_only_changed_region_and_shifts_existing_suggestions():
+    client = WindowClient()
+    service = _service(client)
+    edited = "// header\n" + BASE.replace("const v12 = 12;", "console.log(v12);")
+
+    async def scenario():
+        first = await service.agenerate_review(ReviewRequest(code=BASE, language="javascript", style="bug"))
+        updated = await service.aupdate_review(first.session_id, code=edited)
+        return first, updated
+
+    first, updated = asyncio.run(scenario())
+
+    assert [suggestion.range.start_line for suggestion in first.suggestions] == [21]
+    assert updated.session_id == first.session_id
+    assert updated.original_code == BASE
+    assert updated.current_code == edited
+    # Two windows: the inserted header and the edited line, each with three lines of context.
+    assert client.codes[1:] == [
+        "\n".join(edited.split("\n")[0:4]),
+        "\n".join(edited.split("\n")[9:16]),
+    ]
+    assert updated.metrics.reviewed_lines == 11
+    carried, fresh = sorted(updated.suggestions, key=lambda item: item.range.start_line)[::-1]
+    assert fresh.range.start_line == 13
+    assert carried.range.start_line == 22
+    assert carried.id == first.suggestions[0].id
+    assert carried.fix.diff.startswith("@@ -22 +22 @@")
+
+
+def test_large_edits_fall_back_to_a_full_review_and_bad_diffs_are_rejected():
+    client = WindowClient()
+    service = _service(client)
+
+    async def scenario():
+        first = await service.agenerate_review(ReviewRequest(code="a();\nb();", style="bug"))
+        updated = await service.aupdate_review(first.session_id, diff="@@ -1 +1 @@\n-a();\n+console.log(a);")
+        with pytest.raises(CustomInternalServerException) as excinfo:
+            await service.aupdate_review(first.session_id, diff="@@ -1 +1 @@\n-a();\n+c();")
+        missing = await service.aupdate_review("missing", code="x")
+        return updated, excinfo.value, missing
+
+    updated, error, missing = asyncio.run(scenario())
+
+    assert client.codes[-1] == "console.log(a);\nb();"
+    assert updated.metrics.reviewed_lines == 2
+    assert [suggestion.range.start_line for suggestion in updated.suggestions] == [1]
+    assert error.code is ErrorCode.INVALID_ARGUMENT
+    assert missing is None
+
+
+def test_patch_endpoint_continues_session(monkeypatch):
+    service = _service(WindowClient())
+    monkeypatch.setattr("codereview_agent.review.api.review_router.review_service", service)
+    client = TestClient(codeReviewAgent)
+
+    created = client.post("/api/reviews", json={"code": BASE, "language": "javascript", "style": "bug"})
+    session_id = created.json()["data"]["sessionId"]
+    patched = client.patch(
+        f"/api/reviews/{session_id}",
+        json={"diff": "@@ -3 +3 @@\n-const v3 = 3;\n+const v3 = 30;"},
+    )
+
+    assert patched.status_code == 200
+    data = patched.json()["data"]
+    assert data["sessionId"] == session_id
+    assert "const v3 = 30;" in data["currentCode"]
+    assert data["metrics"]["reviewedLines"] == 6
+    assert client.patch("/api/reviews/unknown", json={"code": "x"}).status_code == 404
+    assert client.patch(f"/api/reviews/{session_id}", json={"code": "x", "diff": "y"}).status_code in (400, 422)
+
+
+def test_every_returned_session_id_can_be_continued(monkeypatch):
+    service = _service(WindowClient())
+    monkeypatch.setattr("codereview_agent.review.api.review_router.review_service", service)
+    client = TestClient(codeReviewAgent)
+    edit = {"diff": "@@ -3 +3 @@\n-const v3 = 3;\n+const v3 = 30;"}
+
+    batch = client.post(
+        "/api/reviews/batch",
+        json={"items": [{"id": name, "code": BASE, "language": "javascript", "style": "bug"} for name in "ab"]},
+    )
+    session_ids = [line["data"]["sessionId"] for line in map(json.loads, batch.text.strip().splitlines())]
+    sync = service.generate_review(ReviewRequest(code=BASE, language="javascript", style="bug"))
+    session_ids.append(sync.session_id)
+
+    assert len(set(session_ids)) == 3
+    for session_id in session_ids:
+        assert client.patch(f"/api/reviews/{session_id}", json=edit).status_code == 200
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from codereview_agent.common import CustomInternalServerException
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service import ReviewService
+from codereview_agent.review.service.claude_client import ClaudeReviewError
+from codereview_agent.review.service.single_flight import SingleFlight
+
+
+class SlowAsyncClient:
+    model_name = "claude-3-haiku-20240307"
+
+    def __init__(self, *, fail: bool = False) -> None:
+        self.calls = 0
+        self.fail = fail
+
+    async def acreate_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        if self.fail:
+            raise ClaudeReviewError("네트워크 오류")
+        return {"summary": "ok", "suggestions": [], "metrics": {"model": self.model_name}}
+
+
+def test_identical_concurrent_requests_share_one_upstream_call():
+    client = SlowAsyncClient()
+    service = ReviewService(review_client=client)
+    request = ReviewRequest(code="const a = 1;", style="bug")
+
+    async def scenario():
+        return await asyncio.gather(*(service.agenerate_review(request) for _ in range(5)))
+
+    responses = asyncio.run(scenario())
+
+    assert client.calls == 1
+    assert len({response.session_id for response in responses}) == 5
+    assert service.stats()["singleFlight"]["coalesced"] == 4
+
+
+def test_followers_receive_leader_error():
+    client = SlowAsyncClient(fail=True)
+    service = ReviewService(review_client=client)
+    request = ReviewRequest(code="const a = 1;", style="bug")
+
+    async def scenario():
+        return await asyncio.gather(
+            *(service.agenerate_review(request) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(scenario())
+
+    assert client.calls == 1
+    assert all(isinstance(result, CustomInternalServerException) for result in results)
+
+
+def test_cancelled_leader_does_not_abort_followers():
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def scenario():
+        leader = asyncio.ensure_future(flight.run("k", work))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.run("k", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(scenario()) == "done"
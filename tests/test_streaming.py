@@ -0,0 +1,215 @@
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from codereview_agent.app.main import codeReviewAgent
+from codereview_agent.review.schemas import ReviewRequest
+from codereview_agent.review.service import ReviewService
+from codereview_agent.review.service.stream_parser import SuggestionStreamParser
+from tests.test_claude_client import _client
+
+
+def _suggestion(index: int) -> dict:
+    return {
+        "id": f"stub-{index}",
+        "title": f"Suggestion {index}",
+        "rationale": "Example remote rationale",
+        "severity": "minor",
+        "tags": ["remote"],
+        "range": {"startLine": index, "startCol": 1, "endLine": index, "endCol": 2},
+        "fix": {"type": "unified-diff", "diff": "--- a\n+++ b"},
+        "fixSnippet": "updated(\"}\");",
+        "confidence": 0.8,
+        "status": "pending",
+    }
+
+
+REVIEW_TEXT = json.dumps(
+    {
+        "summary": "Streamed summary",
+        "suggestions": [_suggestion(1), _suggestion(2)],
+        "metrics": {"model": "claude-3-haiku-20240307"},
+    }
+)
+
+
+def _pieces(text: str, size: int = 7):
+    return [text[index : index + size] for index in range(0, len(text), size)]
+
+
+class FakeSseServer:
+    """Serves one chunked ``text/event-stream`` response per connection."""
+
+    def __init__(self, text: str, *, status: int = 200) -> None:
+        self.text = text
+        self.status = status
+        self.requests = []
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def __aenter__(self) -> "FakeSseServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer) -> None:
+        try:
+            await reader.readline()
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode("latin-1").strip()
+                if not line:
+                    break
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get("content-length", "0")))
+            self.requests.append({"headers": headers, "body": json.loads(body)})
+
+            writer.write(
+                (
+                    f"HTTP/1.1 {self.status} OK\r\n"
+                    "Content-Type: text/event-stream\r\n"
+                    "Transfer-Encoding: chunked\r\n\r\n"
+                ).encode("latin-1")
+            )
+            for event in self._events():
+                raw = event.encode("utf-8")
+                writer.write(f"{len(raw):x}\r\n".encode("latin-1") + raw + b"\r\n")
+                await writer.drain()
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _events(self):
+        start = {"type": "message_start", "message": {"usage": {"input_tokens": 50, "cache_read_input_tokens": 700}}}
+        yield f"event: message_start\ndata: {json.dumps(start)}\n\n"
+        for piece in _pieces(self.text):
+            delta = {"type": "content_block_delta", "delta": {"type": "text_delta", "text": piece}}
+            yield f"event: content_block_delta\ndata: {json.dumps(delta)}\n\n"
+        yield 'event: message_delta\ndata: {"type": "message_delta", "usage": {"output_tokens": 33}}\n\n'
+        yield 'event: message_stop\ndata: {"type": "message_stop"}\n\n'
+
+
+class StreamingClient:
+    model_name = "claude-3-haiku-20240307"
+
+    def __init__(self) -> None:
+        self.streamed = 0
+
+    async def astream_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+        for index in (1, 2):
+            self.streamed += 1
+            yield {"type": "suggestion", "suggestion": _suggestion(index)}
+        yield {"type": "complete", "payload": json.loads(REVIEW_TEXT)}
+
+
+class SyncOnlyClient:
+    model_name = "claude-3-haiku-20240307"
+
+    def create_review(self, request, *, language: str, style: str, code: str):  # noqa: ARG002
+        return {"summary": "sync", "suggestions": [_suggestion(3)], "metrics": {"model": self.model_name}}
+
+
+def _parse_sse(text: str):
+    events = []
+    for block in text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_parser_emits_each_suggestion_once_it_closes():
+    parser = SuggestionStreamParser()
+    completed = []
+    for piece in _pieces("```json\n" + REVIEW_TEXT + "\n```", size=3):
+        completed.extend(parser.feed(piece))
+
+    assert [item["id"] for item in completed] == ["stub-1", "stub-2"]
+    assert completed[0]["fixSnippet"] == 'updated("}");'
+
+
+def test_parser_ignores_objects_outside_suggestions_array():
+    parser = SuggestionStreamParser()
+    completed = parser.feed('{"metrics": {"model": "x"}, "other": [{"id": 1}], "suggestions": [')
+
+    assert completed == []
+    assert parser.feed('{"id": "a"}]}') == [{"id": "a"}]
+
+
+def test_client_astream_review_yields_suggestions_then_complete():
+    async def scenario():
+        async with FakeSseServer(REVIEW_TEXT) as server:
+            client = _client(server.url)
+            request = ReviewRequest(code="const a = 1;", style="bug")
+            events = [event async for event in client.astream_review(request, language="javascript", style="bug")]
+            await client.aclose()
+            return server, events
+
+    server, events = asyncio.run(scenario())
+
+    assert server.requests[0]["body"]["stream"] is True
+    assert [event["type"] for event in events] == ["suggestion", "suggestion", "complete"]
+    assert events[1]["suggestion"]["id"] == "stub-2"
+    assert events[-1]["payload"]["summary"] == "Streamed summary"
+    assert events[-1]["payload"]["usage"] == {
+        "input_tokens": 50,
+        "output_tokens": 33,
+        "cache_read_input_tokens": 700,
+    }
+
+
+def test_service_stream_keeps_streamed_ids_and_warms_cache():
+    client = StreamingClient()
+    service = ReviewService(review_client=client)
+    request = ReviewRequest(code="const a = 1;", style="bug")
+
+    async def scenario():
+        first = [event async for event in service.astream_review(request)]
+        second = [event async for event in service.astream_review(request)]
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert [name for name, _ in first] == ["suggestion", "suggestion", "complete"]
+    complete = first[-1][1]
+    assert [suggestion.id for suggestion in complete.suggestions] == [first[0][1].id, first[1][1].id]
+    assert second[-1][1].metrics.cached is True
+    assert client.streamed == 2
+
+
+def test_api_stream_route_emits_sse_events(monkeypatch):
+    service = ReviewService(review_client=StreamingClient())
+    monkeypatch.setattr("codereview_agent.review.api.review_router.review_service", service)
+
+    client = TestClient(codeReviewAgent)
+    response = client.post("/api/reviews/stream", json={"code": "const a = 1;", "style": "bug"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _parse_sse(response.text)
+    assert [name for name, _ in events] == ["suggestion", "suggestion", "complete"]
+    assert events[0][1]["title"] == "Suggestion 1"
+    assert events[-1][1]["summary"] == "Streamed summary"
+
+
+def test_api_stream_route_replays_sync_clients(monkeypatch):
+    service = ReviewService(review_client=SyncOnlyClient())
+    monkeypatch.setattr("codereview_agent.review.api.review_router.review_service", service)
+
+    client = TestClient(codeReviewAgent)
+    response = client.post("/api/reviews/stream", json={"code": "const a = 1;", "style": "bug"})
+
+    events = _parse_sse(response.text)
+    assert [name for name, _ in events] == ["suggestion", "complete"]
+    assert events[-1][1]["summary"] == "sync"